@@ -0,0 +1,191 @@
+"""Off-hot-path request logging: enqueue in the request, store in background."""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from types import TracebackType
+from typing import Literal, Self
+
+from src.module_01_fondations.memory_leak_demo import (
+    BoundedRequestLogger,
+    RequestLog,
+    RequestLogger,
+)
+
+OverflowPolicy = Literal["drop", "block"]
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRequestLogger:
+    """Non-blocking front end of a request logger.
+
+    log() only appends a raw tuple to a deque (append is atomic under the GIL,
+    no lock is taken), so it costs a few hundred nanoseconds in the request
+    path. A background thread drains the queue in batches, stores records in
+    the wrapped logger and optionally persists each batch.
+
+    When the queue is full, logs are either dropped (and counted) or the
+    caller blocks until the background thread makes room. Errors raised by
+    the wrapped logger or persist are logged and counted, and never stop the
+    background thread. Logging after close() raises RuntimeError.
+    """
+
+    def __init__(
+            self,
+            logger: RequestLogger,
+            max_queue_size: int = 10_000,
+            overflow: OverflowPolicy = "drop",
+            batch_size: int = 1000,
+            flush_interval: float = 0.01,
+            persist: Callable[[list[RequestLog]], None] | None = None,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be > 0")
+        self._logger = logger
+        self._max_queue_size = max_queue_size
+        self._overflow = overflow
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._persist = persist
+        self._queue: deque[tuple[int, str, str] | threading.Event] = deque()
+        self._not_full = threading.Event()
+        self._closed = False
+        self.dropped_count = 0
+        self.error_count = 0
+        self._worker = threading.Thread(
+            target=self._run, name="async-request-logger", daemon=True
+        )
+        self._worker.start()
+
+    def log(self, request_id: int, path: str, payload: str) -> None:
+        """Enqueue a request log without blocking (unless overflow="block")."""
+        if self._closed:
+            raise RuntimeError("AsyncRequestLogger is closed")
+        if len(self._queue) >= self._max_queue_size:
+            if self._overflow == "block":
+                self._wait_not_full()
+            if len(self._queue) >= self._max_queue_size:
+                # Drop policy, or nothing left to make room: never block forever
+                self.dropped_count += 1
+                return
+        self._queue.append((request_id, path, payload))
+
+    def _wait_not_full(self) -> None:
+        while (
+                len(self._queue) >= self._max_queue_size
+                and not self._closed
+                and self._worker.is_alive()
+        ):
+            self._not_full.clear()
+            self._not_full.wait(self._flush_interval)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until logs enqueued so far are stored. Return False on timeout."""
+        if not self._worker.is_alive():
+            return not self._queue
+        marker = threading.Event()
+        self._queue.append(marker)
+        return marker.wait(timeout)
+
+    def close(self) -> None:
+        """Store pending logs and stop the background thread."""
+        self._closed = True
+        self._worker.join()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                closed = self._closed
+                self._drain()
+                if closed:
+                    return
+                time.sleep(self._flush_interval)
+        finally:
+            # Wake blocked callers, which then see the worker is gone
+            self._not_full.set()
+
+    def _drain(self) -> None:
+        while self._queue:
+            batch: list[RequestLog] = []
+            while self._queue and len(batch) < self._batch_size:
+                item = self._queue.popleft()
+                if isinstance(item, threading.Event):
+                    self._store(batch)
+                    batch = []
+                    item.set()
+                    continue
+                try:
+                    self._logger.log(*item)
+                except Exception:
+                    self.error_count += 1
+                    logger.exception("Request log storage failed")
+                    continue
+                if self._persist is not None:
+                    batch.append(RequestLog(*item))
+            self._store(batch)
+            self._not_full.set()
+
+    def _store(self, batch: list[RequestLog]) -> None:
+        if self._persist is None or not batch:
+            return
+        try:
+            self._persist(batch)
+        except Exception:
+            self.error_count += 1
+            logger.exception("Persisting %d request logs failed", len(batch))
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    @property
+    def log_count(self) -> int:
+        return self._logger.log_count
+
+    @property
+    def memory_usage(self) -> float:
+        return self._logger.memory_usage
+
+
+def measure_log_latency(logger: RequestLogger, count: int = 100_000) -> float:
+    """Return the mean latency of logger.log() in nanoseconds."""
+    payload = "x" * 1000
+    start = time.perf_counter_ns()
+    for i in range(count):
+        logger.log(i, "/api/users", payload)
+    return (time.perf_counter_ns() - start) / count
+
+
+if __name__ == "__main__":
+    count = 100_000
+    sync_latency = measure_log_latency(BoundedRequestLogger(), count)
+    print(f"BoundedRequestLogger.log: {sync_latency:.0f}ns per call")
+
+    with AsyncRequestLogger(
+            BoundedRequestLogger(), max_queue_size=count
+    ) as async_logger:
+        async_latency = measure_log_latency(async_logger, count)
+        async_logger.flush()
+        print(f"AsyncRequestLogger.log:   {async_latency:.0f}ns per call")
+        print(
+            f"Stored {async_logger.log_count:,} logs, "
+            f"dropped {async_logger.dropped_count:,}"
+        )
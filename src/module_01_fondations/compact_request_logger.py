@@ -0,0 +1,168 @@
+"""Structure-of-arrays request log storage: no Python object per log."""
+
+import sys
+from array import array
+from collections.abc import Iterator
+
+from src.module_01_fondations.memory_leak_demo import (
+    BoundedRequestLogger,
+    RequestLog,
+)
+
+
+class RequestLogView:
+    """Lightweight read-only view of a log stored in a CompactRequestLogger.
+
+    Fields are decoded on access. A view is only valid until its log is
+    rotated out of the logger.
+    """
+
+    __slots__ = ("_logs", "_slot")
+
+    def __init__(self, logs: "CompactRequestLogger", slot: int) -> None:
+        self._logs = logs
+        self._slot = slot
+
+    @property
+    def request_id(self) -> int:
+        return self._logs._ids[self._slot]
+
+    @property
+    def path(self) -> str:
+        start = self._logs._offset(self._slot)
+        end = start + self._logs._path_lengths[self._slot]
+        return self._logs._data[start:end].decode()
+
+    @property
+    def payload(self) -> str:
+        start = self._logs._offset(self._slot) + self._logs._path_lengths[self._slot]
+        end = start + self._logs._payload_lengths[self._slot]
+        return self._logs._data[start:end].decode()
+
+    def to_request_log(self) -> RequestLog:
+        return RequestLog(self.request_id, self.path, self.payload)
+
+    def __repr__(self) -> str:
+        return f"RequestLogView(request_id={self.request_id}, path={self.path!r})"
+
+
+class CompactRequestLogger:
+    """A bounded logger storing logs as a structure of arrays.
+
+    A RequestLog instance costs an object header, a __dict__ and boxed fields:
+    at millions of logs, this overhead is larger than the data. Here, request
+    ids are stored in an array('q'), and paths and payloads are appended to a
+    shared bytearray, referenced by offset and lengths.
+
+    Slots of the arrays are reused as a ring, with the same rotation semantics
+    as BoundedRequestLogger. Since logs are evicted in insertion order, bytes
+    of evicted logs are always a prefix of the bytearray: it is trimmed once
+    this prefix is larger than live data, so trimming is amortized O(1).
+    """
+
+    def __init__(self, max_size: int = 1000) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._max_size = max_size
+        self._ids = array("q", [0]) * max_size
+        # Offsets are absolute positions in the stream of logged bytes
+        self._offsets = array("Q", [0]) * max_size
+        self._path_lengths = array("I", [0]) * max_size
+        self._payload_lengths = array("I", [0]) * max_size
+        self._data = bytearray()
+        # Absolute position of self._data[0]
+        self._base = 0
+        self._live_bytes = 0
+        self._start = 0
+        self._count = 0
+
+    def log(self, request_id: int, path: str, payload: str) -> None:
+        """Log a request and rotates logs if required."""
+        path_bytes = path.encode()
+        payload_bytes = payload.encode()
+        if self._count == self._max_size:
+            self._evict_oldest()
+
+        slot = (self._start + self._count) % self._max_size
+        self._ids[slot] = request_id
+        self._offsets[slot] = self._base + len(self._data)
+        self._path_lengths[slot] = len(path_bytes)
+        self._payload_lengths[slot] = len(payload_bytes)
+        self._data += path_bytes
+        self._data += payload_bytes
+        self._live_bytes += len(path_bytes) + len(payload_bytes)
+        self._count += 1
+        self._trim()
+
+    def _evict_oldest(self) -> None:
+        slot = self._start
+        self._live_bytes -= self._path_lengths[slot] + self._payload_lengths[slot]
+        self._start = (self._start + 1) % self._max_size
+        self._count -= 1
+
+    def _trim(self) -> None:
+        """Drop bytes of evicted logs once they outweigh live data."""
+        oldest = self._offsets[self._start]
+        garbage = oldest - self._base
+        if garbage > self._live_bytes:
+            del self._data[:garbage]
+            self._base = oldest
+
+    def _offset(self, slot: int) -> int:
+        return self._offsets[slot] - self._base
+
+    def _slot(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("log index out of range")
+        return (self._start + index) % self._max_size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> RequestLogView:
+        """Return a view of the index-th log, from oldest to newest."""
+        return RequestLogView(self, self._slot(index))
+
+    def __iter__(self) -> Iterator[RequestLogView]:
+        for index in range(self._count):
+            yield RequestLogView(self, (self._start + index) % self._max_size)
+
+    def get_memory_usage(self) -> int:
+        """Return approximate memory usage of logs in bytes."""
+        return (
+            sys.getsizeof(self._ids)
+            + sys.getsizeof(self._offsets)
+            + sys.getsizeof(self._path_lengths)
+            + sys.getsizeof(self._payload_lengths)
+            + sys.getsizeof(self._data)
+        )
+
+    @property
+    def log_count(self) -> int:
+        return self._count
+
+    @property
+    def memory_usage(self) -> float:
+        return self.get_memory_usage() / (1024 * 1024)
+
+
+if __name__ == "__main__":
+    count = 1_000_000
+    bounded_logger = BoundedRequestLogger(max_size=count)
+    compact_logger = CompactRequestLogger(max_size=count)
+
+    for i in range(count + count // 2):
+        path = f"/api/users/{i}"
+        payload = f'{{"id": {i}}}'
+        bounded_logger.log(i, path, payload)
+        compact_logger.log(i, path, payload)
+
+    print(
+        f"- Bounded logger: {bounded_logger.log_count:,} logs, ~{bounded_logger.memory_usage: .1f}MB"
+    )
+    print(
+        f"- Compact logger: {compact_logger.log_count:,} logs, ~{compact_logger.memory_usage: .1f}MB"
+    )
+    print(f"- Newest log: {compact_logger[-1].to_request_log()}")
@@ -0,0 +1,87 @@
+"""CPU executor factory aware of free-threaded Python."""
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from src.module_01_fondations.gil_benchmark import run_benchmark
+from src.module_01_fondations.gil_demo import is_gil_enabled
+
+ExecutorKind = Literal["thread", "process"]
+
+
+def select_cpu_executor_kind() -> ExecutorKind:
+    """Pick the executor kind running CPU-bound callables in parallel.
+
+    With the GIL, only processes run Python bytecode in parallel. Without it
+    (free-threaded CPython 3.13+), threads do too, without process startup
+    and argument/result pickling costs.
+    """
+    return "process" if is_gil_enabled() else "thread"
+
+
+def create_cpu_executor(
+        max_workers: int | None = None, kind: ExecutorKind | None = None
+) -> Executor:
+    """Return an executor for CPU-bound callables, checking the GIL at runtime.
+
+    Both kinds expose the same concurrent.futures submit/map API. Callables
+    and arguments must be picklable, since a process pool may be returned.
+    """
+    kind = kind or select_cpu_executor_kind()
+    max_workers = max_workers or os.cpu_count() or 1
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers)
+
+
+def find_crossover(
+        sizes: Sequence[int] = (10_000, 100_000, 1_000_000, 10_000_000),
+        workers: int | None = None,
+        repeats: int = 3,
+) -> dict[str, Any]:
+    """Benchmark threads vs processes to find where processes start winning.
+
+    The crossover is the smallest workload size from which processes are
+    faster at every larger size (None if they never are). Below it, process
+    startup and pickling outweigh parallelism. On free-threaded builds,
+    threads usually win at every size.
+    """
+    workers = workers or os.cpu_count() or 1
+    report = run_benchmark(
+        strategies=["threads", "process_pool"],
+        workers=[workers],
+        sizes=sizes,
+        repeats=repeats,
+    )
+    medians: dict[int, dict[str, float]] = {}
+    for result in report["results"]:
+        medians.setdefault(result["iterations"], {})[result["strategy"]] = result[
+            "median"
+        ]
+    crossover = None
+    for size, timing in sorted(medians.items(), reverse=True):
+        if timing["process_pool"] >= timing["threads"]:
+            break
+        crossover = size
+    return {
+        "environment": report["environment"],
+        "selected_kind": select_cpu_executor_kind(),
+        "medians": medians,
+        "crossover": crossover,
+    }
+
+
+if __name__ == "__main__":
+    print(f"GIL enabled: {is_gil_enabled()}")
+    with create_cpu_executor() as executor:
+        print(f"CPU executor: {type(executor).__name__}")
+
+    result = find_crossover()
+    for size, timing in result["medians"].items():
+        print(
+            f"{size:>12,} iterations: threads={timing['threads']:.3f}s, "
+            f"processes={timing['process_pool']:.3f}s"
+        )
+    print(f"Processes win from: {result['crossover'] or 'never'}")
@@ -1,48 +1,217 @@
 """Decorators demonstration."""
 
+import asyncio
+import cProfile
+import heapq
+import inspect
+import io
+import math
+import pstats
+import random
+import tempfile
+import threading
 import time
-from collections.abc import Callable, Generator
-from contextlib import contextmanager
+from collections import OrderedDict, deque
+from collections.abc import Callable, Generator, Hashable
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, NamedTuple, Self
+
+from src.module_01_fondations.metrics import registry
+from src.module_01_fondations.tracing import Span, tracer
 
 
 # Benchmark decorator
 def timer(func: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator that measures and prints execution time."""
+    """Decorator that records execution time in the metrics registry.
+
+    Durations go to the histogram named after the function's qualified name.
+    Calls are passed through without measuring while the registry is disabled.
+    """
+    histogram = registry.histogram(func.__qualname__)
 
     @wraps(func)
     def inner(*args: Any, **kwargs: Any) -> Any:
+        if not registry.enabled:
+            return func(*args, **kwargs)
         start = time.perf_counter()
-        value = func(*args, **kwargs)
-        print(f"[timer] {func.__name__} took {time.perf_counter() - start:.2f}s")
-        return value
+        try:
+            return func(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start)
 
     return inner
 
 
 # Retry pattern
+Jitter = Literal["none", "full", "decorrelated"]
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of the request volume.
+
+    Each first attempt deposits `ratio` tokens and each retry withdraws one:
+    retries are thus capped at ratio x requests, however many functions share
+    the budget. A backend degradation can't multiply traffic by `attempts`.
+    min_retries_per_second refills tokens over time, so that retries are still
+    possible at low traffic. Tokens are capped at max_tokens.
+    """
+
+    def __init__(
+            self,
+            ratio: float = 0.1,
+            min_retries_per_second: float = 1.0,
+            max_tokens: float = 100.0,
+    ) -> None:
+        if ratio < 0:
+            raise ValueError("[retry_budget] ratio must be >= 0")
+        if min_retries_per_second < 0:
+            raise ValueError("[retry_budget] min_retries_per_second must be >= 0")
+        if max_tokens < 1:
+            raise ValueError("[retry_budget] max_tokens must be >= 1")
+        self._ratio = ratio
+        self._min_retries_per_second = min_retries_per_second
+        self._max_tokens = max_tokens
+        self._lock = threading.Lock()
+        self._tokens = max_tokens
+        self._refilled_at = time.monotonic()
+        self.requests = 0
+        self.retries_granted = 0
+        self.retries_denied = 0
+
+    def _refill(self, tokens: float) -> None:
+        now = time.monotonic()
+        tokens += (now - self._refilled_at) * self._min_retries_per_second
+        self._refilled_at = now
+        self._tokens = min(self._max_tokens, self._tokens + tokens)
+
+    def record_request(self) -> None:
+        """Record a first attempt, depositing ratio tokens."""
+        with self._lock:
+            self.requests += 1
+            self._refill(self._ratio)
+
+    def try_acquire(self) -> bool:
+        """Withdraw a token for a retry. Return False if the budget is spent."""
+        with self._lock:
+            self._refill(0)
+            if self._tokens < 1:
+                self.retries_denied += 1
+                return False
+            self._tokens -= 1
+            self.retries_granted += 1
+            return True
+
+    def metrics(self) -> dict[str, float]:
+        with self._lock:
+            self._refill(0)
+            return {
+                "requests": self.requests,
+                "retries_granted": self.retries_granted,
+                "retries_denied": self.retries_denied,
+                "tokens": self._tokens,
+            }
+
+
 def retry(
-        attempts: int, delay: float = 0.5
+        attempts: int,
+        delay: float = 0.5,
+        *,
+        backoff: float = 1.0,
+        max_delay: float | None = None,
+        jitter: Jitter = "none",
+        max_total_time: float | None = None,
+        retry_on: tuple[type[BaseException], ...] = (Exception,),
+        budget: RetryBudget | None = None,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Retry a sync or async function on failure.
+
+    The delay before the n-th retry is delay * backoff ** (n - 1), capped at
+    max_delay, then randomized according to jitter:
+    - none: exact delay
+    - full: uniform between 0 and the delay
+    - decorrelated: uniform between delay and 3x the previous sleep (capped)
+    Jitter spreads retries of concurrent callers, so they don't hit a
+    recovering dependency all at once.
+
+    Only exceptions in retry_on are retried. Retrying stops early when the next
+    sleep would exceed max_total_time since the first attempt, or when the
+    shared retry budget is spent.
+    Coroutine functions sleep with asyncio.sleep, never blocking the loop.
+    """
     if attempts < 1:
         raise ValueError("[retry] attempts must be >= 1")
     if delay < 0:
         raise ValueError("[retry] Delay must be >= 0")
+    if backoff < 1:
+        raise ValueError("[retry] backoff must be >= 1")
+    if max_delay is not None and max_delay < delay:
+        raise ValueError("[retry] max_delay must be >= delay")
+
+    cap = max_delay if max_delay is not None else math.inf
+
+    def next_delay(attempt: int, previous: float) -> float:
+        if jitter == "decorrelated":
+            return min(cap, random.uniform(delay, max(delay, previous * 3)))
+        exponential = min(cap, delay * backoff ** (attempt - 1))
+        if jitter == "full":
+            return random.uniform(0, exponential)
+        return exponential
+
+    def can_retry(attempt: int, pause: float, started: float) -> bool:
+        if attempt >= attempts:
+            return False
+        if (
+                max_total_time is not None
+                and time.monotonic() - started + pause > max_total_time
+        ):
+            return False
+        return budget is None or budget.try_acquire()
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_inner(*args: Any, **kwargs: Any) -> Any:
+                started = time.monotonic()
+                pause = delay
+                if budget is not None:
+                    budget.record_request()
+                for attempt in range(1, attempts + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except retry_on:
+                        pause = next_delay(attempt, pause)
+                        if not can_retry(attempt, pause, started):
+                            raise
+                        print(
+                            f"[retry] {func.__name__} failed, attempt {attempt}/{attempts}"
+                        )
+                        await asyncio.sleep(pause)
+                raise RuntimeError("[retry] Unreachable: attempts validation failed")
+
+            return async_inner
+
         @wraps(func)
         def inner(*args: Any, **kwargs: Any) -> Any:
+            started = time.monotonic()
+            pause = delay
+            if budget is not None:
+                budget.record_request()
             for attempt in range(1, attempts + 1):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    if attempt >= attempts:
-                        raise e
+                except retry_on:
+                    pause = next_delay(attempt, pause)
+                    if not can_retry(attempt, pause, started):
+                        raise
                     print(
                         f"[retry] {func.__name__} failed, attempt {attempt}/{attempts}"
                     )
-                    time.sleep(delay)
+                    time.sleep(pause)
             raise RuntimeError("[retry] Unreachable: attempts validation failed")
 
         return inner
@@ -50,18 +219,512 @@ def retry(
     return decorator
 
 
+# Memoization with stampede protection
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    coalesced: int
+    size: int
+    max_size: int
+
+
+class _Flight:
+    """A call in progress, awaited by concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+
+class _LruTtlCache:
+    """LRU cache with per-entry TTL, shared by sync and async cached wrappers."""
+
+    def __init__(self, max_size: int, ttl: float | None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = self.misses = self.evictions = self.coalesced = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (found, value). Must be called with the lock held."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self.entries[key]
+            self.evictions += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.coalesced,
+                len(self.entries),
+                self.max_size,
+            )
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = self.coalesced = 0
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return args, tuple(sorted(kwargs.items()))
+
+
+def cached(
+        max_size: int = 128, ttl: float | None = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize a sync or async function with an LRU + TTL cache.
+
+    Concurrent calls with the same arguments are coalesced (single flight):
+    only the first one calls the function, the others wait for its result.
+    A cache-miss storm thus triggers one backend call per key, not N.
+    Exceptions are propagated to every waiting caller, but never cached.
+
+    Like functools.lru_cache, the wrapper exposes cache_info() (hits, misses,
+    evictions, coalesced calls) and cache_clear().
+    """
+    if max_size < 1:
+        raise ValueError("[cached] max_size must be >= 1")
+    if ttl is not None and ttl <= 0:
+        raise ValueError("[cached] ttl must be > 0")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = _LruTtlCache(max_size, ttl)
+
+        if inspect.iscoroutinefunction(func):
+            tasks: dict[Hashable, asyncio.Task[Any]] = {}
+
+            def on_done(key: Hashable, task: asyncio.Task[Any]) -> None:
+                tasks.pop(key, None)
+                if not task.cancelled() and task.exception() is None:
+                    cache.set(key, task.result())
+
+            @wraps(func)
+            async def async_inner(*args: Any, **kwargs: Any) -> Any:
+                key = _make_key(args, kwargs)
+                with cache.lock:
+                    found, value = cache.get(key)
+                    if found:
+                        return value
+                    task = tasks.get(key)
+                    if task is None:
+                        cache.misses += 1
+                        task = asyncio.ensure_future(func(*args, **kwargs))
+                        task.add_done_callback(lambda t: on_done(key, t))
+                        tasks[key] = task
+                    else:
+                        cache.coalesced += 1
+                # Shield the shared call from the cancellation of one caller
+                return await asyncio.shield(task)
+
+            async_inner.cache_info = cache.info  # type: ignore[attr-defined]
+            async_inner.cache_clear = cache.clear  # type: ignore[attr-defined]
+            return async_inner
+
+        flights: dict[Hashable, _Flight] = {}
+
+        @wraps(func)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(args, kwargs)
+            with cache.lock:
+                found, value = cache.get(key)
+                if found:
+                    return value
+                flight = flights.get(key)
+                leader = flight is None
+                if flight is None:
+                    cache.misses += 1
+                    flight = flights[key] = _Flight()
+                else:
+                    cache.coalesced += 1
+
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+
+            try:
+                flight.value = func(*args, **kwargs)
+                cache.set(key, flight.value)
+                return flight.value
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with cache.lock:
+                    del flights[key]
+                flight.done.set()
+
+        inner.cache_info = cache.info  # type: ignore[attr-defined]
+        inner.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return inner
+
+    return decorator
+
+
+# Circuit breaker
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Decorator failing fast while a dependency is unhealthy.
+
+    - closed: calls go through, outcomes of the last window_size calls are
+      recorded. Once min_calls are recorded, a failure rate reaching
+      failure_threshold opens the circuit.
+    - open: calls are rejected with CircuitOpenError, without waiting for a
+      timeout, until reset_timeout seconds have elapsed.
+    - half_open: up to half_open_max_calls trial calls go through. If they all
+      succeed the circuit closes, a single failure opens it again.
+
+    A call's outcome only counts in the state it was admitted in: calls still
+    running when the state changes are ignored, so e.g. a call admitted while
+    closed cannot close the circuit as if it were a trial call.
+
+    Only exceptions in failure_on count as failures. Other BaseExceptions,
+    like CancelledError or KeyboardInterrupt, say nothing about the
+    dependency: they count neither way, and free their trial call. A breaker instance can
+    guard several sync or async functions calling the same dependency. To
+    compose with retry, put the breaker outside: a whole retry sequence then
+    counts as one call, and no retry is attempted while the circuit is open.
+    """
+
+    def __init__(
+            self,
+            failure_threshold: float = 0.5,
+            window_size: int = 20,
+            min_calls: int = 10,
+            reset_timeout: float = 30.0,
+            half_open_max_calls: int = 1,
+            failure_on: tuple[type[BaseException], ...] = (Exception,),
+    ) -> None:
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("[circuit_breaker] failure_threshold must be in (0, 1]")
+        if not 1 <= min_calls <= window_size:
+            raise ValueError("[circuit_breaker] min_calls must be in [1, window_size]")
+        if reset_timeout < 0:
+            raise ValueError("[circuit_breaker] reset_timeout must be >= 0")
+        if half_open_max_calls < 1:
+            raise ValueError("[circuit_breaker] half_open_max_calls must be >= 1")
+        self._failure_threshold = failure_threshold
+        self._min_calls = min_calls
+        self._reset_timeout = reset_timeout
+        self._half_open_max_calls = half_open_max_calls
+        self._failure_on = failure_on
+        self._lock = threading.Lock()
+        # True for a failed call, False for a successful one
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state: CircuitState = "closed"
+        # Incremented on every state change, to spot outcomes of stale calls
+        self._generation = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self.rejected_count = 0
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        with self._lock:
+            if not self._outcomes:
+                return 0.0
+            return sum(self._outcomes) / len(self._outcomes)
+
+    def _refresh_state(self) -> None:
+        if (
+                self._state == "open"
+                and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            self._set_state("half_open")
+            self._trial_calls = self._trial_successes = 0
+
+    def _set_state(self, state: CircuitState) -> None:
+        self._state = state
+        self._generation += 1
+
+    def _open(self) -> None:
+        self._set_state("open")
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def _before_call(self) -> int:
+        """Admit a call or raise CircuitOpenError. Return the call's generation."""
+        with self._lock:
+            self._refresh_state()
+            if self._state == "open" or (
+                    self._state == "half_open"
+                    and self._trial_calls >= self._half_open_max_calls
+            ):
+                self.rejected_count += 1
+                raise CircuitOpenError("[circuit_breaker] circuit is open")
+            if self._state == "half_open":
+                self._trial_calls += 1
+            return self._generation
+
+    def _on_success(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._state == "half_open":
+                self._trial_successes += 1
+                if self._trial_successes >= self._half_open_max_calls:
+                    self._set_state("closed")
+                return
+            self._outcomes.append(False)
+
+    def _on_failure(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            if self._state == "half_open":
+                self._open()
+                return
+            self._outcomes.append(True)
+            if (
+                    len(self._outcomes) >= self._min_calls
+                    and sum(self._outcomes) / len(self._outcomes)
+                    >= self._failure_threshold
+            ):
+                self._open()
+
+    def _on_interrupted(self, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation and self._state == "half_open":
+                # Let another call try instead
+                self._trial_calls -= 1
+
+    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_inner(*args: Any, **kwargs: Any) -> Any:
+                generation = self._before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except self._failure_on:
+                    self._on_failure(generation)
+                    raise
+                except Exception:
+                    self._on_success(generation)
+                    raise
+                except BaseException:
+                    self._on_interrupted(generation)
+                    raise
+                self._on_success(generation)
+                return result
+
+            return async_inner
+
+        @wraps(func)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            generation = self._before_call()
+            try:
+                result = func(*args, **kwargs)
+            except self._failure_on:
+                self._on_failure(generation)
+                raise
+            except Exception:
+                self._on_success(generation)
+                raise
+            except BaseException:
+                self._on_interrupted(generation)
+                raise
+            self._on_success(generation)
+            return result
+
+        return inner
+
+
 # Timer context manager
 @contextmanager
-def timed_block(label: str) -> Generator[float, None, None]:
-    start = time.perf_counter()
-    try:
-        yield start
-    finally:
+def timed_block(label: str, **attributes: Any) -> Generator[Span, None, None]:
+    """Time the block as a span, recording its duration under label.
+
+    Spans opened inside the block (even in asyncio tasks it creates) are its
+    children: see tracing.tracer to export the tree as a Chrome trace.
+    """
+    with tracer.span(label, **attributes) as span:
+        try:
+            yield span
+        finally:
+            if registry.enabled:
+                registry.histogram(label).observe(
+                    (time.perf_counter_ns() - span.start_ns) / 1e9
+                )
+
+
+# Threshold-triggered profiling
+@dataclass(frozen=True)
+class Profile:
+    """cProfile statistics of a call slower than its threshold."""
+
+    label: str
+    duration: float
+    stats: pstats.Stats
+
+    def report(self, sort: str = "cumulative", limit: int = 20) -> str:
+        """Return the profile as text, like pstats.Stats.print_stats()."""
+        stream = io.StringIO()
+        self.stats.stream = stream  # type: ignore[attr-defined]
+        self.stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+class ProfileBuffer:
+    """Bounded buffer keeping the profiles of the slowest calls."""
+
+    def __init__(self, max_size: int = 10) -> None:
+        if max_size < 1:
+            raise ValueError("[profiled] max_size must be >= 1")
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._sequence = 0
+        # Min-heap: the fastest kept profile is the first to be dropped
+        self._heap: list[tuple[float, int, Profile]] = []
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._sequence += 1
+            entry = (profile.duration, self._sequence, profile)
+            if len(self._heap) < self._max_size:
+                heapq.heappush(self._heap, entry)
+            elif profile.duration > self._heap[0][0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def slowest(self) -> list[Profile]:
+        """Return kept profiles, slowest first."""
+        with self._lock:
+            return [profile for _, _, profile in sorted(self._heap, reverse=True)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._heap.clear()
+
+
+# Process-wide buffer used by profiled() by default
+slow_profiles = ProfileBuffer()
+
+# cProfile can't run nested profilers and, since Python 3.12, only one
+# profiler may be active per process: blocks entered while it is held (nested
+# or in other threads) run unprofiled
+_profiling_lock = threading.Lock()
+
+
+class ProfiledBlock:
+    """Context manager and decorator created by profiled()."""
+
+    def __init__(self, threshold: float, label: str, buffer: ProfileBuffer) -> None:
+        self._threshold = threshold
+        self._label = label
+        self._buffer = buffer
+        # Per thread, (profiler if profiled, start time) of each entered block:
+        # the same block can be nested, or entered from several threads
+        self._local = threading.local()
+
+    def _entries(self) -> list[tuple[cProfile.Profile | None, float]]:
+        entries: list[tuple[cProfile.Profile | None, float]] | None = getattr(
+            self._local, "entries", None
+        )
+        if entries is None:
+            entries = self._local.entries = []
+        return entries
+
+    def __enter__(self) -> Self:
+        profiler: cProfile.Profile | None = None
+        if _profiling_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another profiling tool is active: never fail the call
+                _profiling_lock.release()
+                profiler = None
+        self._entries().append((profiler, time.perf_counter()))
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        profiler, start = self._entries().pop()
         duration = time.perf_counter() - start
-        print(f"[timed_block] {label} took {duration:.2f}s")
+        if profiler is None:
+            return
+        profiler.disable()
+        _profiling_lock.release()
+        if duration > self._threshold:
+            stats = pstats.Stats(profiler)
+            self._buffer.add(Profile(self._label, duration, stats))
+
+    def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("[profiled] coroutine functions are not supported")
+
+        @wraps(func)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            label = self._label or func.__qualname__
+            with ProfiledBlock(self._threshold, label, self._buffer):
+                return func(*args, **kwargs)
+
+        return inner
+
+
+def profiled(
+        threshold: float, label: str = "", buffer: ProfileBuffer | None = None
+) -> ProfiledBlock:
+    """Profile a call or block with cProfile, keeping slow ones only.
+
+    Usable as a decorator (label defaults to the function's qualified name) or
+    as a context manager. Stats are kept only when the duration exceeds
+    threshold seconds, in a buffer holding the slowest profiles (slow_profiles
+    by default), so slow outliers can be diagnosed after the fact.
+    """
+    if threshold < 0:
+        raise ValueError("[profiled] threshold must be >= 0")
+    return ProfiledBlock(threshold, label, buffer or slow_profiles)
 
 
 # Test functions
+# Shared by every function calling the API: retries <= 20% of calls
+api_retry_budget = RetryBudget(ratio=0.2, min_retries_per_second=0, max_tokens=5)
+
+
 @timer
 def slow_operation(duration: float) -> str:
     """Simulate a slow operation."""
@@ -70,16 +733,59 @@ def slow_operation(duration: float) -> str:
 
 
 @timer
+@profiled(threshold=0.01)
 def compute_sum(n: int) -> int:
     """Compute sum of numbers from 0 to n."""
     return sum(range(n))
 
 
-@retry(attempts=3, delay=0.5)
+@retry(
+    attempts=3,
+    delay=0.5,
+    backoff=2,
+    max_delay=2,
+    jitter="full",
+    retry_on=(ConnectionError,),
+    budget=api_retry_budget,
+)
 def unreliable_api_call() -> str:
     """Simulate an API that fails randomly."""
-    import random
+    if random.random() < 0.7:  # 70% chance of failure
+        raise ConnectionError("API unavailable")
+    return "success"
+
+
+api_circuit_breaker = CircuitBreaker(
+    failure_threshold=0.5, window_size=10, min_calls=5, reset_timeout=1.0
+)
+
+
+@api_circuit_breaker
+@retry(attempts=2, delay=0.05, retry_on=(ConnectionError,))
+def guarded_api_call() -> str:
+    """Simulate calls to a dependency that is down, guarded by a breaker."""
+    time.sleep(0.05)  # Simulate a timeout
+    raise ConnectionError("API unavailable")
+
+
+@cached(max_size=1000, ttl=60)
+def get_exchange_rate(currency: str) -> float:
+    """Simulate a slow backend call, memoized for a minute."""
+    time.sleep(0.2)
+    return 1.0 if currency == "EUR" else 1.1
 
+
+@retry(
+    attempts=5,
+    delay=0.1,
+    backoff=2,
+    jitter="decorrelated",
+    max_total_time=2,
+    budget=api_retry_budget,
+)
+async def unreliable_async_api_call() -> str:
+    """Simulate an async API that fails randomly, without blocking the loop."""
+    await asyncio.sleep(0.05)
     if random.random() < 0.7:  # 70% chance of failure
         raise ConnectionError("API unavailable")
     return "success"
@@ -98,7 +804,40 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"API call error: {e}")
 
+    try:
+        result = asyncio.run(unreliable_async_api_call())
+        print(f"Async API call: {result}")
+    except Exception as e:
+        print(f"Async API call error: {e}")
+    print(f"Retry budget: {api_retry_budget.metrics()}")
+
+    with timed_block("guarded calls"):
+        for _ in range(20):
+            with suppress(ConnectionError, CircuitOpenError):
+                guarded_api_call()
+    print(
+        f"Circuit breaker: {api_circuit_breaker.state}, "
+        f"{api_circuit_breaker.rejected_count} calls rejected without waiting"
+    )
+
+    with timed_block("cached calls"):
+        for _ in range(100):
+            get_exchange_rate("USD")
+    print(f"Exchange rates: {get_exchange_rate.cache_info()}")  # type: ignore[attr-defined]
+
     with timed_block("data processing"):
-        time.sleep(0.3)
-        total = sum(range(1_000_000))
+        with timed_block("load"):
+            time.sleep(0.3)
+        with timed_block("compute", size=1_000_000):
+            total = sum(range(1_000_000))
     print(f"Total: {total}")
+    trace_path = Path(tempfile.gettempdir()) / "decorators_demo.trace.json"
+    tracer.export_chrome_trace(trace_path)
+    print(f"Chrome trace: {trace_path}")
+
+    for name, stats in registry.dump().items():
+        print(f"[metrics] {name}: {stats}")
+
+    for profile in slow_profiles.slowest():
+        print(f"[profiled] {profile.label} took {profile.duration:.2f}s")
+        print(profile.report(limit=5))
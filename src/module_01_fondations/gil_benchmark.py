@@ -0,0 +1,197 @@
+"""GIL benchmark suite: compare execution strategies for CPU-bound work.
+
+Run e.g. `python -m src.module_01_fondations.gil_benchmark --workers 1 2 4
+--sizes 1000000 5000000 --output results.json` and compare median/IQR.
+"""
+
+import argparse
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from src.module_01_fondations.gil_demo import is_gil_enabled, sum_of_squares
+
+# A strategy runs CPU-bound tasks (iterations of each task) with N workers
+Strategy = Callable[[list[int], int], None]
+
+
+def run_sequential(tasks: list[int], workers: int) -> None:  # noqa: ARG001
+    for iterations in tasks:
+        sum_of_squares(iterations)
+
+
+def run_threads(tasks: list[int], workers: int) -> None:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(sum_of_squares, tasks))
+
+
+def _run_share(tasks: list[int]) -> None:
+    for iterations in tasks:
+        sum_of_squares(iterations)
+
+
+def run_processes(tasks: list[int], workers: int) -> None:
+    """Bare multiprocessing.Process objects, as in gil_demo."""
+    processes = [
+        multiprocessing.Process(target=_run_share, args=(tasks[i::workers],))
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def run_process_pool(tasks: list[int], workers: int) -> None:
+    """ProcessPoolExecutor sending tasks in chunks to amortize IPC."""
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(sum_of_squares, tasks, chunksize=chunksize))
+
+
+def run_interpreters(tasks: list[int], workers: int) -> None:
+    """Sub-interpreters, each with its own GIL (Python 3.14+)."""
+    executor_class = concurrent.futures.InterpreterPoolExecutor  # type: ignore[attr-defined]
+    with executor_class(max_workers=workers) as executor:
+        list(executor.map(sum_of_squares, tasks))
+
+
+def available_strategies() -> dict[str, Strategy]:
+    strategies: dict[str, Strategy] = {
+        "sequential": run_sequential,
+        "threads": run_threads,
+        "processes": run_processes,
+        "process_pool": run_process_pool,
+    }
+    if hasattr(concurrent.futures, "InterpreterPoolExecutor"):
+        strategies["interpreters"] = run_interpreters
+    return strategies
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings of a strategy, in seconds, for a worker count and workload."""
+
+    strategy: str
+    workers: int
+    tasks: int
+    iterations: int
+    samples: list[float]
+    median: float
+    q1: float
+    q3: float
+    iqr: float
+
+
+def summarize(
+        strategy: str, workers: int, tasks: list[int], samples: list[float]
+) -> BenchmarkResult:
+    """Compute median and interquartile range of timing samples."""
+    if len(samples) > 1:
+        q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = samples[0]
+    return BenchmarkResult(
+        strategy=strategy,
+        workers=workers,
+        tasks=len(tasks),
+        iterations=sum(tasks),
+        samples=samples,
+        median=median,
+        q1=q1,
+        q3=q3,
+        iqr=q3 - q1,
+    )
+
+
+def measure(strategy: Strategy, tasks: list[int], workers: int) -> float:
+    start = time.perf_counter()
+    strategy(tasks, workers)
+    return time.perf_counter() - start
+
+
+def run_benchmark(
+        strategies: Sequence[str] | None = None,
+        workers: Sequence[int] = (1, 2, 4),
+        sizes: Sequence[int] = (1_000_000, 10_000_000),
+        tasks_per_size: int = 16,
+        repeats: int = 5,
+        warmup: int = 1,
+) -> dict[str, Any]:
+    """Run every strategy for each worker count and total workload size.
+
+    Timings include pool or process startup, a real cost of each strategy.
+    Sequential runs are measured once per size, whatever the worker count.
+    """
+    if repeats < 1:
+        raise ValueError("repeats must be >= 1")
+    available = available_strategies()
+    selected = list(strategies) if strategies is not None else list(available)
+    unknown = set(selected) - set(available)
+    if unknown:
+        raise ValueError(f"Unavailable strategies: {', '.join(sorted(unknown))}")
+
+    results = []
+    for size in sizes:
+        tasks = [size // tasks_per_size] * tasks_per_size
+        for name in selected:
+            for worker_count in [1] if name == "sequential" else workers:
+                for _ in range(warmup):
+                    measure(available[name], tasks, worker_count)
+                samples = [
+                    measure(available[name], tasks, worker_count)
+                    for _ in range(repeats)
+                ]
+                results.append(summarize(name, worker_count, tasks, samples))
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "gil_enabled": is_gil_enabled(),
+            "cpu_count": os.cpu_count(),
+            "platform": platform.platform(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--strategies", nargs="+", choices=available_strategies())
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[1_000_000, 10_000_000]
+    )
+    parser.add_argument("--tasks", type=int, default=16)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        strategies=args.strategies,
+        workers=args.workers,
+        sizes=args.sizes,
+        tasks_per_size=args.tasks,
+        repeats=args.repeats,
+        warmup=args.warmup,
+    )
+    output = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,31 @@
 """GIL demonstration: CPU-bound vs I/O-bound behavior."""
 
 import multiprocessing
+import sys
 import threading
 import time
 
 
+def is_gil_enabled() -> bool:
+    """Return False on a free-threaded build (3.13+) running without the GIL."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return check() if check is not None else True
+
+
+def sum_of_squares(iterations: int) -> int:
+    """Pure Python CPU-bound work: holds the GIL for its whole duration."""
+    total = 0
+    for i in range(iterations):
+        total += i * i
+    return total
+
+
 def cpu_bound_task(name: str, iterations: int = 50_000_000) -> None:
     """Simulate CPU-intensive work."""
     print(f"[{name}] Starting CPU work...")
     start = time.perf_counter()
 
-    total = 0
-    for i in range(iterations):
-        total += i * i
+    sum_of_squares(iterations)
 
     elapsed = time.perf_counter() - start
     print(f"[{name}] Done in {elapsed:.2f}s")
@@ -0,0 +1,217 @@
+"""In-process memory leak watchdog for long-running processes."""
+
+import gc
+import logging
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Literal, Self
+
+from src.module_01_fondations.memory_leak_demo import (
+    leaky_logger,
+    simulate_requests,
+)
+
+logger = logging.getLogger(__name__)
+
+LeakKind = Literal["allocation", "type"]
+WatchdogMode = Literal["full", "sampling"]
+
+
+@dataclass(frozen=True)
+class LeakSuspect:
+    """An allocation site or object type whose size grew on every sample."""
+
+    kind: LeakKind
+    key: str
+    first: int
+    last: int
+    samples: int
+
+    @property
+    def growth(self) -> int:
+        return self.last - self.first
+
+
+class LeakWatchdog:
+    """Periodically samples memory and reports monotonic growth.
+
+    On each sample, the watchdog records the memory allocated per source line
+    (tracemalloc) and the number of live objects per type (gc). Keys growing
+    on each of the last `window` samples are reported as leak suspects, both
+    as structured log records and through suspects().
+
+    Modes:
+    - full: tracemalloc traces every allocation, which gives allocation sites
+      but slows down allocations. Use it to diagnose a known leak.
+    - sampling: no tracemalloc, and only long-lived objects (gc generation 2)
+      are counted by type. Cheap enough to stay on in production workers.
+    """
+
+    def __init__(
+            self,
+            interval: float = 60.0,
+            window: int = 5,
+            mode: WatchdogMode = "sampling",
+            min_growth_bytes: int = 100 * 1024,
+            min_growth_count: int = 1000,
+            traceback_limit: int = 1,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self._interval = interval
+        self._window = window
+        self._mode = mode
+        self._min_growth_bytes = min_growth_bytes
+        self._min_growth_count = min_growth_count
+        self._traceback_limit = traceback_limit
+        self._allocations: deque[dict[str, int]] = deque(maxlen=window)
+        self._types: deque[dict[str, int]] = deque(maxlen=window)
+        self._suspects: dict[tuple[LeakKind, str], LeakSuspect] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        if self._thread is not None:
+            return
+        if self._mode == "full" and not tracemalloc.is_tracing():
+            tracemalloc.start(self._traceback_limit)
+            self._started_tracemalloc = True
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="leak-watchdog", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling, and tracing if the watchdog started it."""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Leak watchdog sample failed")
+
+    def check(self) -> list[LeakSuspect]:
+        """Take a sample now and return the current leak suspects."""
+        allocations = self._sample_allocations()
+        types = self._sample_types()
+        with self._lock:
+            if allocations is not None:
+                self._allocations.append(allocations)
+            self._types.append(types)
+            suspects = self._find_growing(
+                "allocation", self._allocations, self._min_growth_bytes
+            ) + self._find_growing("type", self._types, self._min_growth_count)
+            self._suspects = {(s.kind, s.key): s for s in suspects}
+
+        for suspect in suspects:
+            logger.warning(
+                "Possible memory leak: %s %s grew by %d",
+                suspect.kind,
+                suspect.key,
+                suspect.growth,
+                extra={
+                    "leak_kind": suspect.kind,
+                    "leak_key": suspect.key,
+                    "leak_first": suspect.first,
+                    "leak_last": suspect.last,
+                    "leak_growth": suspect.growth,
+                    "leak_samples": suspect.samples,
+                },
+            )
+        return suspects
+
+    def _sample_allocations(self) -> dict[str, int] | None:
+        if not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        return {
+            str(statistic.traceback[0]): statistic.size
+            for statistic in snapshot.statistics("lineno")
+        }
+
+    def _sample_types(self) -> dict[str, int]:
+        if self._mode == "sampling":
+            objects = gc.get_objects(generation=2)
+        else:
+            objects = gc.get_objects()
+        return dict(Counter(type(obj).__qualname__ for obj in objects))
+
+    def _find_growing(
+            self, kind: LeakKind, samples: deque[dict[str, int]], min_growth: int
+    ) -> list[LeakSuspect]:
+        if len(samples) < self._window:
+            return []
+        suspects = []
+        for key, last in samples[-1].items():
+            series = [sample.get(key, 0) for sample in samples]
+            if last - series[0] < min_growth:
+                continue
+            if all(a < b for a, b in zip(series, series[1:], strict=False)):
+                suspects.append(LeakSuspect(kind, key, series[0], last, len(series)))
+        return sorted(suspects, key=lambda s: s.growth, reverse=True)
+
+    def suspects(
+            self, kind: LeakKind | None = None, min_growth: int = 0
+    ) -> list[LeakSuspect]:
+        """Return leak suspects of the last sample, largest growth first."""
+        with self._lock:
+            suspects = list(self._suspects.values())
+        return sorted(
+            (
+                s
+                for s in suspects
+                if (kind is None or s.kind == kind) and s.growth >= min_growth
+            ),
+            key=lambda s: s.growth,
+            reverse=True,
+        )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    with LeakWatchdog(interval=0.5, window=4, mode="full") as watchdog:
+        for _ in range(8):
+            simulate_requests(count=2_000, payload_size=1000)
+            time.sleep(0.5)
+
+    print(f"\nLeaky logger: {leaky_logger.log_count:,} logs")
+    print("Leak suspects:")
+    for suspect in watchdog.suspects()[:5]:
+        print(f"- {suspect.kind} {suspect.key}: +{suspect.growth:,}")
@@ -1,7 +1,14 @@
+import mmap
+import struct
 import sys
+import tempfile
+import time
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Protocol, Self
 
 
 @dataclass
@@ -13,38 +20,120 @@ class RequestLog:
     payload: str
 
 
-def calculate_memory_usage(logs: Iterable[RequestLog]) -> int:
-    """Return approximate memory usage of logs in bytes."""
-    return sys.getsizeof(logs) + sum(
+class RequestLogger(Protocol):
+    """Common interface of request loggers."""
+
+    def log(self, request_id: int, path: str, payload: str) -> None: ...
+
+    @property
+    def log_count(self) -> int: ...
+
+    @property
+    def memory_usage(self) -> float: ...
+
+
+def calculate_log_memory_usage(log: RequestLog, include_payload: bool = True) -> int:
+    """Return approximate memory usage of a single log in bytes.
+
+    Exclude the payload when it is shared with other logs (see PayloadStore).
+    """
+    return (
         sys.getsizeof(log)
         + sys.getsizeof(log.request_id)
         + sys.getsizeof(log.path)
-        + sys.getsizeof(log.payload)
-        for log in logs
+        + (sys.getsizeof(log.payload) if include_payload else 0)
     )
 
 
+def calculate_memory_usage(logs: Iterable[RequestLog]) -> int:
+    """Return approximate memory usage of logs in bytes."""
+    return sys.getsizeof(logs) + sum(calculate_log_memory_usage(log) for log in logs)
+
+
 def calculate_memory_usage_in_megabytes(logs: Iterable[RequestLog]) -> float:
     """Return approximate memory usage of logs in MB."""
     return calculate_memory_usage(logs) / (1024 * 1024)
 
 
+class PayloadStore:
+    """Content-addressed store sharing identical payloads between logs.
+
+    Each distinct payload is stored once, keyed by its hash, with a reference
+    count: loggers intern a payload when logging a request and release it when
+    the log is evicted, the payload being dropped with its last reference.
+    """
+
+    def __init__(self) -> None:
+        # payload -> (canonical payload instance, reference count)
+        self._payloads: dict[str, tuple[str, int]] = {}
+        self._payload_bytes = 0
+        self._referenced_bytes = 0
+
+    def intern(self, payload: str) -> str:
+        """Return the shared instance of payload and add a reference to it."""
+        size = sys.getsizeof(payload)
+        self._referenced_bytes += size
+        entry = self._payloads.get(payload)
+        if entry is None:
+            self._payloads[payload] = (payload, 1)
+            self._payload_bytes += size
+            return payload
+        canonical, references = entry
+        self._payloads[payload] = (canonical, references + 1)
+        return canonical
+
+    def release(self, payload: str) -> None:
+        """Remove a reference to payload, dropping it with its last reference."""
+        canonical, references = self._payloads[payload]
+        size = sys.getsizeof(canonical)
+        self._referenced_bytes -= size
+        if references > 1:
+            self._payloads[payload] = (canonical, references - 1)
+            return
+        del self._payloads[payload]
+        self._payload_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def get_memory_usage(self) -> int:
+        """Return approximate memory usage of stored payloads in bytes."""
+        return sys.getsizeof(self._payloads) + self._payload_bytes
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes of duplicate payloads that did not have to be stored."""
+        return self._referenced_bytes - self._payload_bytes
+
+
 class LeakyRequestLogger:
     """A logger that leaks memory by keeping all logs forever.
 
     This simulates a common mistake: accumulating data without cleanup.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, payload_store: PayloadStore | None = None) -> None:
         self._logs: list[RequestLog] = []
+        self._payload_store = payload_store
 
     def log(self, request_id: int, path: str, payload: str) -> None:
         """Log a request - but never clean up!"""
+        if self._payload_store is not None:
+            payload = self._payload_store.intern(payload)
         self._logs.append(RequestLog(request_id, path, payload))
 
     def get_memory_usage(self) -> int:
         """Return approximate memory usage of logs in bytes."""
-        return calculate_memory_usage(self._logs)
+        if self._payload_store is None:
+            return calculate_memory_usage(self._logs)
+        return (
+            sys.getsizeof(self._logs)
+            + sum(
+                calculate_log_memory_usage(log, include_payload=False)
+                for log in self._logs
+            )
+            + self._payload_store.get_memory_usage()
+        )
 
     @property
     def log_count(self) -> int:
@@ -52,30 +141,279 @@ class LeakyRequestLogger:
 
     @property
     def memory_usage(self) -> float:
-        return calculate_memory_usage_in_megabytes(self._logs)
+        return self.get_memory_usage() / (1024 * 1024)
 
 
 class BoundedRequestLogger:
-    """A logger that keeps memory stable by rotating logs."""
+    """A logger that keeps memory stable by rotating logs.
 
-    def __init__(self, max_size: int = 1000) -> None:
-        self._logs: deque[RequestLog] = deque(maxlen=max_size)
+    Three eviction policies can be combined, the oldest logs being evicted
+    first until all of them are satisfied:
+    - max_size: maximum number of logs
+    - max_bytes: maximum approximate memory usage of logs (payloads vary!)
+    - max_age: maximum age of a log in seconds
+
+    Each log is evicted at most once, so eviction is amortized O(1) per call.
+
+    With a payload store, identical payloads are shared and released on
+    eviction. Memory of the store then counts against max_bytes.
+    """
+
+    def __init__(
+            self,
+            max_size: int = 1000,
+            max_bytes: int | None = None,
+            max_age: float | None = None,
+            clock: Callable[[], float] = time.monotonic,
+            payload_store: PayloadStore | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be > 0")
+        self._max_size = max_size
+        self._max_bytes = max_bytes
+        self._max_age = max_age
+        self._clock = clock
+        self._payload_store = payload_store
+        self._logs: deque[RequestLog] = deque()
+        # (logged_at, size in bytes) of each log, in the same order as _logs
+        self._entries: deque[tuple[float, int]] = deque()
+        self._total_bytes = 0
 
     def log(self, request_id: int, path: str, payload: str) -> None:
         """Log a request and rotates logs if required."""
-        self._logs.append(RequestLog(request_id, path, payload))
+        if self._payload_store is not None:
+            payload = self._payload_store.intern(payload)
+        log = RequestLog(request_id, path, payload)
+        size = calculate_log_memory_usage(
+            log, include_payload=self._payload_store is None
+        )
+        now = self._clock()
+        self._logs.append(log)
+        self._entries.append((now, size))
+        self._total_bytes += size
+        self._evict(now)
+
+    def evict_expired(self) -> None:
+        """Evict logs older than max_age, even without new incoming logs."""
+        self._evict(self._clock())
+
+    def _evict(self, now: float) -> None:
+        while self._logs and self._must_evict_oldest(now):
+            log = self._logs.popleft()
+            _, size = self._entries.popleft()
+            self._total_bytes -= size
+            if self._payload_store is not None:
+                self._payload_store.release(log.payload)
+
+    def _must_evict_oldest(self, now: float) -> bool:
+        if len(self._logs) > self._max_size:
+            return True
+        if self._max_bytes is not None and self._stored_bytes() > self._max_bytes:
+            return True
+        logged_at, _ = self._entries[0]
+        return self._max_age is not None and now - logged_at > self._max_age
+
+    def _stored_bytes(self) -> int:
+        if self._payload_store is None:
+            return self._total_bytes
+        return self._total_bytes + self._payload_store.get_memory_usage()
 
     def get_memory_usage(self) -> int:
         """Return approximate memory usage of logs in bytes."""
-        return calculate_memory_usage(self._logs)
+        self.evict_expired()
+        return sys.getsizeof(self._logs) + self._stored_bytes()
 
     @property
     def log_count(self) -> int:
+        self.evict_expired()
         return len(self._logs)
 
     @property
     def memory_usage(self) -> float:
-        return calculate_memory_usage_in_megabytes(self._logs)
+        return self.get_memory_usage() / (1024 * 1024)
+
+
+class MmapRequestLogger:
+    """A logger that writes logs into a fixed-size memory-mapped ring file.
+
+    Logs are stored as length-prefixed binary records, the oldest ones being
+    overwritten when the ring is full. Memory usage (RSS) stays flat whatever
+    the retention, since pages are owned by the OS page cache, and the recent
+    history survives a process restart: reopening the file restores the ring.
+
+    File layout: a fixed header followed by `capacity` bytes of records.
+    A zero length prefix (or less than 4 remaining bytes) marks a wrap-around.
+    """
+
+    MAGIC = b"RQLG"
+    # magic, capacity, head, tail, count, total logged
+    _HEADER = struct.Struct("<4sQQQQQ")
+    # record length, request_id, path length, payload length
+    _RECORD = struct.Struct("<IqII")
+    _LENGTH = struct.Struct("<I")
+
+    def __init__(self, path: Path | str, capacity: int = 1024 * 1024) -> None:
+        if capacity < self._RECORD.size:
+            raise ValueError(f"capacity must be >= {self._RECORD.size}")
+        self._path = Path(path)
+        self._capacity = capacity
+        file_size = self._HEADER.size + capacity
+        is_new = not self._path.exists() or self._path.stat().st_size == 0
+
+        with self._path.open("a+b") as file:
+            if is_new:
+                file.truncate(file_size)
+            elif self._path.stat().st_size != file_size:
+                raise ValueError(f"{self._path} is not a ring of {capacity} bytes")
+            self._mmap = mmap.mmap(file.fileno(), file_size)
+
+        if is_new:
+            self._head = self._tail = self._count = self._total = 0
+            self._write_header()
+        else:
+            self._read_header()
+
+    def _read_header(self) -> None:
+        magic, capacity, head, tail, count, total = self._HEADER.unpack_from(
+            self._mmap, 0
+        )
+        if magic != self.MAGIC or capacity != self._capacity:
+            self._mmap.close()
+            raise ValueError(f"{self._path} is not a ring of {self._capacity} bytes")
+        self._head, self._tail, self._count, self._total = head, tail, count, total
+
+    def _write_header(self) -> None:
+        self._HEADER.pack_into(
+            self._mmap,
+            0,
+            self.MAGIC,
+            self._capacity,
+            self._head,
+            self._tail,
+            self._count,
+            self._total,
+        )
+
+    def log(self, request_id: int, path: str, payload: str) -> None:
+        """Log a request, overwriting the oldest logs if the ring is full."""
+        path_bytes = path.encode()
+        payload_bytes = payload.encode()
+        length = self._RECORD.size + len(path_bytes) + len(payload_bytes)
+        if length > self._capacity:
+            raise ValueError(f"record of {length} bytes exceeds ring capacity")
+
+        self._make_room(length)
+        offset = self._HEADER.size + self._head
+        self._RECORD.pack_into(
+            self._mmap, offset, length, request_id, len(path_bytes), len(payload_bytes)
+        )
+        offset += self._RECORD.size
+        self._mmap[offset : offset + len(path_bytes)] = path_bytes
+        offset += len(path_bytes)
+        self._mmap[offset : offset + len(payload_bytes)] = payload_bytes
+
+        self._head += length
+        self._count += 1
+        self._total += 1
+        self._write_header()
+
+    def _make_room(self, length: int) -> None:
+        """Move head and evict oldest records until `length` bytes are free."""
+        while True:
+            if self._count == 0:
+                self._head = self._tail = 0
+                return
+            if self._head > self._tail:
+                # Data in [tail, head): free space is at the end of the ring
+                if self._capacity - self._head >= length:
+                    return
+                if self._capacity - self._head >= self._LENGTH.size:
+                    self._LENGTH.pack_into(
+                        self._mmap, self._HEADER.size + self._head, 0
+                    )
+                self._head = 0
+            else:
+                # Wrapped data in [tail, end) + [0, head): free space in between
+                if self._tail - self._head >= length:
+                    return
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        self._tail += self._record_length(self._tail)
+        self._count -= 1
+        if self._count and self._is_wrap(self._tail):
+            self._tail = 0
+
+    def _record_length(self, position: int) -> int:
+        (length,) = self._LENGTH.unpack_from(self._mmap, self._HEADER.size + position)
+        return int(length)
+
+    def _is_wrap(self, position: int) -> bool:
+        return (
+            self._capacity - position < self._LENGTH.size
+            or self._record_length(position) == 0
+        )
+
+    def iter_logs(self) -> Generator[RequestLog, None, None]:
+        """Yield logs from oldest to newest, decoding one record at a time."""
+        position = self._tail
+        for _ in range(self._count):
+            if self._is_wrap(position):
+                position = 0
+            offset = self._HEADER.size + position
+            length, request_id, path_length, payload_length = (
+                self._RECORD.unpack_from(self._mmap, offset)
+            )
+            offset += self._RECORD.size
+            path = self._mmap[offset : offset + path_length].decode()
+            offset += path_length
+            payload = self._mmap[offset : offset + payload_length].decode()
+            yield RequestLog(request_id, path, payload)
+            position += length
+
+    def flush(self) -> None:
+        """Flush the ring to disk."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        self._mmap.flush()
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def get_memory_usage(self) -> int:
+        """Return the number of bytes used in the ring file (not in RSS)."""
+        if self._count == 0:
+            return 0
+        if self._head > self._tail:
+            return self._head - self._tail
+        return self._capacity - self._tail + self._head
+
+    @property
+    def total_logged(self) -> int:
+        """Number of logs ever written to the ring, including overwritten ones."""
+        return self._total
+
+    @property
+    def log_count(self) -> int:
+        return self._count
+
+    @property
+    def memory_usage(self) -> float:
+        return self.get_memory_usage() / (1024 * 1024)
 
 
 # Global singletons - lives forever in a long-running process!
@@ -83,8 +421,13 @@ leaky_logger = LeakyRequestLogger()
 bounded_logger = BoundedRequestLogger()
 
 
-def simulate_requests(count: int, payload_size: int = 1000) -> None:
+def simulate_requests(
+        count: int,
+        payload_size: int = 1000,
+        extra_loggers: Iterable[RequestLogger] = (),
+) -> None:
     """Simulate incoming HTTP requests."""
+    extra_loggers = tuple(extra_loggers)
     for i in range(count):
         path = f"/api/users/{i}"
         payload = "x" * payload_size  # Simulate request body
@@ -93,13 +436,22 @@ def simulate_requests(count: int, payload_size: int = 1000) -> None:
         leaky_logger.log(i, path, payload)
         # Each request logs rotating data
         bounded_logger.log(i, path, payload)
+        for logger in extra_loggers:
+            logger.log(i, path, payload)
 
 
 if __name__ == "__main__":
     print("Simulating long-running process with memory leak...")
+    mmap_logger = MmapRequestLogger(Path(tempfile.gettempdir()) / "requests.ring")
+    payload_store = PayloadStore()
+    deduplicated_logger = LeakyRequestLogger(payload_store=payload_store)
 
     for batch in range(1, 6):
-        simulate_requests(count=10_000, payload_size=1000)
+        simulate_requests(
+            count=10_000,
+            payload_size=1000,
+            extra_loggers=[mmap_logger, deduplicated_logger],
+        )
         print(f"\nAfter batch {batch}:")
         print(
             f"- Leaky logger: {leaky_logger.log_count:,} logs, ~{leaky_logger.memory_usage: .1f}MB"
@@ -107,3 +459,12 @@ if __name__ == "__main__":
         print(
             f"- Bounded logger: {bounded_logger.log_count:,} logs, ~{bounded_logger.memory_usage: .1f}MB"
         )
+        print(
+            f"- Mmap logger: {mmap_logger.log_count:,} logs, ~{mmap_logger.memory_usage: .1f}MB on disk"
+        )
+        print(
+            f"- Deduplicated leaky logger: {deduplicated_logger.log_count:,} logs, ~{deduplicated_logger.memory_usage: .1f}MB"
+            f" ({len(payload_store):,} distinct payloads, ~{payload_store.saved_bytes / (1024 * 1024): .1f}MB saved)"
+        )
+
+    mmap_logger.close()
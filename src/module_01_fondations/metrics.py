@@ -0,0 +1,105 @@
+"""In-process metrics registry with latency histograms."""
+
+import math
+from bisect import bisect_left
+from typing import Any
+
+# Exponential bucket upper bounds, in seconds: 1µs, 2µs, 4µs... ~134s
+DEFAULT_BUCKETS: tuple[float, ...] = tuple(1e-6 * 2**i for i in range(28))
+
+
+class Histogram:
+    """Latency histogram: count, sum, min/max and bucketed percentiles.
+
+    observe() does no locking: concurrent threads may rarely lose an update,
+    which is acceptable for latency statistics and keeps it cheap.
+    """
+
+    __slots__ = ("buckets", "count", "max", "min", "sum", "_counts")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        # Last counter is the overflow bucket, above the last upper bound
+        self._counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record a value (a duration in seconds)."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self._counts[bisect_left(self.buckets, value)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the q-th percentile."""
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        if self.count == 0:
+            return math.nan
+        rank = q / 100 * self.count
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                bound = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else math.nan
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "mean": self.mean if self.count else None,
+            "p50": self.percentile(50) if self.count else None,
+            "p90": self.percentile(90) if self.count else None,
+            "p99": self.percentile(99) if self.count else None,
+        }
+
+
+class MetricsRegistry:
+    """Named histograms shared by instrumented code of the process.
+
+    When disabled, instrumented code passes calls through without measuring.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self._histograms: dict[str, Histogram] = {}
+
+    def histogram(self, name: str) -> Histogram:
+        """Return the histogram registered under name, creating it if needed."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram()
+        return histogram
+
+    def dump(self) -> dict[str, dict[str, Any]]:
+        """Return statistics of every histogram, by name."""
+        return {
+            name: histogram.to_dict()
+            for name, histogram in sorted(self._histograms.items())
+        }
+
+    def reset(self) -> None:
+        """Reset every histogram, keeping them registered."""
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+
+# Process-wide registry used by decorators_demo.timer and timed_block
+registry = MetricsRegistry()
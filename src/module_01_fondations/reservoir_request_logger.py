@@ -0,0 +1,147 @@
+"""Reservoir sampling: a fixed-size representative sample of all requests."""
+
+import heapq
+import math
+import random
+from collections import Counter
+from collections.abc import Callable
+
+from src.module_01_fondations.memory_leak_demo import (
+    RequestLog,
+    calculate_memory_usage,
+    calculate_memory_usage_in_megabytes,
+)
+
+
+class ReservoirRequestLogger:
+    """A logger keeping a uniform random sample of every request ever seen.
+
+    Unlike BoundedRequestLogger, which only keeps the last N logs, each seen
+    request has the same probability to be in the sample, whatever its age.
+
+    Without weight, Algorithm L computes how many requests to skip before the
+    next replacement, so skipped requests cost a counter increment and no
+    random number. With a weight function (e.g. per path), A-ExpJ samples each
+    request proportionally to its weight, using the same skipping strategy.
+    Both run in fixed memory and O(1) amortized time per request.
+    """
+
+    def __init__(
+            self,
+            sample_size: int = 1000,
+            weight: Callable[[str], float] | None = None,
+            rng: random.Random | None = None,
+    ) -> None:
+        if sample_size < 1:
+            raise ValueError("sample_size must be >= 1")
+        self._sample_size = sample_size
+        self._weight = weight
+        self._random = rng or random.Random()
+        self._seen = 0
+        # Algorithm L state
+        self._logs: list[RequestLog] = []
+        self._w = 1.0
+        self._next_index = 0
+        # A-ExpJ state: min-heap of (log key, sequence, log)
+        self._heap: list[tuple[float, int, RequestLog]] = []
+        self._weight_to_skip = 0.0
+
+    def log(self, request_id: int, path: str, payload: str) -> None:
+        """Offer a request to the sample."""
+        if self._weight is None:
+            self._log_uniform(request_id, path, payload)
+        else:
+            self._log_weighted(request_id, path, payload, self._weight(path))
+        self._seen += 1
+
+    def _uniform(self) -> float:
+        """Return a random float in (0, 1], safe to pass to math.log()."""
+        return 1.0 - self._random.random()
+
+    def _log_uniform(self, request_id: int, path: str, payload: str) -> None:
+        if self._seen < self._sample_size:
+            self._logs.append(RequestLog(request_id, path, payload))
+            if self._seen == self._sample_size - 1:
+                self._w = math.exp(math.log(self._uniform()) / self._sample_size)
+                self._skip_uniform(self._seen)
+            return
+        if self._seen < self._next_index:
+            return
+        index = self._random.randrange(self._sample_size)
+        self._logs[index] = RequestLog(request_id, path, payload)
+        self._w *= math.exp(math.log(self._uniform()) / self._sample_size)
+        self._skip_uniform(self._seen)
+
+    def _skip_uniform(self, index: int) -> None:
+        skip = math.floor(math.log(self._uniform()) / math.log(1 - self._w))
+        self._next_index = index + skip + 1
+
+    def _log_weighted(
+            self, request_id: int, path: str, payload: str, weight: float
+    ) -> None:
+        if weight <= 0:
+            return
+        if len(self._heap) < self._sample_size:
+            key = math.log(self._uniform()) / weight
+            log = RequestLog(request_id, path, payload)
+            heapq.heappush(self._heap, (key, self._seen, log))
+            if len(self._heap) == self._sample_size:
+                self._skip_weighted()
+            return
+        self._weight_to_skip -= weight
+        if self._weight_to_skip > 0:
+            return
+        # The request replaces the minimum key: draw its key above the threshold
+        threshold = math.exp(self._heap[0][0] * weight)
+        key = math.log(self._random.uniform(threshold, 1)) / weight
+        log = RequestLog(request_id, path, payload)
+        heapq.heapreplace(self._heap, (key, self._seen, log))
+        self._skip_weighted()
+
+    def _skip_weighted(self) -> None:
+        min_key = self._heap[0][0]
+        self._weight_to_skip = math.log(self._uniform()) / min_key
+
+    @property
+    def samples(self) -> list[RequestLog]:
+        """Return the current sample, in no particular order."""
+        if self._weight is None:
+            return list(self._logs)
+        return [log for _, _, log in self._heap]
+
+    @property
+    def seen_count(self) -> int:
+        """Number of requests ever offered to the sample."""
+        return self._seen
+
+    def get_memory_usage(self) -> int:
+        """Return approximate memory usage of logs in bytes."""
+        return calculate_memory_usage(self.samples)
+
+    @property
+    def log_count(self) -> int:
+        return len(self._logs) + len(self._heap)
+
+    @property
+    def memory_usage(self) -> float:
+        return calculate_memory_usage_in_megabytes(self.samples)
+
+
+if __name__ == "__main__":
+    paths = ["/api/users", "/api/orders", "/api/health"]
+    uniform_logger = ReservoirRequestLogger(sample_size=1000)
+    weighted_logger = ReservoirRequestLogger(
+        sample_size=1000, weight=lambda path: 0.1 if path == "/api/health" else 1.0
+    )
+
+    for i in range(300_000):
+        path = paths[i % len(paths)]
+        uniform_logger.log(i, path, "x" * 100)
+        weighted_logger.log(i, path, "x" * 100)
+
+    for name, logger in (("Uniform", uniform_logger), ("Weighted", weighted_logger)):
+        print(
+            f"{name} reservoir: {logger.log_count:,}/{logger.seen_count:,} logs, "
+            f"~{logger.memory_usage:.2f}MB"
+        )
+        print(f"  by path: {dict(Counter(log.path for log in logger.samples))}")
@@ -0,0 +1,136 @@
+"""Nested span tracing with Chrome trace-event export."""
+
+import asyncio
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation, child of the span active when it started."""
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    trace_id: int
+    # Thread, or asyncio task, running the span: its lane in the trace viewer
+    lane: int
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def start(self) -> float:
+        """Start time in seconds, as returned by time.perf_counter()."""
+        return self.start_ns / 1e9
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (until now while the span is running)."""
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1e9
+
+
+# Span active in the current context: each asyncio task gets a copy of the
+# context of its creator, so spans started in a task are children of the span
+# that was active when the task was created.
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def _current_lane() -> int:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return id(task) if task is not None else threading.get_ident()
+
+
+class Tracer:
+    """Records finished spans in a bounded in-memory buffer."""
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        if max_spans < 1:
+            raise ValueError("max_spans must be >= 1")
+        self.enabled = True
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._ids = itertools.count(1)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Generator[Span, None, None]:
+        """Time the block as a span, nested in the current span if any."""
+        parent = _current_span.get()
+        span_id = next(self._ids)
+        span = Span(
+            name=name,
+            span_id=span_id,
+            parent_id=parent.span_id if parent else None,
+            trace_id=parent.trace_id if parent else span_id,
+            lane=_current_lane(),
+            start_ns=time.perf_counter_ns(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            if self.enabled:
+                self._spans.append(span)
+
+    def spans(self, trace_id: int | None = None) -> list[Span]:
+        """Return finished spans, optionally of a single trace."""
+        # copy() is atomic under the GIL, unlike iterating a deque that other
+        # threads append to (RuntimeError: deque mutated during iteration)
+        spans = self._spans.copy()
+        return [s for s in spans if trace_id is None or s.trace_id == trace_id]
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+    def export_chrome_trace(
+            self, path: Path | str | None = None, trace_id: int | None = None
+    ) -> dict[str, Any]:
+        """Export spans as Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+        Each span is a complete ("X") event; the viewer nests events by time
+        within a lane (thread or asyncio task), which gives a flame chart.
+        """
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": span.lane,
+                    "args": {
+                        "span_id": span.span_id,
+                        "parent_id": span.parent_id,
+                        "trace_id": span.trace_id,
+                        **span.attributes,
+                    },
+                }
+                for span in self.spans(trace_id)
+            ],
+            "displayTimeUnit": "ms",
+        }
+        if path is not None:
+            Path(path).write_text(json.dumps(trace, default=str))
+        return trace
+
+
+# Process-wide tracer used by decorators_demo.timed_block
+tracer = Tracer()
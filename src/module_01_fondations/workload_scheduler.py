@@ -0,0 +1,228 @@
+"""Scheduler routing I/O-bound tasks to threads and CPU-bound ones to processes."""
+
+import os
+import pickle
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Literal, Self
+
+from src.module_01_fondations.gil_demo import sum_of_squares
+
+WorkloadKind = Literal["io", "cpu"]
+
+# A run submitted while its task type is probed: (future, func, args, kwargs)
+_Deferred = tuple[Future[Any], Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+def _picklable(
+        func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> bool:
+    try:
+        pickle.dumps((func, args, kwargs))
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _measured_call(
+        func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[Any, float, float]:
+    """Run func, returning (result, CPU time, wall time) of the call."""
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.thread_time() - cpu_start, time.perf_counter() - wall_start
+
+
+@dataclass
+class TaskTypeStats:
+    """Observed CPU time / wall time ratio of a task type."""
+
+    cpu_ratio: float = 0.0
+    samples: int = 0
+
+
+class WorkloadScheduler:
+    """Route tasks to a thread pool (I/O-bound) or a process pool (CPU-bound).
+
+    A task is classified by its explicit kind if given. Otherwise, the
+    scheduler learns the classification of its task type (the function's
+    qualified name by default) from each run: a task spending most of its
+    wall time on CPU holds the GIL and goes to processes, a task mostly
+    waiting goes to threads.
+
+    The first run of an unknown task type is a probe, run in the process
+    pool where it does not wait for the GIL: on threads, a burst of CPU-bound
+    tasks would share the GIL and all look I/O-bound. Runs of the same type
+    submitted during the probe wait for it, then are routed by the learned
+    kind. Task types that cannot be pickled always run on threads, whatever
+    their learned kind.
+
+    CPU-bound functions and arguments must be picklable.
+    """
+
+    def __init__(
+            self,
+            thread_workers: int = 32,
+            process_workers: int | None = None,
+            cpu_ratio_threshold: float = 0.5,
+            smoothing: float = 0.3,
+            default_kind: WorkloadKind = "io",
+    ) -> None:
+        if not 0 < cpu_ratio_threshold < 1:
+            raise ValueError("cpu_ratio_threshold must be in (0, 1)")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self._threads = ThreadPoolExecutor(max_workers=thread_workers)
+        self._processes = ProcessPoolExecutor(
+            max_workers=process_workers or os.cpu_count() or 1
+        )
+        self._cpu_ratio_threshold = cpu_ratio_threshold
+        self._smoothing = smoothing
+        self._default_kind = default_kind
+        self._lock = threading.Lock()
+        self._stats: dict[str, TaskTypeStats] = {}
+        # Per task type being probed: runs submitted during the probe
+        self._probing: dict[str, list[_Deferred]] = {}
+        # Task types whose probe could not be pickled
+        self._unpicklable: set[str] = set()
+
+    def classify(self, task_type: str) -> WorkloadKind:
+        """Return the learned kind of a task type."""
+        with self._lock:
+            stats = self._stats.get(task_type)
+        if stats is None or stats.samples == 0:
+            return self._default_kind
+        return "cpu" if stats.cpu_ratio >= self._cpu_ratio_threshold else "io"
+
+    def _observe(self, task_type: str, cpu: float, wall: float) -> None:
+        ratio = min(1.0, cpu / wall) if wall > 0 else 0.0
+        with self._lock:
+            stats = self._stats.setdefault(task_type, TaskTypeStats())
+            if stats.samples == 0:
+                stats.cpu_ratio = ratio
+            else:
+                # Exponential moving average: adapts if a task type changes
+                stats.cpu_ratio += self._smoothing * (ratio - stats.cpu_ratio)
+            stats.samples += 1
+
+    def submit(
+            self,
+            func: Callable[..., Any],
+            *args: Any,
+            kind: WorkloadKind | None = None,
+            task_type: str | None = None,
+            **kwargs: Any,
+    ) -> Future[Any]:
+        """Schedule func(*args, **kwargs) on the pool matching its workload."""
+        outer: Future[Any] = Future()
+        self._schedule(outer, func, args, kwargs, kind, task_type or func.__qualname__)
+        return outer
+
+    def _schedule(
+            self,
+            outer: Future[Any],
+            func: Callable[..., Any],
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+            kind: WorkloadKind | None,
+            task_type: str,
+    ) -> None:
+        probe = False
+        if kind is None:
+            with self._lock:
+                deferred = self._probing.get(task_type)
+                if deferred is not None:
+                    deferred.append((outer, func, args, kwargs))
+                    return
+                unpicklable = task_type in self._unpicklable
+                probe = task_type not in self._stats and not unpicklable
+                if probe:
+                    self._probing[task_type] = []
+            if probe and not _picklable(func, args, kwargs):
+                with self._lock:
+                    self._unpicklable.add(task_type)
+                probe, unpicklable = False, True
+                self._end_probe(task_type)
+            kind = "cpu" if probe else self.classify(task_type)
+            if unpicklable:
+                kind = "io"
+        executor = self._processes if kind == "cpu" else self._threads
+        inner = executor.submit(_measured_call, func, args, kwargs)
+
+        def on_done(done: Future[tuple[Any, float, float]]) -> None:
+            error = done.exception()
+            if error is not None:
+                outer.set_exception(error)
+            else:
+                result, cpu, wall = done.result()
+                self._observe(task_type, cpu, wall)
+                outer.set_result(result)
+            if probe:
+                self._end_probe(task_type)
+
+        inner.add_done_callback(on_done)
+
+    def _end_probe(self, task_type: str) -> None:
+        """Schedule the runs deferred during a probe, by the learned kind."""
+        with self._lock:
+            deferred = self._probing.pop(task_type)
+        for outer, func, args, kwargs in deferred:
+            try:
+                self._schedule(outer, func, args, kwargs, None, task_type)
+            except RuntimeError as error:
+                # The scheduler was shut down during the probe
+                outer.set_exception(error)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the learned classification of each task type."""
+        with self._lock:
+            snapshot = {
+                name: (stats.cpu_ratio, stats.samples)
+                for name, stats in self._stats.items()
+            }
+        return {
+            name: {"kind": self.classify(name), "cpu_ratio": ratio, "samples": samples}
+            for name, (ratio, samples) in snapshot.items()
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        # Processes first: probes ending there schedule deferred runs on threads
+        self._processes.shutdown(wait=wait)
+        self._threads.shutdown(wait=wait)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+
+def sleep_task(duration: float) -> float:
+    """Simulate I/O-bound work."""
+    time.sleep(duration)
+    return duration
+
+
+if __name__ == "__main__":
+    with WorkloadScheduler() as scheduler:
+        # Warm up: one run of each task type teaches the scheduler its kind
+        scheduler.submit(sum_of_squares, 1_000_000).result()
+        scheduler.submit(sleep_task, 0.1).result()
+        print(f"Learned: {scheduler.stats()}")
+
+        start = time.perf_counter()
+        futures = [scheduler.submit(sum_of_squares, 5_000_000) for _ in range(4)]
+        futures += [scheduler.submit(sleep_task, 0.5) for _ in range(20)]
+        for future in futures:
+            future.result()
+        print(f"Mixed queue: {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,150 @@
+"""Response cache with in-flight request coalescing, for async fetches."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any, NamedTuple
+
+Fetch = Callable[[str], Awaitable[dict[str, Any]]]
+
+# Statuses cacheable without explicit freshness information (RFC 9111)
+CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 405, 410, 414, 501})
+
+
+class FetchCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    # Responses not stored: error status, no-store / no-cache, or expired
+    uncacheable: int
+    size: int
+    max_size: int
+
+
+def response_ttl(response: Mapping[str, Any], default: float) -> float:
+    """Return how long a fetch result may be cached, in seconds (0: not at all).
+
+    Real HTTP results (with headers) honor Cache-Control no-store, no-cache
+    and max-age (minus Age), then Expires. Results without freshness
+    information, like simulated fetches, are cached for default seconds.
+    """
+    if response.get("status", 200) not in CACHEABLE_STATUSES:
+        return 0.0
+    headers = {
+        name.lower(): value for name, value in response.get("headers", {}).items()
+    }
+    directives: dict[str, str | None] = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    if "no-store" in directives or "no-cache" in directives:
+        return 0.0
+    max_age = directives.get("max-age")
+    if max_age is not None:
+        try:
+            age = float(headers.get("age", 0))
+            return max(0.0, float(max_age) - age)
+        except ValueError:
+            return 0.0
+    if "expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["expires"])
+            date = (
+                parsedate_to_datetime(headers["date"]).timestamp()
+                if "date" in headers
+                else time.time()
+            )
+        except (TypeError, ValueError):
+            # Invalid Expires, e.g. "0", means already expired
+            return 0.0
+        return max(0.0, expires.timestamp() - date)
+    return default
+
+
+class CachedFetch:
+    """Fetch function wrapper caching results, with TTL and LRU size cap.
+
+    Concurrent fetches of the same URL are coalesced into one: later
+    callers await the fetch in flight instead of starting their own. A
+    result is cached for response_ttl() seconds, and the least recently used
+    results are evicted beyond max_size. Errors are propagated to every
+    waiting caller, but never cached.
+
+    Used as a fetch function, e.g. fetch_all_async(urls, fetch=CachedFetch(f)).
+    """
+
+    def __init__(self, fetch: Fetch, max_size: int = 1024, ttl: float = 60.0) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if ttl < 0:
+            raise ValueError("ttl must be >= 0")
+        self._fetch = fetch
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._hits = self._misses = self._coalesced = 0
+        self._evictions = self._uncacheable = 0
+
+    def _get(self, url: str) -> dict[str, Any] | None:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._entries[url]
+            self._evictions += 1
+            return None
+        self._entries.move_to_end(url)
+        return response
+
+    def _store(self, url: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        self._in_flight.pop(url, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        response = task.result()
+        ttl = response_ttl(response, self._ttl)
+        if ttl <= 0:
+            self._uncacheable += 1
+            return
+        self._entries[url] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def __call__(self, url: str) -> dict[str, Any]:
+        response = self._get(url)
+        if response is not None:
+            self._hits += 1
+            return response
+        task = self._in_flight.get(url)
+        if task is None:
+            self._misses += 1
+            task = asyncio.ensure_future(self._fetch(url))
+            task.add_done_callback(lambda done: self._store(url, done))
+            self._in_flight[url] = task
+        else:
+            self._coalesced += 1
+        # Shield the shared fetch from the cancellation of one caller
+        return await asyncio.shield(task)
+
+    def cache_info(self) -> FetchCacheInfo:
+        return FetchCacheInfo(
+            self._hits,
+            self._misses,
+            self._coalesced,
+            self._evictions,
+            self._uncacheable,
+            len(self._entries),
+            self._max_size,
+        )
+
+    def cache_clear(self) -> None:
+        self._entries.clear()
+        self._hits = self._misses = self._coalesced = 0
+        self._evictions = self._uncacheable = 0
@@ -0,0 +1,122 @@
+"""Local HTTP/1.1 test server for fetch benchmarks."""
+
+import sys
+import threading
+import time
+from collections.abc import Callable, Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Self
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+            self,
+            delay: Callable[[], float],
+            body: bytes,
+            headers: Mapping[str, str],
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.delay = delay
+        self.body = body
+        self.response_headers = dict(headers)
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients cancelling requests (timeouts, hedging) close connections
+        # while responses are being written: not a server error
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive unless the client asks to close them
+    protocol_version = "HTTP/1.1"
+    # Headers and body are sent separately: without TCP_NODELAY, Nagle's
+    # algorithm delays the body of keep-alive responses until the next ACK
+    disable_nagle_algorithm = True
+    server: _CountingServer
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:  # noqa: N802
+        with self.server.lock:
+            self.server.requests += 1
+        delay = self.server.delay()
+        if delay > 0:
+            time.sleep(delay)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.server.body)))
+        for name, value in self.server.response_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: ARG002
+        pass
+
+
+class LocalHttpServer:
+    """Threaded HTTP/1.1 server on localhost, counting TCP connections.
+
+    Each GET waits delay() seconds (a float is a constant delay) and returns
+    body with the given headers. Comparing connections to requests shows how
+    many connections a client reused.
+    """
+
+    def __init__(
+            self,
+            delay: Callable[[], float] | float = 0.0,
+            body: bytes = b"ok",
+            headers: Mapping[str, str] | None = None,
+    ) -> None:
+        delay_func = delay if callable(delay) else (lambda: delay)
+        self._server = _CountingServer(delay_func, body, headers or {})
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="local-http-server", daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def connections(self) -> int:
+        return self._server.connections
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    def reset_counters(self) -> None:
+        with self._server.lock:
+            self._server.connections = 0
+            self._server.requests = 0
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        self.stop()
@@ -7,8 +7,18 @@ and asynchronous execution for I/O-bound operations.
 
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+from src.module_02_asyncio.exercice_01_comparison.fetch_cache import CachedFetch
+from src.module_02_asyncio.exercice_01_comparison.http_fetcher import (
+    HttpFetcher,
+    PoolSettings,
+)
+from src.module_02_asyncio.exercice_01_comparison.local_server import LocalHttpServer
+
+Fetch = Callable[[str], Awaitable[dict[str, Any]]]
+
 
 def simulate_fetch_sync(url: str, delay: float = 0.5) -> dict[str, Any]:
     """Simulate a synchronous HTTP fetch with blocking sleep."""
@@ -39,9 +49,11 @@ def fetch_all_sync(urls: list[str]) -> list[dict[str, Any]]:
 # --- ASYNC VERSION ---
 
 
-async def fetch_all_async(urls: list[str]) -> list[dict[str, Any]]:
+async def fetch_all_async(
+        urls: list[str], fetch: Fetch = simulate_fetch_async
+) -> list[dict[str, Any]]:
     """Fetch all URLs concurrently (non-blocking)."""
-    return await asyncio.gather(*[simulate_fetch_async(url) for url in urls])
+    return await asyncio.gather(*[fetch(url) for url in urls])
 
 
 # --- BENCHMARK ---
@@ -73,6 +85,51 @@ def benchmark() -> None:
 
     print_header(f"Speedup: {sync_duration / async_duration:.1f}x faster with async")
 
+    print_header("CACHED ASYNC VERSION (each URL requested 3 times, twice)")
+    cached_fetch = CachedFetch(simulate_fetch_async)
+    start = time.perf_counter()
+    for _ in range(2):
+        asyncio.run(fetch_all_async(urls * 3, fetch=cached_fetch))
+    print(f"Duration: {time.perf_counter() - start:.2f}s")
+    print(f"Cache: {cached_fetch.cache_info()}")
+
+    benchmark_http()
+
+
+async def _fetch_all_http(urls: list[str], settings: PoolSettings) -> float:
+    async with HttpFetcher(default=settings) as fetcher:
+        start = time.perf_counter()
+        await fetch_all_async(urls, fetch=fetcher.fetch)
+        return time.perf_counter() - start
+
+
+def benchmark_http(requests: int = 500, max_connections: int = 10) -> None:
+    """Compare connection reuse vs a new connection per request, over real HTTP.
+
+    Requests go to a local server, so the difference between both runs is
+    the cost of TCP connection setup (plus TLS on real HTTPS upstreams).
+    """
+    with LocalHttpServer() as server:
+        urls = [f"{server.url}/item/{i}" for i in range(requests)]
+        runs = [
+            ("POOLED CONNECTIONS", max_connections),
+            ("NEW CONNECTION PER REQUEST", 0),
+        ]
+        for label, keepalive in runs:
+            server.reset_counters()
+            duration = asyncio.run(
+                _fetch_all_http(
+                    urls,
+                    PoolSettings(
+                        max_connections=max_connections,
+                        max_keepalive_connections=keepalive,
+                    ),
+                )
+            )
+            print_header(f"LOCAL HTTP - {label}")
+            print(f"Requests: {server.requests}, connections: {server.connections}")
+            print(f"Duration: {duration:.2f}s")
+
 
 def print_header(
         label: str, border: str = "=" * 50, with_line_feed: bool = True
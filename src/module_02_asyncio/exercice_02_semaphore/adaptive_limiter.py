@@ -0,0 +1,199 @@
+"""Adaptive concurrency limit (AIMD on latency and errors)."""
+
+import asyncio
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+
+@dataclass
+class _Slot:
+    """Slot held through async with: start time, and token to unset it."""
+
+    started: float
+    token: Token["_Slot"] | None = None
+
+
+class AdaptiveLimiter:
+    """Concurrency limiter adjusting its limit to upstream latency and errors.
+
+    Drop-in replacement for asyncio.Semaphore (async with limiter: ...).
+    Each completed request feeds the limit (AIMD, as in TCP congestion
+    control):
+    - while latency stays within latency_tolerance times the lowest latency
+      seen (the no-load latency), the limit grows by about 1 per limit
+      requests, i.e. +1 per round of requests;
+    - when latency rises above it, or a request fails, the limit is
+      multiplied by backoff, at most once per round: requests started before
+      the last decrease do not decrease it again.
+
+    The limit only grows while it is actually reached, so an idle limiter
+    does not inflate it.
+    """
+
+    def __init__(
+            self,
+            initial_limit: int = 3,
+            min_limit: int = 1,
+            max_limit: int = 100,
+            backoff: float = 0.7,
+            latency_tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be in (0, 1)")
+        if latency_tolerance < 1:
+            raise ValueError("latency_tolerance must be >= 1")
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff = backoff
+        self._latency_tolerance = latency_tolerance
+        self._min_latency = float("inf")
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._increases = 0
+        self._decreases = 0
+        # Slot held by the current task, per limiter: tasks may hold slots of
+        # several limiters, or nest them
+        self._slot: ContextVar[_Slot] = ContextVar(f"adaptive_limiter_{id(self)}")
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def locked(self) -> bool:
+        return self._in_flight >= self.limit
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "waiting": sum(1 for waiter in self._waiters if not waiter.done()),
+            "min_latency": self._min_latency,
+            "increases": self._increases,
+            "decreases": self._decreases,
+        }
+
+    async def acquire(self) -> None:
+        """Wait for a slot, in FIFO order."""
+        if not self._waiters and not self.locked():
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after being granted a slot: hand it to the next
+                self._in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, latency: float | None = None, failed: bool = False) -> None:
+        """Free a slot, feeding the request latency and outcome if known."""
+        self._in_flight -= 1
+        if latency is not None or failed:
+            self._update(latency, failed)
+        self._wake()
+
+    def _update(self, latency: float | None, failed: bool) -> None:
+        now = time.monotonic()
+        if latency is not None and not failed:
+            self._min_latency = min(self._min_latency, latency)
+        overloaded = failed or (
+            latency is not None
+            and latency > self._min_latency * self._latency_tolerance
+        )
+        if overloaded:
+            started = now - (latency or 0.0)
+            if started >= self._last_decrease:
+                self._limit = max(self._min_limit, self._limit * self._backoff)
+                self._last_decrease = now
+                self._decreases += 1
+        elif self._in_flight + 1 >= self.limit:
+            previous = self.limit
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            self._increases += self.limit > previous
+
+    def _wake(self) -> None:
+        while self._waiters and not self.locked():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                # Cancelled while waiting
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+        slot = _Slot(time.monotonic())
+        slot.token = self._slot.set(slot)
+
+    async def __aexit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_val: BaseException | None,
+            exc_tb: TracebackType | None,
+    ) -> None:
+        slot = self._slot.get()
+        assert slot.token is not None
+        self._slot.reset(slot.token)
+        latency = time.monotonic() - slot.started
+        if exc_type is None:
+            self.release(latency)
+        elif issubclass(exc_type, Exception):
+            self.release(latency, failed=True)
+        else:
+            # Cancellation says nothing about the upstream
+            self.release()
+
+
+class OverloadableUpstream:
+    """Simulated upstream slowing down beyond capacity concurrent requests."""
+
+    def __init__(self, capacity: int = 8, latency: float = 0.05) -> None:
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+
+    async def fetch(self, url: str) -> dict[str, Any]:
+        self.in_flight += 1
+        try:
+            # Requests beyond capacity queue up: latency grows with load
+            load = max(1.0, self.in_flight / self.capacity)
+            await asyncio.sleep(self.latency * load)
+        finally:
+            self.in_flight -= 1
+        return {"url": url, "status": 200}
+
+
+async def demo() -> None:
+    upstream = OverloadableUpstream(capacity=8)
+    limiter = AdaptiveLimiter(initial_limit=1, max_limit=50)
+
+    async def fetch_one(url: str) -> None:
+        async with limiter:
+            await upstream.fetch(url)
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(fetch_one(f"url-{i}")) for i in range(500)]
+    while not all(task.done() for task in tasks):
+        await asyncio.sleep(0.25)
+        print(f"t={time.perf_counter() - start:.2f}s {limiter.metrics()}")
+    print(f"Upstream capacity: {upstream.capacity}, final limit: {limiter.limit}")
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
@@ -0,0 +1,217 @@
+"""Distributed token-bucket rate limiting on Redis, shared by all workers.
+
+HostRateLimiter only limits one process: N uvicorn or Celery workers send N
+times the rate. Here, buckets live in Redis and are updated atomically by a
+Lua script, so all workers share them. Workers prefetch several tokens per
+round trip and spend them locally.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from typing import Any, Protocol
+from urllib.parse import urlsplit
+
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.module_02_asyncio.exercice_02_semaphore.token_bucket import RateLimit
+
+# KEYS[1]: bucket hash (tokens, updated); ARGV: rate, burst, requested tokens.
+# Returns {granted tokens, seconds until requested tokens are available if
+# none was granted, as a string (Lua numbers are truncated to integers in
+# replies)}. Redis server time is used, so worker clocks do not need to agree.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(state[1]) or burst
+local updated = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call(
+    "HSET", KEYS[1],
+    "tokens", tostring(tokens),
+    "updated", string.format("%.6f", now)
+)
+redis.call("PEXPIRE", KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+local wait = 0
+if granted == 0 then
+    wait = (requested - tokens) / rate
+end
+return {granted, tostring(wait)}
+"""
+
+
+class TokenBucketStore(Protocol):
+    """Shared storage of token buckets."""
+
+    async def take(
+            self, key: str, limit: RateLimit, requested: int
+    ) -> tuple[int, float]:
+        """Take up to requested tokens from the bucket of key, atomically.
+
+        Return (granted tokens, seconds until requested tokens are available
+        if none was granted).
+        """
+        ...
+
+
+class RedisTokenBucketStore:
+    """Token buckets in Redis, updated by TOKEN_BUCKET_SCRIPT.
+
+    client is a redis.asyncio.Redis client. The script is sent once, then
+    called by its SHA1 (EVALSHA).
+    """
+
+    def __init__(self, client: Any, prefix: str = "ratelimit:") -> None:
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+        self._prefix = prefix
+
+    async def take(
+            self, key: str, limit: RateLimit, requested: int
+    ) -> tuple[int, float]:
+        granted, wait = await self._script(
+            keys=[self._prefix + key], args=[limit.rate, limit.burst, requested]
+        )
+        return int(granted), float(wait)
+
+
+class InMemoryTokenBucketStore:
+    """In-process store with the semantics of TOKEN_BUCKET_SCRIPT.
+
+    Stands in for Redis in tests, or in single-process deployments.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    async def take(
+            self, key: str, limit: RateLimit, requested: int
+    ) -> tuple[int, float]:
+        now = self._clock()
+        tokens, updated = self._buckets.get(key, (float(limit.burst), now))
+        tokens = min(limit.burst, tokens + max(0.0, now - updated) * limit.rate)
+        granted = min(requested, int(tokens))
+        tokens -= granted
+        self._buckets[key] = (tokens, now)
+        return granted, 0.0 if granted else (requested - tokens) / limit.rate
+
+
+class DistributedRateLimiter:
+    """Per-host rate limiter whose buckets are shared through a store.
+
+    Each round trip to the store takes up to prefetch tokens; acquire() then
+    spends them locally without a round trip. Prefetching divides round
+    trips by up to prefetch, at the cost of fairness: tokens held by a
+    worker are unavailable to others, and a worker finding the bucket empty
+    waits until prefetch tokens are available. Unused prefetched tokens are
+    dropped after max_local_age seconds, so they cannot pile up into a burst
+    above the shared limit.
+    """
+
+    def __init__(
+            self,
+            store: TokenBucketStore,
+            default: RateLimit,
+            per_host: Mapping[str, RateLimit] | None = None,
+            prefetch: int = 1,
+            max_local_age: float = 1.0,
+    ) -> None:
+        if prefetch < 1:
+            raise ValueError("prefetch must be >= 1")
+        if max_local_age <= 0:
+            raise ValueError("max_local_age must be > 0")
+        self._store = store
+        self._default = default
+        self._per_host = dict(per_host or {})
+        self._prefetch = prefetch
+        self._max_local_age = max_local_age
+        # Per key: (prefetched tokens left, time they were fetched)
+        self._local: dict[str, tuple[int, float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self.round_trips = 0
+
+    def _take_local(self, key: str) -> bool:
+        tokens, fetched_at = self._local.get(key, (0, 0.0))
+        if tokens < 1 or time.monotonic() - fetched_at > self._max_local_age:
+            return False
+        self._local[key] = (tokens - 1, fetched_at)
+        return True
+
+    async def acquire_key(self, key: str) -> None:
+        """Wait for a token of the bucket of key."""
+        if self._take_local(key):
+            return
+        limit = self._per_host.get(key, self._default)
+        # One round trip per key at a time: others wait (FIFO) for its tokens
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            if self._take_local(key):
+                return
+            while True:
+                self.round_trips += 1
+                requested = min(self._prefetch, limit.burst)
+                granted, wait = await self._store.take(key, limit, requested)
+                if granted:
+                    # Spend one token of the grant now: it is fresh, whatever
+                    # max_local_age
+                    self._local[key] = (granted - 1, time.monotonic())
+                    return
+                await asyncio.sleep(wait)
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the host of url is allowed."""
+        await self.acquire_key(urlsplit(url).hostname or url)
+
+
+async def demo(
+        redis_url: str = "redis://localhost:6379/0",
+        workers: int = 3,
+        seconds: float = 2,
+) -> None:
+    """Share a 20 req/s limit between workers, through Redis if reachable."""
+    client = aioredis.Redis.from_url(redis_url)
+    store: TokenBucketStore
+    try:
+        await client.ping()
+        await client.delete("ratelimit:api.example.com")
+        store = RedisTokenBucketStore(client)
+        print(f"Store: Redis at {redis_url}")
+    except RedisConnectionError:
+        store = InMemoryTokenBucketStore()
+        print("Store: in-process (Redis unreachable, run docker compose up redis)")
+
+    limit = RateLimit(rate=20, burst=5)
+    limiters = [
+        DistributedRateLimiter(store, limit, prefetch=5) for _ in range(workers)
+    ]
+    counts = [0] * workers
+
+    async def consume(worker: int) -> None:
+        while True:
+            await limiters[worker].acquire("https://api.example.com/items")
+            counts[worker] += 1
+
+    tasks = [
+        asyncio.create_task(consume(worker))
+        for worker in range(workers)
+        for _ in range(5)
+    ]
+    await asyncio.sleep(seconds)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await client.aclose()
+
+    print(f"Requests per worker: {counts}")
+    print(f"Total rate: {sum(counts) / seconds:.1f} req/s (limit: {limit.rate})")
+    print(f"Round trips: {sum(limiter.round_trips for limiter in limiters)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(demo())
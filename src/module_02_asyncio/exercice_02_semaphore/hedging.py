@@ -0,0 +1,211 @@
+"""Hedged requests with deadline propagation, against tail latency.
+
+Run `python -m src.module_02_asyncio.exercice_02_semaphore.hedging` to
+compare p50/p99 latencies with and without hedging against a local server
+with a long latency tail.
+"""
+
+import asyncio
+import random
+import statistics
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from src.module_02_asyncio.exercice_01_comparison.http_fetcher import HttpFetcher
+from src.module_02_asyncio.exercice_01_comparison.local_server import LocalHttpServer
+from src.module_02_asyncio.exercice_02_semaphore.rate_limiter import (
+    fetch_with_limit,
+    print_header,
+)
+
+Fetch = Callable[[str], Awaitable[dict[str, Any]]]
+# Fetch function taking a timeout in seconds, like HttpFetcher.fetch
+TimedFetch = Callable[..., Awaitable[dict[str, Any]]]
+
+# Event loop time by which the current request must complete
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the deadline of the current request, if any.
+
+    Fetch functions run by HedgedFetch can pass it on, e.g. as the timeout of
+    a downstream call, so nested calls never outlive the caller's deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - asyncio.get_running_loop().time())
+
+
+def within_deadline(fetch: TimedFetch) -> Fetch:
+    """Wrap fetch(url, timeout=...) to time out at the current deadline.
+
+    E.g. HedgedFetch(within_deadline(fetcher.fetch)): each attempt's HTTP
+    timeout is what remains of the total budget, not the client default.
+    """
+
+    async def fetch_within_deadline(url: str) -> dict[str, Any]:
+        return await fetch(url, timeout=remaining_time())
+
+    return fetch_within_deadline
+
+
+class HedgedFetch:
+    """Fetch function wrapper sending a backup request for slow requests.
+
+    If an attempt has not completed within the percentile-th latency of
+    recent successful attempts, another one is started (up to max_attempts)
+    and the first successful attempt wins; the others are cancelled. With
+    percentile=95, about 5% more requests are sent, but the p99 drops close
+    to twice the p95 when slowness is random rather than load related.
+
+    A failed attempt starts the next one immediately. Every attempt runs
+    within the same total deadline (timeout seconds, or the deadline of an
+    enclosing HedgedFetch call if sooner), exposed through remaining_time().
+    Attempts are cancelled at the deadline, but the fetch function should
+    also pass remaining_time() on as the timeout of its own calls, e.g.
+    through within_deadline(), so downstream services stop working on them.
+    """
+
+    def __init__(
+            self,
+            fetch: Fetch,
+            percentile: float = 95,
+            max_attempts: int = 2,
+            initial_delay: float = 0.1,
+            min_samples: int = 20,
+            window: int = 1000,
+            timeout: float | None = None,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be in (0, 100)")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self._fetch = fetch
+        self._percentile = percentile
+        self._max_attempts = max_attempts
+        self._initial_delay = initial_delay
+        self._min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._timeout = timeout
+        self._attempts = self._hedges = self._hedge_wins = 0
+
+    @property
+    def hedge_delay(self) -> float:
+        """Delay before a backup attempt: the percentile of recent latencies."""
+        if len(self._latencies) < self._min_samples:
+            return self._initial_delay
+        latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self._percentile / 100))
+        return latencies[index]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "attempts": self._attempts,
+            "hedges": self._hedges,
+            "hedge_wins": self._hedge_wins,
+            "hedge_delay": self.hedge_delay,
+        }
+
+    async def _attempt(self, url: str) -> dict[str, Any]:
+        self._attempts += 1
+        start = time.perf_counter()
+        result = await self._fetch(url)
+        self._latencies.append(time.perf_counter() - start)
+        return result
+
+    async def __call__(self, url: str, timeout: float | None = None) -> dict[str, Any]:
+        """Fetch url with hedging, within timeout seconds if given."""
+        timeout = timeout if timeout is not None else self._timeout
+        deadline = _deadline.get()
+        if timeout is not None:
+            own_deadline = asyncio.get_running_loop().time() + timeout
+            deadline = own_deadline if deadline is None else min(deadline, own_deadline)
+        # Set before attempts start: their tasks copy the current context
+        token = _deadline.set(deadline)
+        try:
+            async with asyncio.timeout_at(deadline):
+                return await self._race(url)
+        finally:
+            _deadline.reset(token)
+
+    async def _race(self, url: str) -> dict[str, Any]:
+        first = asyncio.create_task(self._attempt(url))
+        pending = {first}
+        attempts = 1
+        error: BaseException | None = None
+        try:
+            while pending:
+                can_hedge = attempts < self._max_attempts
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        self._hedge_wins += task is not first
+                        return task.result()
+                if can_hedge:
+                    # Slow (timeout elapsed) or failed: start a backup attempt
+                    self._hedges += 1
+                    attempts += 1
+                    pending.add(asyncio.create_task(self._attempt(url)))
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def long_tail_delay(
+        fast: float = 0.01, slow: float = 0.3, slow_probability: float = 0.03
+) -> float:
+    """Server latency: usually fast, sometimes (GC pause, cold cache...) slow."""
+    if random.random() < slow_probability:
+        return slow
+    return fast * random.uniform(1, 1.5)
+
+
+async def measure_latencies(
+        fetch: Fetch, urls: list[str], max_concurrent: int = 20
+) -> list[float]:
+    latencies: list[float] = []
+
+    async def timed_fetch(url: str) -> dict[str, Any]:
+        start = time.perf_counter()
+        result = await fetch(url)
+        latencies.append(time.perf_counter() - start)
+        return result
+
+    await fetch_with_limit(urls, max_concurrent=max_concurrent, fetch=timed_fetch)
+    return latencies
+
+
+async def benchmark(requests: int = 1000) -> None:
+    """Compare p50/p99 latency with and without hedging on a long-tail server."""
+    with LocalHttpServer(delay=long_tail_delay) as server:
+        urls = [f"{server.url}/item/{i}" for i in range(requests)]
+        async with HttpFetcher() as fetcher:
+            hedged = HedgedFetch(within_deadline(fetcher.fetch), timeout=2.0)
+            # Warm up connections and hedged latency statistics
+            await measure_latencies(hedged, urls[:100])
+            for label, fetch in (("NO HEDGING", fetcher.fetch), ("HEDGED", hedged)):
+                server.reset_counters()
+                latencies = await measure_latencies(fetch, urls)
+                percentiles = statistics.quantiles(latencies, n=100)
+                print_header(label)
+                print(f"p50: {percentiles[49] * 1000:.1f}ms")
+                print(f"p99: {percentiles[98] * 1000:.1f}ms")
+                print(f"Server requests: {server.requests} for {requests} fetches")
+        print(f"Hedging: {hedged.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
@@ -8,8 +8,27 @@ using asyncio.Semaphore to avoid overwhelming external services.
 import asyncio
 import random
 import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
+from src.module_02_asyncio.exercice_02_semaphore.adaptive_limiter import (
+    AdaptiveLimiter,
+)
+from src.module_02_asyncio.exercice_02_semaphore.token_bucket import (
+    HostRateLimiter,
+    RateLimit,
+    RateLimiter,
+)
+
+Fetch = Callable[[str], Awaitable[dict[str, Any]]]
+
 
 async def fetch_url(url: str, delay: float = 0.3) -> dict[str, Any]:
     """Simulate fetching a URL with variable delay."""
@@ -20,6 +39,38 @@ async def fetch_url(url: str, delay: float = 0.3) -> dict[str, Any]:
     return {"url": url, "status": 200}
 
 
+async def _fetch_in_adaptive_slot(
+        limiter: AdaptiveLimiter,
+        fetch: Fetch,
+        url: str,
+        rate_limiter: RateLimiter | None,
+) -> dict[str, Any]:
+    """Fetch url holding a slot of limiter, feeding it the fetch latency only.
+
+    Waiting for a rate token is not upstream latency: timing it too would make
+    the limiter back off.
+    """
+    await limiter.acquire()
+    try:
+        if rate_limiter is not None:
+            await rate_limiter.acquire(url)
+    except BaseException:
+        limiter.release()
+        raise
+    start = time.monotonic()
+    try:
+        result = await fetch(url)
+    except Exception:
+        limiter.release(time.monotonic() - start, failed=True)
+        raise
+    except BaseException:
+        # Cancellation says nothing about the upstream
+        limiter.release()
+        raise
+    limiter.release(time.monotonic() - start)
+    return result
+
+
 # TODO(human): Implement fetch_with_limit
 # This function should:
 # - Create an asyncio.Semaphore with max_concurrent slots
@@ -38,6 +89,9 @@ async def fetch_url(url: str, delay: float = 0.3) -> dict[str, Any]:
 async def fetch_with_limit(
         urls: list[str],
         max_concurrent: int = 3,
+        rate_limiter: RateLimiter | None = None,
+        limiter: AbstractAsyncContextManager[Any] | None = None,
+        fetch: Fetch = fetch_url,
 ) -> list[dict[str, Any]]:
     """
     Fetch all URLs with a maximum number of concurrent requests.
@@ -45,19 +99,129 @@ async def fetch_with_limit(
     Args:
         urls: List of URLs to fetch
         max_concurrent: Maximum number of simultaneous requests
+        rate_limiter: Optional per-host requests per second limit, on top of
+            the concurrency limit
+        limiter: Concurrency limiter replacing Semaphore(max_concurrent),
+            e.g. an AdaptiveLimiter
+        fetch: Coroutine function fetching a URL, e.g. a CachedFetch
 
     Returns:
         List of fetch results
     """
-    semaphore = asyncio.Semaphore(max_concurrent)
+    semaphore = limiter or asyncio.Semaphore(max_concurrent)
 
     async def fetch_one(url: str) -> dict[str, Any]:
+        if isinstance(semaphore, AdaptiveLimiter):
+            return await _fetch_in_adaptive_slot(semaphore, fetch, url, rate_limiter)
+        # Rate token once holding a slot: tokens taken while waiting for one
+        # would all be spent at once when slots free up, exceeding the rate
         async with semaphore:
-            return await fetch_url(url)
+            if rate_limiter is not None:
+                await rate_limiter.acquire(url)
+            return await fetch(url)
 
     return await asyncio.gather(*(fetch_one(url) for url in urls))
 
 
+async def _iterate(urls: Iterable[str] | AsyncIterable[str]) -> AsyncIterator[str]:
+    if isinstance(urls, AsyncIterable):
+        async for url in urls:
+            yield url
+    else:
+        for url in urls:
+            yield url
+
+
+async def stream_with_limit(
+        urls: Iterable[str] | AsyncIterable[str],
+        max_concurrent: int = 3,
+        ordered: bool = False,
+        fetch: Fetch = fetch_url,
+        rate_limiter: RateLimiter | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Fetch URLs with max_concurrent workers, yielding results as they complete.
+
+    Unlike fetch_with_limit, URLs are pulled lazily from a bounded queue by a
+    fixed number of workers: memory is O(max_concurrent) whatever the number
+    of URLs, and urls may be an infinite or asynchronous iterable.
+
+    Args:
+        urls: (Async) iterable of URLs to fetch
+        max_concurrent: Number of workers, i.e. simultaneous requests
+        ordered: Yield results in URL order instead of completion order
+        fetch: Coroutine function fetching a URL
+        rate_limiter: Optional per-host requests per second limit
+
+    Yields:
+        Fetch results. The first fetch error is raised after cancelling the
+        remaining fetches.
+    """
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be >= 1")
+    # URLs pulled but not yielded yet (queued, in flight or buffered for
+    # ordering): bounds memory even when a slow URL holds back ordered results
+    window = asyncio.Semaphore(2 * max_concurrent)
+    pending: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(max_concurrent)
+    done: asyncio.Queue[tuple[int, dict[str, Any]] | Exception | None] = (
+        asyncio.Queue()
+    )
+
+    async def feed() -> None:
+        try:
+            index = 0
+            async for url in _iterate(urls):
+                await window.acquire()
+                await pending.put((index, url))
+                index += 1
+        except Exception as error:
+            await done.put(error)
+            return
+        for _ in range(max_concurrent):
+            await pending.put(None)
+
+    async def work() -> None:
+        while (item := await pending.get()) is not None:
+            index, url = item
+            try:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(url)
+                result = await fetch(url)
+            except Exception as error:
+                await done.put(error)
+                return
+            await done.put((index, result))
+        await done.put(None)
+
+    tasks = [asyncio.create_task(feed())]
+    tasks += [asyncio.create_task(work()) for _ in range(max_concurrent)]
+    buffered: dict[int, dict[str, Any]] = {}
+    next_index = 0
+    running = max_concurrent
+    try:
+        while running:
+            item = await done.get()
+            if item is None:
+                running -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            index, result = item
+            if not ordered:
+                window.release()
+                yield result
+                continue
+            buffered[index] = result
+            while next_index in buffered:
+                window.release()
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def demo() -> None:
     """Demonstrate the difference between unlimited and limited concurrency."""
     urls = [f"https://api.example.com/item/{i}" for i in range(10)]
@@ -74,9 +238,34 @@ async def demo() -> None:
     limited_duration = time.perf_counter() - start
     print(f"Duration: {limited_duration:.2f}s")
 
+    print_header("STREAMING (3 workers, results as they complete)")
+    start = time.perf_counter()
+    async for result in stream_with_limit(iter(urls), max_concurrent=3):
+        print(f"  == Got: {result['url']}")
+    streaming_duration = time.perf_counter() - start
+    print(f"Duration: {streaming_duration:.2f}s")
+
+    print_header("RATE LIMITED (max 3 at a time, 5 req/s, bursts of 2)")
+    start = time.perf_counter()
+    await fetch_with_limit(
+        urls, max_concurrent=3, rate_limiter=HostRateLimiter(RateLimit(5, burst=2))
+    )
+    rate_limited_duration = time.perf_counter() - start
+    print(f"Duration: {rate_limited_duration:.2f}s")
+
+    print_header("ADAPTIVE CONCURRENCY (starting at 3 at a time)")
+    adaptive = AdaptiveLimiter(initial_limit=3)
+    start = time.perf_counter()
+    await fetch_with_limit(urls, limiter=adaptive)
+    adaptive_duration = time.perf_counter() - start
+    print(f"Duration: {adaptive_duration:.2f}s, limit: {adaptive.metrics()}")
+
     print_header(
         f"Unlimited: {unlimited_duration:.2f}s (all parallel)",
         f"Limited:   {limited_duration:.2f}s (batches of 3)",
+        f"Streaming: {streaming_duration:.2f}s (3 workers)",
+        f"Rate:      {rate_limited_duration:.2f}s (2 at once, then 1 every 0.2s)",
+        f"Adaptive:  {adaptive_duration:.2f}s (limit raised while latency is flat)",
     )
 
 
@@ -0,0 +1,144 @@
+"""Async token-bucket rate limiting, with one bucket per host."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Protocol
+from urllib.parse import urlsplit
+
+
+class RateLimiter(Protocol):
+    """Common interface of per-host rate limiters."""
+
+    async def acquire(self, url: str) -> None: ...
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained requests per second, and requests allowed in a burst."""
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be > 0")
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+
+
+class TokenBucket:
+    """Token bucket limiting acquisitions to a rate, with bursts.
+
+    The bucket holds up to burst tokens and refills at rate tokens per
+    second; each acquisition takes a token. Waiting callers are queued and
+    woken in FIFO order by a single timer set to when the next token is due,
+    instead of polling.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self._limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._limit.burst, self._tokens + (now - self._updated) * self._limit.rate
+        )
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available and nobody is waiting before us."""
+        self._prune()
+        if self._waiters:
+            return False
+        self._refill()
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def acquire(self) -> None:
+        """Wait for a token."""
+        if self.try_acquire():
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._schedule()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Cancelled after being granted a token: hand it to the next
+                self._tokens += 1
+                self._wake()
+            raise
+
+    def _schedule(self) -> None:
+        if self._timer is not None or not self._waiters:
+            return
+        self._refill()
+        delay = max(0.0, (1 - self._tokens) / self._limit.rate)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._wake()
+
+    def _wake(self) -> None:
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                # Cancelled while waiting
+                continue
+            self._tokens -= 1
+            waiter.set_result(None)
+        self._prune()
+        self._schedule()
+
+    def _prune(self) -> None:
+        # Drop waiters cancelled at the head of the queue: then the queue is
+        # empty or starts with a live waiter, without scanning it
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+
+
+class HostRateLimiter:
+    """Token buckets keyed by URL host.
+
+    Hosts listed in per_host get their own limit (e.g. their published RPS
+    limit); other hosts each get a bucket with the default limit.
+    """
+
+    def __init__(
+            self, default: RateLimit, per_host: Mapping[str, RateLimit] | None = None
+    ) -> None:
+        self._default = default
+        self._per_host = dict(per_host or {})
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self._per_host.get(host, self._default))
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the host of url is allowed."""
+        await self.bucket(urlsplit(url).hostname or url).acquire()
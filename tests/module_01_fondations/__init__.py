@@ -0,0 +1 @@
+# Module 01 tests
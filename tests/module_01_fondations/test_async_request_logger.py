@@ -0,0 +1,145 @@
+import threading
+
+import pytest
+
+from src.module_01_fondations.async_request_logger import AsyncRequestLogger
+from src.module_01_fondations.memory_leak_demo import (
+    LeakyRequestLogger,
+    RequestLog,
+)
+
+
+class BlockingRequestLogger(LeakyRequestLogger):
+    """Request logger whose storage waits until released by the test."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = threading.Event()
+
+    def log(self, request_id: int, path: str, payload: str) -> None:
+        self.released.wait(timeout=5)
+        super().log(request_id, path, payload)
+
+
+class TestAsyncRequestLogger:
+    """Test off-hot-path asynchronous request logger."""
+
+    def test_flush_should_store_all_enqueued_logs(self):
+        """Test that enqueued logs reach the wrapped logger."""
+        with AsyncRequestLogger(LeakyRequestLogger()) as logger:
+            for i in range(500):
+                logger.log(i, "/", "x")
+
+            assert logger.flush(timeout=5)
+            assert logger.log_count == 500
+            assert logger.pending_count == 0
+
+    def test_close_should_store_pending_logs(self):
+        """Test that closing the logger drains the queue."""
+        wrapped = LeakyRequestLogger()
+        logger = AsyncRequestLogger(wrapped, flush_interval=0.1)
+
+        for i in range(10):
+            logger.log(i, "/", "x")
+        logger.close()
+
+        assert wrapped.log_count == 10
+
+    def test_persist_should_receive_batches_of_records(self):
+        """Test that stored records are passed to the persist callback."""
+        persisted: list[RequestLog] = []
+
+        with AsyncRequestLogger(
+                LeakyRequestLogger(), batch_size=3, persist=persisted.extend
+        ) as logger:
+            for i in range(7):
+                logger.log(i, "/", "x")
+            logger.flush(timeout=5)
+
+        assert persisted == [RequestLog(i, "/", "x") for i in range(7)]
+
+    def test_log_should_drop_logs_when_queue_is_full(self):
+        """Test the drop overflow policy."""
+        wrapped = BlockingRequestLogger()
+        logger = AsyncRequestLogger(wrapped, max_queue_size=5, overflow="drop")
+
+        for i in range(100):
+            logger.log(i, "/", "x")
+        wrapped.released.set()
+        logger.close()
+
+        assert logger.dropped_count > 0
+        assert wrapped.log_count + logger.dropped_count == 100
+
+    def test_log_should_block_when_queue_is_full(self):
+        """Test the block overflow policy never loses logs."""
+        with AsyncRequestLogger(
+                LeakyRequestLogger(), max_queue_size=5, overflow="block"
+        ) as logger:
+            for i in range(100):
+                logger.log(i, "/", "x")
+            logger.flush(timeout=5)
+
+            assert logger.dropped_count == 0
+            assert logger.log_count == 100
+
+    @pytest.mark.parametrize(
+        "overflow",
+        [pytest.param("drop", id="drop"), pytest.param("block", id="block")],
+    )
+    def test_persist_error_should_not_stop_background_thread(self, overflow):
+        """Test that a failing batch is logged and later logs still stored."""
+        persisted: list[RequestLog] = []
+
+        def persist(batch: list[RequestLog]) -> None:
+            if batch[0].request_id == 0:
+                raise OSError("disk full")
+            persisted.extend(batch)
+
+        with AsyncRequestLogger(
+                LeakyRequestLogger(),
+                max_queue_size=5,
+                overflow=overflow,
+                batch_size=1,
+                persist=persist,
+        ) as logger:
+            for i in range(20):
+                logger.log(i, "/", "x")
+            assert logger.flush(timeout=5)
+
+        assert logger.error_count == 1
+        assert len(persisted) + logger.dropped_count == 19
+        assert all(log.request_id > 0 for log in persisted)
+
+    def test_log_should_not_block_when_worker_is_dead(self):
+        """Test that the block policy drops logs instead of hanging."""
+        logger = AsyncRequestLogger(
+            BlockingRequestLogger(), max_queue_size=5, overflow="block"
+        )
+        logger._worker = threading.Thread(target=lambda: None)
+
+        for i in range(10):
+            logger.log(i, "/", "x")
+
+        assert logger.dropped_count > 0
+
+    def test_log_should_raise_after_close(self):
+        """Test that logging to a closed logger fails explicitly."""
+        logger = AsyncRequestLogger(LeakyRequestLogger())
+        logger.close()
+
+        with pytest.raises(RuntimeError):
+            logger.log(1, "/", "x")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"max_queue_size": 0}, id="max_queue_size"),
+            pytest.param({"batch_size": 0}, id="batch_size"),
+            pytest.param({"flush_interval": 0}, id="flush_interval"),
+        ],
+    )
+    def test_init_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            AsyncRequestLogger(LeakyRequestLogger(), **kwargs)
@@ -0,0 +1,57 @@
+import pytest
+
+from src.module_01_fondations.compact_request_logger import CompactRequestLogger
+from src.module_01_fondations.memory_leak_demo import RequestLog
+
+
+class TestCompactRequestLogger:
+    """Test structure-of-arrays request log storage."""
+
+    def test_getitem_should_return_views_from_oldest_to_newest(self):
+        """Test index access, including negative indexes."""
+        logger = CompactRequestLogger(max_size=10)
+        logger.log(1, "/api/users/1", "payload-1")
+        logger.log(2, "/api/users/é", "")
+
+        assert logger[0].to_request_log() == RequestLog(1, "/api/users/1", "payload-1")
+        assert logger[-1].request_id == 2
+        assert logger[-1].path == "/api/users/é"
+        assert logger[-1].payload == ""
+
+    def test_getitem_should_raise_index_error_out_of_range(self):
+        """Test that out of range indexes are rejected."""
+        logger = CompactRequestLogger(max_size=10)
+        logger.log(1, "/", "x")
+
+        with pytest.raises(IndexError):
+            logger[1]
+        with pytest.raises(IndexError):
+            logger[-2]
+
+    def test_log_should_rotate_logs_beyond_max_size(self):
+        """Test the same rotation semantics as BoundedRequestLogger."""
+        logger = CompactRequestLogger(max_size=3)
+
+        for i in range(5):
+            logger.log(i, f"/api/users/{i}", "x" * i)
+
+        assert logger.log_count == len(logger) == 3
+        assert [log.to_request_log() for log in logger] == [
+            RequestLog(i, f"/api/users/{i}", "x" * i) for i in range(2, 5)
+        ]
+
+    def test_log_should_trim_bytes_of_evicted_logs(self):
+        """Test that shared data stays bounded by twice the live data."""
+        logger = CompactRequestLogger(max_size=10)
+
+        for i in range(10_000):
+            logger.log(i, "/", "x" * 100)
+
+        assert len(logger._data) <= 2 * logger._live_bytes
+        assert [log.request_id for log in logger] == list(range(9_990, 10_000))
+        assert logger[0].payload == "x" * 100
+
+    def test_init_should_reject_invalid_max_size(self):
+        """Test that max_size must be positive."""
+        with pytest.raises(ValueError):
+            CompactRequestLogger(max_size=0)
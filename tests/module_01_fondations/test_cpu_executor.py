@@ -0,0 +1,79 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.module_01_fondations import cpu_executor
+from src.module_01_fondations.cpu_executor import (
+    create_cpu_executor,
+    find_crossover,
+    select_cpu_executor_kind,
+)
+from src.module_01_fondations.gil_demo import sum_of_squares
+
+
+class TestCpuExecutor:
+    """Test free-threading aware CPU executor factory."""
+
+    @pytest.mark.parametrize(
+        ("gil_enabled", "kind"),
+        [
+            pytest.param(True, "process", id="gil"),
+            pytest.param(False, "thread", id="free_threaded"),
+        ],
+    )
+    def test_select_cpu_executor_kind_should_depend_on_gil(
+            self, monkeypatch, gil_enabled, kind
+    ):
+        """Test that threads are selected only without the GIL."""
+        monkeypatch.setattr(cpu_executor, "is_gil_enabled", lambda: gil_enabled)
+
+        assert select_cpu_executor_kind() == kind
+
+    @pytest.mark.parametrize(
+        ("kind", "executor_class"),
+        [
+            pytest.param("thread", ThreadPoolExecutor, id="thread"),
+            pytest.param("process", ProcessPoolExecutor, id="process"),
+        ],
+    )
+    def test_create_cpu_executor_should_expose_the_same_api(
+            self, kind, executor_class
+    ):
+        """Test that both executor kinds run submit and map."""
+        with create_cpu_executor(max_workers=2, kind=kind) as executor:
+            assert isinstance(executor, executor_class)
+            assert executor.submit(sum_of_squares, 4).result() == 14
+            assert list(executor.map(sum_of_squares, [2, 3])) == [1, 5]
+
+    def test_find_crossover_should_return_size_from_which_processes_win(
+            self, monkeypatch
+    ):
+        """Test crossover detection from benchmark medians."""
+        timings = {
+            (100, "threads"): 0.1,
+            (100, "process_pool"): 0.5,
+            (1000, "threads"): 1.0,
+            (1000, "process_pool"): 0.6,
+            (10000, "threads"): 10.0,
+            (10000, "process_pool"): 3.0,
+        }
+
+        calls = []
+
+        def fake_run_benchmark(**kwargs):
+            calls.append(kwargs)
+            return {
+                "environment": {},
+                "results": [
+                    {"iterations": size, "strategy": strategy, "median": median}
+                    for (size, strategy), median in timings.items()
+                ],
+            }
+
+        monkeypatch.setattr(cpu_executor, "run_benchmark", fake_run_benchmark)
+
+        assert find_crossover(sizes=[100, 1000, 10000], workers=2)["crossover"] == 1000
+        [kwargs] = calls
+        assert kwargs["strategies"] == ["threads", "process_pool"]
+        assert kwargs["workers"] == [2]
+        assert kwargs["sizes"] == [100, 1000, 10000]
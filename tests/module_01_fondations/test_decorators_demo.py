@@ -0,0 +1,580 @@
+import asyncio
+import contextlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.module_01_fondations import decorators_demo
+from src.module_01_fondations.decorators_demo import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ProfileBuffer,
+    RetryBudget,
+    cached,
+    profiled,
+    retry,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record sync and async sleeps, advancing a fake clock instead of waiting."""
+    recorded: list[float] = []
+
+    def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    async def fake_async_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    monkeypatch.setattr(decorators_demo.time, "sleep", fake_sleep)
+    monkeypatch.setattr(decorators_demo.time, "monotonic", lambda: sum(recorded))
+    monkeypatch.setattr(decorators_demo.asyncio, "sleep", fake_async_sleep)
+    return recorded
+
+
+def flaky(side_effect: object) -> Mock:
+    """Return a mock function with the given side effect."""
+    func = Mock(side_effect=side_effect)
+    func.__name__ = "flaky"
+    return func
+
+
+class TestRetry:
+    """Test retry decorator."""
+
+    def test_retry_should_return_first_successful_result(self, sleeps):
+        """Test that failures are retried until success."""
+        func = flaky([ConnectionError, ConnectionError, "ok"])
+
+        assert retry(attempts=3, delay=0.1)(func)() == "ok"
+        assert func.call_count == 3
+        assert sleeps == [0.1, 0.1]
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_retry_should_raise_last_error_after_all_attempts(self):
+        """Test that the last exception is raised once attempts are exhausted."""
+        func = flaky(ConnectionError("down"))
+
+        with pytest.raises(ConnectionError, match="down"):
+            retry(attempts=3, delay=0.1)(func)()
+        assert func.call_count == 3
+
+    def test_retry_should_back_off_exponentially_up_to_max_delay(self, sleeps):
+        """Test exponential backoff without jitter."""
+        func = flaky(ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            retry(attempts=5, delay=0.1, backoff=2, max_delay=0.5)(func)()
+        assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.5])
+
+    @pytest.mark.parametrize("jitter", ["full", "decorrelated"])
+    def test_retry_should_randomize_delays_within_bounds(self, sleeps, jitter):
+        """Test that jittered delays stay within [0, max_delay]."""
+        func = flaky(ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            retry(attempts=20, delay=0.1, backoff=2, max_delay=1, jitter=jitter)(func)()
+        assert len(sleeps) == 19
+        assert all(0 <= pause <= 1 for pause in sleeps)
+        assert len(set(sleeps)) > 1
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_retry_should_only_retry_selected_exceptions(self):
+        """Test that other exceptions are raised immediately."""
+        func = flaky(ValueError)
+
+        with pytest.raises(ValueError):
+            retry(attempts=3, retry_on=(ConnectionError,))(func)()
+        assert func.call_count == 1
+
+    def test_retry_should_stop_before_exceeding_max_total_time(self, sleeps):
+        """Test that no retry is attempted past max_total_time."""
+        func = flaky(ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            retry(attempts=10, delay=1, backoff=2, max_total_time=5)(func)()
+        assert sleeps == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_retry_should_await_coroutine_functions(self, sleeps):
+        """Test that async functions are retried with asyncio.sleep."""
+        func = AsyncMock(side_effect=[ConnectionError, "ok"])
+
+        async def call() -> str:
+            return await func()
+
+        assert await retry(attempts=3, delay=0.1)(call)() == "ok"
+        assert func.await_count == 2
+        assert sleeps == [0.1]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"attempts": 0}, id="attempts"),
+            pytest.param({"attempts": 1, "delay": -1}, id="delay"),
+            pytest.param({"attempts": 1, "backoff": 0.5}, id="backoff"),
+            pytest.param({"attempts": 1, "delay": 1, "max_delay": 0.5}, id="max_delay"),
+        ],
+    )
+    def test_retry_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            retry(**kwargs)
+
+
+class TestCached:
+    """Test cached decorator."""
+
+    def test_cached_should_call_function_once_per_arguments(self):
+        """Test that results are memoized by arguments."""
+        func = flaky(lambda x, scale=1: x * scale)
+        cached_func = cached()(func)
+
+        assert cached_func(2) == 2
+        assert cached_func(2) == 2
+        assert cached_func(2, scale=3) == 6
+        assert func.call_count == 2
+        assert cached_func.cache_info()[:2] == (1, 2)
+
+    def test_cached_should_evict_least_recently_used_entries(self):
+        """Test the LRU size cap."""
+        func = flaky(lambda x: x)
+        cached_func = cached(max_size=2)(func)
+
+        cached_func(1)
+        cached_func(2)
+        cached_func(1)
+        cached_func(3)
+        cached_func(1)
+        cached_func(2)
+
+        assert func.call_count == 4
+        assert cached_func.cache_info().evictions == 2
+        assert cached_func.cache_info().size == 2
+
+    def test_cached_should_expire_entries_after_ttl(self, monkeypatch):
+        """Test per-entry TTL."""
+        now = [0.0]
+        monkeypatch.setattr(decorators_demo.time, "monotonic", lambda: now[0])
+        func = flaky(lambda x: x)
+        cached_func = cached(ttl=10)(func)
+
+        cached_func(1)
+        now[0] = 5
+        cached_func(1)
+        now[0] = 11
+        cached_func(1)
+
+        assert func.call_count == 2
+        assert cached_func.cache_info().evictions == 1
+
+    def test_cached_should_not_cache_exceptions(self):
+        """Test that failures are retried on the next call."""
+        func = flaky([ConnectionError, "ok"])
+        cached_func = cached()(func)
+
+        with pytest.raises(ConnectionError):
+            cached_func()
+        assert cached_func() == "ok"
+
+    def test_cached_should_coalesce_concurrent_calls(self):
+        """Test single-flight: concurrent callers share one underlying call."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_backend(key: str) -> str:
+            started.set()
+            release.wait(timeout=5)
+            return key.upper()
+
+        func = flaky(slow_backend)
+        cached_func = cached()(func)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            first = executor.submit(cached_func, "key")
+            started.wait(timeout=5)
+            others = [executor.submit(cached_func, "key") for _ in range(9)]
+            while cached_func.cache_info().coalesced < 9:
+                time.sleep(0.001)
+            release.set()
+            results = [first.result()] + [future.result() for future in others]
+
+        assert results == ["KEY"] * 10
+        assert func.call_count == 1
+        assert cached_func.cache_info().coalesced == 9
+
+    @pytest.mark.asyncio
+    async def test_cached_should_coalesce_concurrent_coroutines(self):
+        """Test single-flight for async functions."""
+        calls = 0
+
+        @cached(ttl=60)
+        async def fetch(key: str) -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return key.upper()
+
+        results = await asyncio.gather(*(fetch("key") for _ in range(10)))
+
+        assert results == ["KEY"] * 10
+        assert calls == 1
+        assert fetch.cache_info().coalesced == 9
+        assert await fetch("key") == "KEY"
+        assert fetch.cache_info().hits == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"max_size": 0}, id="max_size"),
+            pytest.param({"ttl": 0}, id="ttl"),
+        ],
+    )
+    def test_cached_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            cached(**kwargs)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker decorator."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(decorators_demo.time, "monotonic", lambda: now[0])
+        return now
+
+    @pytest.mark.usefixtures("clock")
+    def test_breaker_should_open_when_failure_rate_reaches_threshold(self):
+        """Test that the circuit opens once enough calls failed."""
+        breaker = CircuitBreaker(failure_threshold=0.5, window_size=4, min_calls=4)
+        func = flaky([ConnectionError, "ok", ConnectionError, ConnectionError])
+        guarded = breaker(func)
+
+        for _ in range(4):
+            with contextlib.suppress(ConnectionError):
+                guarded()
+
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            guarded()
+        assert func.call_count == 4
+        assert breaker.rejected_count == 1
+
+    @pytest.mark.usefixtures("clock")
+    def test_breaker_should_stay_closed_below_min_calls(self):
+        """Test that a few failures don't open the circuit."""
+        breaker = CircuitBreaker(window_size=10, min_calls=5)
+        guarded = breaker(flaky(ConnectionError))
+
+        for _ in range(4):
+            with pytest.raises(ConnectionError):
+                guarded()
+
+        assert breaker.state == "closed"
+        assert breaker.failure_rate == 1.0
+
+    def test_breaker_should_close_after_successful_trial_call(self, clock):
+        """Test the half-open state after the cooldown."""
+        breaker = CircuitBreaker(window_size=2, min_calls=2, reset_timeout=10)
+        guarded = breaker(flaky([ConnectionError, ConnectionError, "ok"]))
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                guarded()
+
+        clock[0] = 10
+
+        assert breaker.state == "half_open"
+        assert guarded() == "ok"
+        assert breaker.state == "closed"
+
+    def test_breaker_should_reopen_after_failed_trial_call(self, clock):
+        """Test that a failing trial call opens the circuit again."""
+        breaker = CircuitBreaker(window_size=2, min_calls=2, reset_timeout=10)
+        guarded = breaker(flaky(ConnectionError))
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                guarded()
+
+        clock[0] = 10
+        with pytest.raises(ConnectionError):
+            guarded()
+
+        assert breaker.state == "open"
+        clock[0] = 15
+        with pytest.raises(CircuitOpenError):
+            guarded()
+
+    def test_breaker_should_ignore_outcome_of_call_admitted_in_other_state(
+            self, clock
+    ):
+        """Test that a call admitted while closed is not taken as a trial call."""
+        breaker = CircuitBreaker(window_size=2, min_calls=2, reset_timeout=10)
+        failing = breaker(flaky(ConnectionError))
+
+        @breaker
+        def slow_call() -> str:
+            # While this call runs, the circuit opens and its cooldown elapses
+            for _ in range(2):
+                with contextlib.suppress(ConnectionError):
+                    failing()
+            clock[0] = 10
+            return "ok"
+
+        assert slow_call() == "ok"
+        assert breaker.state == "half_open"
+
+    @pytest.mark.usefixtures("clock")
+    def test_breaker_should_ignore_exceptions_not_in_failure_on(self):
+        """Test that only selected exceptions count as failures."""
+        breaker = CircuitBreaker(window_size=2, min_calls=2, failure_on=(OSError,))
+        guarded = breaker(flaky(ValueError))
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                guarded()
+
+        assert breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_breaker_should_not_close_on_cancelled_trial_call(self, clock):
+        """Test that a cancelled trial call is neutral and frees its slot."""
+        breaker = CircuitBreaker(window_size=1, min_calls=1, reset_timeout=10)
+        started = asyncio.Event()
+
+        @breaker
+        async def fetch(fail: bool) -> str:
+            if fail:
+                raise ConnectionError
+            started.set()
+            await asyncio.sleep(10)
+            return "ok"
+
+        with pytest.raises(ConnectionError):
+            await fetch(fail=True)
+        clock[0] = 10
+        trial = asyncio.create_task(fetch(fail=False))
+        await started.wait()
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        assert breaker.state == "half_open"
+        with pytest.raises(ConnectionError):
+            await fetch(fail=True)
+        assert breaker.state == "open"
+
+    @pytest.mark.usefixtures("clock", "sleeps")
+    def test_breaker_should_count_a_retry_sequence_as_one_call(self):
+        """Test composition with retry: no retry while the circuit is open."""
+        breaker = CircuitBreaker(window_size=2, min_calls=2)
+        func = flaky(ConnectionError)
+        guarded = breaker(retry(attempts=3, delay=0.1)(func))
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                guarded()
+        with pytest.raises(CircuitOpenError):
+            guarded()
+
+        assert func.call_count == 6
+
+    @pytest.mark.usefixtures("clock")
+    @pytest.mark.asyncio
+    async def test_breaker_should_guard_coroutine_functions(self):
+        """Test that async functions are supported."""
+        breaker = CircuitBreaker(window_size=1, min_calls=1)
+
+        @breaker
+        async def fetch() -> None:
+            raise ConnectionError
+
+        with pytest.raises(ConnectionError):
+            await fetch()
+        with pytest.raises(CircuitOpenError):
+            await fetch()
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"failure_threshold": 0}, id="failure_threshold"),
+            pytest.param({"window_size": 5, "min_calls": 6}, id="min_calls"),
+            pytest.param({"reset_timeout": -1}, id="reset_timeout"),
+            pytest.param({"half_open_max_calls": 0}, id="half_open_max_calls"),
+        ],
+    )
+    def test_breaker_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            CircuitBreaker(**kwargs)
+
+
+class TestRetryBudget:
+    """Test shared retry budget."""
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_budget_should_grant_retries_up_to_ratio_of_requests(self):
+        """Test that retries are capped at a fraction of requests."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=10)
+        for _ in range(10):
+            budget.try_acquire()  # Spend initial tokens
+
+        for _ in range(10):
+            budget.record_request()
+        granted = sum(budget.try_acquire() for _ in range(10))
+
+        assert granted == 5
+        assert budget.metrics()["retries_denied"] == 5
+
+    def test_budget_should_refill_over_time(self, sleeps):
+        """Test the minimum retry rate at low traffic."""
+        budget = RetryBudget(ratio=0, min_retries_per_second=2, max_tokens=1)
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+        sleeps.append(0.5)
+
+        assert budget.try_acquire()
+
+    @pytest.mark.usefixtures("sleeps")
+    def test_budget_should_be_shared_by_decorated_functions(self):
+        """Test that a spent budget stops retries of every function."""
+        budget = RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=2)
+        first = flaky(ConnectionError)
+        second = flaky(ConnectionError)
+
+        with pytest.raises(ConnectionError):
+            retry(attempts=3, budget=budget)(first)()
+        with pytest.raises(ConnectionError):
+            retry(attempts=3, budget=budget)(second)()
+
+        assert first.call_count == 3
+        assert second.call_count == 1
+        assert budget.metrics()["requests"] == 2
+        assert budget.retries_granted == 2
+        assert budget.retries_denied == 1
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"ratio": -1}, id="ratio"),
+            pytest.param({"min_retries_per_second": -1}, id="min_retries"),
+            pytest.param({"max_tokens": 0}, id="max_tokens"),
+        ],
+    )
+    def test_budget_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            RetryBudget(**kwargs)
+
+
+class TestProfiled:
+    """Test threshold-triggered profiling."""
+
+    def test_profiled_should_keep_stats_of_calls_above_threshold(self):
+        """Test that slow calls are profiled and stored."""
+        buffer = ProfileBuffer()
+
+        @profiled(threshold=0.01, buffer=buffer)
+        def slow() -> str:
+            time.sleep(0.02)
+            return "done"
+
+        assert slow() == "done"
+
+        [profile] = buffer.slowest()
+        assert profile.label == slow.__qualname__
+        assert profile.duration >= 0.02
+        assert "sleep" in profile.report()
+
+    def test_profiled_should_drop_stats_of_fast_calls(self):
+        """Test that calls below the threshold are not kept."""
+        buffer = ProfileBuffer()
+
+        with profiled(threshold=1, label="fast", buffer=buffer):
+            pass
+
+        assert buffer.slowest() == []
+
+    def test_buffer_should_keep_the_slowest_profiles(self):
+        """Test the bounded buffer of slowest profiles."""
+        buffer = ProfileBuffer(max_size=2)
+
+        for duration in (0.01, 0.02, 0.005, 0.03):
+            with profiled(threshold=0, label=str(duration), buffer=buffer):
+                time.sleep(duration)
+
+        assert [profile.label for profile in buffer.slowest()] == ["0.03", "0.02"]
+
+    def test_profiled_should_only_profile_outermost_block(self):
+        """Test that nested profiled blocks don't start a second profiler."""
+        buffer = ProfileBuffer()
+
+        with (
+            profiled(threshold=0, label="outer", buffer=buffer),
+            profiled(threshold=0, label="inner", buffer=buffer),
+        ):
+            pass
+
+        assert [profile.label for profile in buffer.slowest()] == ["outer"]
+
+    def test_profiled_should_support_nested_reuse_of_a_block(self):
+        """Test that a block entered twice times and profiles each entry."""
+        buffer = ProfileBuffer()
+        block = profiled(threshold=0, label="outer", buffer=buffer)
+
+        with block:
+            with block:
+                pass
+            time.sleep(0.02)
+
+        [profile] = buffer.slowest()
+        assert profile.duration >= 0.02
+
+    def test_profiled_should_not_fail_concurrent_calls(self):
+        """Test that calls in several threads run, one profiled at a time."""
+        buffer = ProfileBuffer()
+        barrier = threading.Barrier(4)
+
+        @profiled(threshold=0, buffer=buffer)
+        def work() -> str:
+            barrier.wait(timeout=5)
+            time.sleep(0.01)
+            return "done"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: work(), range(4)))
+
+        assert results == ["done"] * 4
+        assert len(buffer.slowest()) == 1
+
+    def test_profiled_should_run_unprofiled_when_enable_fails(self, monkeypatch):
+        """Test that another active profiling tool never fails the call."""
+
+        class ActiveProfiler:
+            def enable(self) -> None:
+                raise ValueError("Another profiling tool is already active")
+
+        buffer = ProfileBuffer()
+        monkeypatch.setattr(decorators_demo.cProfile, "Profile", ActiveProfiler)
+        with profiled(threshold=0, label="unprofiled", buffer=buffer):
+            pass
+        monkeypatch.undo()
+        with profiled(threshold=0, label="profiled", buffer=buffer):
+            pass
+
+        assert [profile.label for profile in buffer.slowest()] == ["profiled"]
+
+    def test_profiled_should_reject_coroutine_functions(self):
+        """Test that async functions are rejected."""
+
+        async def fetch() -> None:
+            pass
+
+        with pytest.raises(TypeError):
+            profiled(threshold=0)(fetch)
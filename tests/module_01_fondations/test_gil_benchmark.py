@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from src.module_01_fondations.gil_benchmark import main, run_benchmark, summarize
+
+
+class TestGilBenchmark:
+    """Test GIL benchmark suite."""
+
+    def test_summarize_should_compute_median_and_iqr(self):
+        """Test statistics of timing samples."""
+        result = summarize("threads", 2, [10, 10], [1.0, 2.0, 3.0, 4.0, 100.0])
+
+        assert result.median == 3.0
+        assert result.q1 == 2.0
+        assert result.q3 == 4.0
+        assert result.iqr == 2.0
+        assert result.iterations == 20
+
+    def test_summarize_should_accept_a_single_sample(self):
+        """Test that a single run has no dispersion."""
+        result = summarize("sequential", 1, [10], [1.5])
+
+        assert result.median == 1.5
+        assert result.iqr == 0
+
+    def test_run_benchmark_should_report_each_strategy_and_worker_count(self):
+        """Test the shape of the benchmark report."""
+        report = run_benchmark(
+            strategies=["sequential", "threads"],
+            workers=[1, 2],
+            sizes=[1000],
+            tasks_per_size=4,
+            repeats=2,
+            warmup=0,
+        )
+
+        assert "gil_enabled" in report["environment"]
+        assert [(r["strategy"], r["workers"]) for r in report["results"]] == [
+            ("sequential", 1),
+            ("threads", 1),
+            ("threads", 2),
+        ]
+        assert all(len(r["samples"]) == 2 for r in report["results"])
+
+    def test_run_benchmark_should_reject_unavailable_strategies(self):
+        """Test that unknown strategies are rejected."""
+        with pytest.raises(ValueError):
+            run_benchmark(strategies=["gpu"])
+
+    def test_main_should_write_json_report(self, tmp_path):
+        """Test the command line interface."""
+        output = tmp_path / "results.json"
+
+        main(
+            [
+                "--strategies", "sequential",
+                "--sizes", "1000",
+                "--repeats", "1",
+                "--output", str(output),
+            ]
+        )
+
+        assert json.loads(output.read_text())["results"][0]["strategy"] == "sequential"
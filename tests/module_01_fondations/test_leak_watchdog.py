@@ -0,0 +1,91 @@
+import tracemalloc
+
+import pytest
+
+from src.module_01_fondations.leak_watchdog import LeakSuspect, LeakWatchdog
+
+
+class LeakedObject:
+    """Object type accumulated by the tests."""
+
+
+class TestLeakWatchdog:
+    """Test in-process memory leak watchdog."""
+
+    def test_check_should_report_object_types_growing_on_every_sample(self):
+        """Test that a monotonically growing object type is reported."""
+        watchdog = LeakWatchdog(window=3, mode="full", min_growth_count=100)
+        leaked = []
+
+        for _ in range(3):
+            leaked.extend(LeakedObject() for _ in range(200))
+            suspects = watchdog.check()
+
+        suspect = next(s for s in suspects if s.key == "LeakedObject")
+        assert suspect.kind == "type"
+        assert suspect.growth == 400
+        assert watchdog.suspects(kind="type", min_growth=400) == [suspect]
+
+    def test_check_should_not_report_before_window_is_full(self):
+        """Test that at least `window` samples are required."""
+        watchdog = LeakWatchdog(window=3, mode="full", min_growth_count=1)
+        leaked = []
+
+        for _ in range(2):
+            leaked.extend(LeakedObject() for _ in range(200))
+            assert watchdog.check() == []
+
+    def test_check_should_not_report_stable_object_types(self):
+        """Test that growth must be monotonic to be reported."""
+        watchdog = LeakWatchdog(window=3, mode="full", min_growth_count=100)
+        leaked = []
+
+        for size in (200, 400, 300):
+            leaked[:] = [LeakedObject() for _ in range(size)]
+            watchdog.check()
+
+        assert all(s.key != "LeakedObject" for s in watchdog.suspects())
+
+    def test_check_should_report_growing_allocation_sites_when_tracing(self):
+        """Test that allocation sites are reported in full mode."""
+        watchdog = LeakWatchdog(window=3, mode="full", min_growth_bytes=10_000)
+        leaked = []
+
+        with watchdog:
+            for _ in range(3):
+                leaked.extend("x" * 1000 + str(i) for i in range(100))
+                watchdog.check()
+
+        assert not tracemalloc.is_tracing()
+        assert any(
+            __file__ in s.key for s in watchdog.suspects(kind="allocation")
+        )
+
+    def test_check_should_log_suspects(self, caplog):
+        """Test that suspects are reported as structured log records."""
+        watchdog = LeakWatchdog(window=2, mode="full", min_growth_count=100)
+        leaked = []
+
+        for _ in range(2):
+            leaked.extend(LeakedObject() for _ in range(200))
+            watchdog.check()
+
+        record = next(r for r in caplog.records if r.leak_key == "LeakedObject")
+        assert record.leak_kind == "type"
+        assert record.leak_growth == 200
+
+    def test_growth_should_be_difference_between_last_and_first_sample(self):
+        """Test the growth of a suspect."""
+        assert LeakSuspect("type", "dict", 10, 25, 3).growth == 15
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"interval": 0}, id="interval"),
+            pytest.param({"window": 1}, id="window"),
+        ],
+    )
+    def test_init_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            LeakWatchdog(**kwargs)
@@ -0,0 +1,203 @@
+import pytest
+
+from src.module_01_fondations.memory_leak_demo import (
+    BoundedRequestLogger,
+    LeakyRequestLogger,
+    MmapRequestLogger,
+    PayloadStore,
+    RequestLog,
+    calculate_log_memory_usage,
+)
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic TTL tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestBoundedRequestLogger:
+    """Test bounded request logger eviction policies."""
+
+    def test_log_should_rotate_logs_beyond_max_size(self):
+        """Test that the oldest logs are evicted when max_size is reached."""
+        logger = BoundedRequestLogger(max_size=3)
+
+        for i in range(5):
+            logger.log(i, f"/api/users/{i}", "x")
+
+        assert logger.log_count == 3
+        assert [log.request_id for log in logger._logs] == [2, 3, 4]
+
+    def test_log_should_evict_oldest_logs_beyond_max_bytes(self):
+        """Test that memory usage stays within the byte budget."""
+        record_size = calculate_log_memory_usage(RequestLog(0, "/", "x" * 100))
+        logger = BoundedRequestLogger(max_size=1000, max_bytes=record_size * 2)
+
+        for i in range(10):
+            logger.log(i, "/", "x" * 100)
+
+        assert logger.log_count == 2
+        assert logger._total_bytes <= record_size * 2
+
+    def test_log_should_evict_small_logs_to_make_room_for_a_large_one(self):
+        """Test that a large payload evicts as many small logs as required."""
+        small_size = calculate_log_memory_usage(RequestLog(0, "/", "x"))
+        large_size = calculate_log_memory_usage(RequestLog(0, "/", "x" * 1000))
+        logger = BoundedRequestLogger(max_bytes=large_size + small_size)
+
+        for i in range(5):
+            logger.log(i, "/", "x")
+        logger.log(5, "/", "x" * 1000)
+
+        assert [log.request_id for log in logger._logs] == [4, 5]
+
+    def test_log_should_drop_a_log_exceeding_max_bytes_on_its_own(self):
+        """Test that a single oversized log is not retained."""
+        logger = BoundedRequestLogger(max_bytes=100)
+
+        logger.log(1, "/", "x" * 1000)
+
+        assert logger.log_count == 0
+        assert logger._total_bytes == 0
+
+    def test_logs_older_than_max_age_should_be_evicted(self):
+        """Test that logs expire after max_age seconds."""
+        clock = FakeClock()
+        logger = BoundedRequestLogger(max_age=10, clock=clock)
+
+        logger.log(1, "/", "x")
+        clock.now = 5
+        logger.log(2, "/", "x")
+        clock.now = 12
+
+        assert logger.log_count == 1
+        clock.now = 16
+        assert logger.log_count == 0
+        assert logger._total_bytes == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"max_size": 0}, id="max_size"),
+            pytest.param({"max_bytes": 0}, id="max_bytes"),
+            pytest.param({"max_age": 0}, id="max_age"),
+        ],
+    )
+    def test_init_should_reject_invalid_limits(self, kwargs):
+        """Test that invalid eviction limits are rejected."""
+        with pytest.raises(ValueError):
+            BoundedRequestLogger(**kwargs)
+
+
+class TestPayloadStore:
+    """Test content-addressed payload deduplication."""
+
+    def test_intern_should_return_shared_instance_for_equal_payloads(self):
+        """Test that equal payloads are stored once."""
+        store = PayloadStore()
+        first = "".join(["x"] * 100)
+        second = "".join(["x"] * 100)
+
+        assert store.intern(first) is first
+        assert store.intern(second) is first
+        assert len(store) == 1
+        assert store.saved_bytes > 0
+
+    def test_release_should_drop_payload_with_its_last_reference(self):
+        """Test that payloads are reference counted."""
+        store = PayloadStore()
+        store.intern("payload")
+        store.intern("payload")
+
+        store.release("payload")
+        assert len(store) == 1
+        store.release("payload")
+        assert len(store) == 0
+        assert store._payload_bytes == 0
+
+    def test_bounded_logger_should_release_payloads_of_evicted_logs(self):
+        """Test that rotated logs release their payloads."""
+        store = PayloadStore()
+        logger = BoundedRequestLogger(max_size=2, payload_store=store)
+
+        logger.log(1, "/", "a")
+        logger.log(2, "/", "b")
+        logger.log(3, "/", "b")
+
+        assert len(store) == 1
+        assert store._payloads["b"][1] == 2
+
+    def test_deduplicated_logger_should_use_less_memory(self):
+        """Test that repetitive payloads use less memory once deduplicated."""
+        leaky_logger = LeakyRequestLogger()
+        deduplicated_logger = LeakyRequestLogger(payload_store=PayloadStore())
+
+        for i in range(100):
+            leaky_logger.log(i, "/", "x" * 1000)
+            deduplicated_logger.log(i, "/", "x" * 1000)
+
+        assert (
+            deduplicated_logger.get_memory_usage() * 5 < leaky_logger.get_memory_usage()
+        )
+
+
+class TestMmapRequestLogger:
+    """Test memory-mapped ring buffer request logger."""
+
+    def test_iter_logs_should_yield_logs_from_oldest_to_newest(self, tmp_path):
+        """Test that logged requests can be read back in order."""
+        with MmapRequestLogger(tmp_path / "requests.ring", capacity=4096) as logger:
+            logger.log(1, "/api/users/1", "payload-1")
+            logger.log(2, "/api/users/2", "payload-é")
+
+            assert list(logger.iter_logs()) == [
+                RequestLog(1, "/api/users/1", "payload-1"),
+                RequestLog(2, "/api/users/2", "payload-é"),
+            ]
+
+    def test_log_should_overwrite_oldest_logs_when_ring_is_full(self, tmp_path):
+        """Test that the ring wraps around and keeps only the newest logs."""
+        with MmapRequestLogger(tmp_path / "requests.ring", capacity=500) as logger:
+            for i in range(100):
+                logger.log(i, f"/api/users/{i}", "x" * (i % 7))
+
+            request_ids = [log.request_id for log in logger.iter_logs()]
+
+            assert logger.total_logged == 100
+            assert logger.log_count == len(request_ids)
+            assert request_ids == list(range(100 - len(request_ids), 100))
+            assert 0 < logger.get_memory_usage() <= 500
+
+    def test_ring_should_survive_reopening(self, tmp_path):
+        """Test that the recent history is restored from the ring file."""
+        path = tmp_path / "requests.ring"
+        with MmapRequestLogger(path, capacity=300) as logger:
+            for i in range(20):
+                logger.log(i, "/", "payload")
+            expected = list(logger.iter_logs())
+
+        with MmapRequestLogger(path, capacity=300) as logger:
+            assert list(logger.iter_logs()) == expected
+            logger.log(20, "/", "payload")
+            assert list(logger.iter_logs())[-1] == RequestLog(20, "/", "payload")
+
+    def test_init_should_reject_ring_with_another_capacity(self, tmp_path):
+        """Test that an existing ring cannot be reopened with another size."""
+        path = tmp_path / "requests.ring"
+        MmapRequestLogger(path, capacity=300).close()
+
+        with pytest.raises(ValueError):
+            MmapRequestLogger(path, capacity=400)
+
+    def test_log_should_reject_record_larger_than_capacity(self, tmp_path):
+        """Test that a record that cannot fit in the ring is rejected."""
+        with (
+            MmapRequestLogger(tmp_path / "requests.ring", capacity=100) as logger,
+            pytest.raises(ValueError),
+        ):
+            logger.log(1, "/", "x" * 200)
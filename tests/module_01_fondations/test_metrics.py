@@ -0,0 +1,123 @@
+import math
+
+import pytest
+
+from src.module_01_fondations.decorators_demo import timed_block, timer
+from src.module_01_fondations.metrics import Histogram, MetricsRegistry, registry
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    """Isolate tests using the process-wide registry."""
+    registry.reset()
+    registry.enabled = True
+    yield
+    registry.reset()
+    registry.enabled = True
+
+
+class TestHistogram:
+    """Test latency histogram."""
+
+    def test_observe_should_track_count_sum_min_max(self):
+        """Test basic statistics."""
+        histogram = Histogram()
+
+        for value in (0.001, 0.004, 0.002):
+            histogram.observe(value)
+
+        assert histogram.count == 3
+        assert histogram.sum == pytest.approx(0.007)
+        assert histogram.min == 0.001
+        assert histogram.max == 0.004
+
+    def test_percentile_should_return_bucket_upper_bound(self):
+        """Test that percentiles are estimated from buckets."""
+        histogram = Histogram(buckets=(0.01, 0.1, 1.0))
+
+        for _ in range(90):
+            histogram.observe(0.005)
+        for _ in range(10):
+            histogram.observe(0.5)
+
+        assert histogram.percentile(50) == 0.01
+        assert histogram.percentile(90) == 0.01
+        assert histogram.percentile(99) == 0.5
+
+    def test_percentile_should_be_nan_without_values(self):
+        """Test percentiles of an empty histogram."""
+        assert math.isnan(Histogram().percentile(50))
+
+    def test_percentile_should_reject_invalid_quantile(self):
+        """Test that percentiles must be between 0 and 100."""
+        with pytest.raises(ValueError):
+            Histogram().percentile(101)
+
+
+class TestMetricsRegistry:
+    """Test metrics registry."""
+
+    def test_histogram_should_return_same_histogram_for_same_name(self):
+        """Test that histograms are registered by name."""
+        metrics = MetricsRegistry()
+
+        assert metrics.histogram("a") is metrics.histogram("a")
+
+    def test_reset_should_clear_values_but_keep_histograms(self):
+        """Test that reset keeps histograms held by decorated functions."""
+        metrics = MetricsRegistry()
+        histogram = metrics.histogram("a")
+        histogram.observe(1.0)
+
+        metrics.reset()
+
+        assert metrics.histogram("a") is histogram
+        assert metrics.dump()["a"]["count"] == 0
+
+
+class TestTimer:
+    """Test timer decorator and timed_block context manager."""
+
+    def test_timer_should_record_calls_in_registry(self):
+        """Test that decorated calls are recorded under the qualified name."""
+
+        @timer
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        assert add(1, 2) == 3
+        assert add(2, 3) == 5
+
+        stats = registry.dump()[add.__qualname__]
+        assert stats["count"] == 2
+
+    def test_timer_should_record_failed_calls(self):
+        """Test that failing calls are recorded too."""
+
+        @timer
+        def fail() -> None:
+            raise ValueError
+
+        with pytest.raises(ValueError):
+            fail()
+
+        assert registry.dump()[fail.__qualname__]["count"] == 1
+
+    def test_timer_should_pass_through_when_registry_is_disabled(self):
+        """Test the pass-through mode."""
+
+        @timer
+        def noop() -> str:
+            return "done"
+
+        registry.enabled = False
+
+        assert noop() == "done"
+        assert registry.dump()[noop.__qualname__]["count"] == 0
+
+    def test_timed_block_should_record_block_duration(self):
+        """Test that timed_block records under its label."""
+        with timed_block("block"):
+            pass
+
+        assert registry.dump()["block"]["count"] == 1
@@ -0,0 +1,74 @@
+import random
+from collections import Counter
+
+import pytest
+
+from src.module_01_fondations.reservoir_request_logger import (
+    ReservoirRequestLogger,
+)
+
+
+class TestReservoirRequestLogger:
+    """Test reservoir sampling request logger."""
+
+    def test_log_should_keep_all_logs_until_sample_is_full(self):
+        """Test that the first requests are all kept."""
+        logger = ReservoirRequestLogger(sample_size=10)
+
+        for i in range(5):
+            logger.log(i, "/", "x")
+
+        assert logger.log_count == 5
+        assert sorted(log.request_id for log in logger.samples) == list(range(5))
+
+    def test_log_should_keep_fixed_size_sample(self):
+        """Test that the sample size never grows beyond sample_size."""
+        logger = ReservoirRequestLogger(sample_size=100, rng=random.Random(42))
+
+        for i in range(50_000):
+            logger.log(i, "/", "x")
+
+        assert logger.log_count == 100
+        assert logger.seen_count == 50_000
+        assert len({log.request_id for log in logger.samples}) == 100
+
+    def test_uniform_sample_should_represent_all_requests_ever_seen(self):
+        """Test that old requests are as likely to be sampled as recent ones."""
+        logger = ReservoirRequestLogger(sample_size=2000, rng=random.Random(42))
+
+        for i in range(100_000):
+            logger.log(i, "/", "x")
+
+        first_half = sum(log.request_id < 50_000 for log in logger.samples)
+        assert 900 < first_half < 1100
+
+    def test_weighted_sample_should_follow_path_weights(self):
+        """Test that paths are sampled proportionally to their weight."""
+        logger = ReservoirRequestLogger(
+            sample_size=1000,
+            weight=lambda path: 0.0 if path == "/health" else 1.0,
+            rng=random.Random(42),
+        )
+
+        for i in range(30_000):
+            logger.log(i, "/health" if i % 2 else "/api", "x")
+
+        assert Counter(log.path for log in logger.samples) == {"/api": 1000}
+
+    def test_weighted_sample_should_represent_all_requests_ever_seen(self):
+        """Test that weighted sampling is not biased towards recent requests."""
+        logger = ReservoirRequestLogger(
+            sample_size=2000, weight=lambda _path: 1.0, rng=random.Random(42)
+        )
+
+        for i in range(100_000):
+            logger.log(i, "/", "x")
+
+        first_half = sum(log.request_id < 50_000 for log in logger.samples)
+        assert logger.log_count == 2000
+        assert 900 < first_half < 1100
+
+    def test_init_should_reject_invalid_sample_size(self):
+        """Test that sample_size must be positive."""
+        with pytest.raises(ValueError):
+            ReservoirRequestLogger(sample_size=0)
@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+from src.module_01_fondations.shared_memory_map import (
+    pickled_map_reduce,
+    shared_memory_map_reduce,
+    square_root,
+)
+
+
+def triple(i: int) -> int:
+    """Integer workload for the tests (must be picklable)."""
+    return 3 * i
+
+
+class TestSharedMemoryMapReduce:
+    """Test shared-memory parallel map-reduce."""
+
+    def test_map_reduce_should_sum_results_of_all_chunks(self):
+        """Test that every item is computed and reduced."""
+        report = shared_memory_map_reduce(square_root, 1000, workers=2, chunk_size=64)
+
+        assert report.result == pytest.approx(sum(math.sqrt(i) for i in range(1000)))
+        assert report.chunks == 16
+        assert report.transfer_seconds >= 0
+
+    def test_map_reduce_should_support_integers_and_custom_reducers(self):
+        """Test the typecode and reducer parameters."""
+        report = shared_memory_map_reduce(
+            triple, 10, reducer=list, workers=2, typecode="q"
+        )
+
+        assert report.result == [3 * i for i in range(10)]
+
+    def test_map_reduce_should_match_pickled_baseline(self):
+        """Test that both transfer strategies compute the same result."""
+        shared = shared_memory_map_reduce(square_root, 500, workers=2)
+        pickled = pickled_map_reduce(square_root, 500, workers=2)
+
+        assert shared.result == pytest.approx(pickled.result)
+
+    def test_map_reduce_should_reject_empty_workload(self):
+        """Test that at least one item is required."""
+        with pytest.raises(ValueError):
+            shared_memory_map_reduce(square_root, 0)
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from src.module_01_fondations.decorators_demo import timed_block
+from src.module_01_fondations.tracing import Tracer, tracer
+
+
+class TestTracer:
+    """Test nested span tracing."""
+
+    def setup_method(self):
+        self.tracer = Tracer()
+
+    def test_span_should_be_child_of_enclosing_span(self):
+        """Test parent/child relationships of nested spans."""
+        with self.tracer.span("request") as request:
+            with self.tracer.span("db") as db:
+                pass
+            with self.tracer.span("render") as render:
+                pass
+
+        assert request.parent_id is None
+        assert db.parent_id == render.parent_id == request.span_id
+        assert db.trace_id == render.trace_id == request.trace_id
+        assert [s.name for s in self.tracer.spans()] == ["db", "render", "request"]
+
+    def test_spans_should_filter_by_trace(self):
+        """Test that separate root spans start separate traces."""
+        with self.tracer.span("first") as first:
+            pass
+        with self.tracer.span("second"):
+            pass
+
+        assert self.tracer.spans(trace_id=first.trace_id) == [first]
+
+    def test_span_should_not_leak_to_other_threads(self):
+        """Test that a span started in a thread is a root span."""
+        spans = []
+
+        def work() -> None:
+            with self.tracer.span("thread") as span:
+                spans.append(span)
+
+        with self.tracer.span("main"):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        assert spans[0].parent_id is None
+
+    @pytest.mark.asyncio
+    async def test_span_should_propagate_to_asyncio_tasks(self):
+        """Test that spans of child tasks are nested in the creating span."""
+
+        async def query(name: str) -> None:
+            with self.tracer.span(name):
+                await asyncio.sleep(0.01)
+
+        with self.tracer.span("request") as request:
+            await asyncio.gather(query("a"), query("b"))
+
+        children = [s for s in self.tracer.spans() if s.name in ("a", "b")]
+        assert {s.parent_id for s in children} == {request.span_id}
+        assert children[0].lane != children[1].lane
+
+    def test_tracer_should_keep_a_bounded_number_of_spans(self):
+        """Test the bounded buffer."""
+        bounded_tracer = Tracer(max_spans=2)
+
+        for name in ("a", "b", "c"):
+            with bounded_tracer.span(name):
+                pass
+
+        assert [s.name for s in bounded_tracer.spans()] == ["b", "c"]
+
+    def test_spans_should_be_readable_while_other_threads_record(self):
+        """Test reading spans while another thread appends to the buffer."""
+        stop = threading.Event()
+
+        def record() -> None:
+            while not stop.is_set():
+                with self.tracer.span("worker"):
+                    pass
+
+        thread = threading.Thread(target=record)
+        thread.start()
+        try:
+            for _ in range(1000):
+                self.tracer.spans()
+        finally:
+            stop.set()
+            thread.join()
+
+        assert self.tracer.spans()
+
+    def test_export_chrome_trace_should_write_complete_events(self, tmp_path):
+        """Test the Chrome trace-event JSON export."""
+        with (
+            self.tracer.span("request", path="/api/users") as request,
+            self.tracer.span("db"),
+        ):
+            pass
+
+        path = tmp_path / "trace.json"
+        self.tracer.export_chrome_trace(path)
+        events = json.loads(path.read_text())["traceEvents"]
+
+        db_event, request_event = events
+        assert request_event["ph"] == "X"
+        assert request_event["name"] == "request"
+        assert request_event["args"]["path"] == "/api/users"
+        assert db_event["args"]["parent_id"] == request.span_id
+        assert request_event["ts"] <= db_event["ts"]
+        assert request_event["dur"] >= db_event["dur"]
+
+
+class TestTimedBlock:
+    """Test timed_block span API."""
+
+    def setup_method(self):
+        tracer.clear()
+
+    def test_timed_block_should_record_nested_spans(self):
+        """Test that timed_block opens spans in the process-wide tracer."""
+        with timed_block("outer") as outer, timed_block("inner", size=3) as inner:
+            pass
+
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"size": 3}
+        assert [s.name for s in tracer.spans()] == ["inner", "outer"]
@@ -0,0 +1,105 @@
+import pytest
+
+from src.module_01_fondations.gil_demo import sum_of_squares
+from src.module_01_fondations.workload_scheduler import (
+    WorkloadScheduler,
+    sleep_task,
+)
+
+
+def failing_task() -> None:
+    raise ValueError("boom")
+
+
+@pytest.fixture
+def scheduler():
+    with WorkloadScheduler(thread_workers=4, process_workers=1) as scheduler:
+        yield scheduler
+
+
+class TestWorkloadScheduler:
+    """Test scheduler routing tasks by observed workload."""
+
+    def test_classify_should_return_default_kind_for_unknown_task_type(
+            self, scheduler
+    ):
+        """Test that unseen task types get the default kind."""
+        assert scheduler.classify("unknown") == "io"
+
+    def test_submit_should_learn_cpu_bound_task_type(self, scheduler):
+        """Test that a task busy on CPU is classified as cpu."""
+        assert scheduler.submit(sum_of_squares, 2_000_000).result() > 0
+
+        assert scheduler.classify(sum_of_squares.__qualname__) == "cpu"
+
+    def test_submit_should_learn_io_bound_task_type(self, scheduler):
+        """Test that a task mostly waiting is classified as io."""
+        assert scheduler.submit(sleep_task, 0.05).result() == 0.05
+
+        stats = scheduler.stats()[sleep_task.__qualname__]
+        assert stats["kind"] == "io"
+        assert stats["samples"] == 1
+
+    def test_submit_should_learn_cpu_bound_task_type_from_a_burst(self, scheduler):
+        """Test that concurrent CPU-bound tasks of an unseen type learn cpu."""
+        futures = [
+            scheduler.submit(sum_of_squares, 1_000_000, task_type="burst")
+            for _ in range(8)
+        ]
+
+        assert all(future.result() > 0 for future in futures)
+        assert scheduler.classify("burst") == "cpu"
+
+    def test_submit_should_run_unpicklable_task_type_as_default_kind(
+            self, scheduler
+    ):
+        """Test that a task type that cannot be probed still runs and learns."""
+        future = scheduler.submit(lambda: sleep_task(0.05), task_type="local")
+
+        assert future.result() == 0.05
+        stats = scheduler.stats()["local"]
+        assert stats["kind"] == "io"
+        assert stats["samples"] == 1
+
+    def test_submit_should_keep_unpicklable_cpu_bound_task_type_on_threads(
+            self, scheduler
+    ):
+        """Test that a task type learned as cpu but unpicklable stays runnable."""
+        for _ in range(2):
+            future = scheduler.submit(
+                lambda: sum_of_squares(2_000_000), task_type="local"
+            )
+            assert future.result() > 0
+
+        stats = scheduler.stats()["local"]
+        assert stats["kind"] == "cpu"
+        assert stats["samples"] == 2
+
+    def test_submit_should_honor_explicit_kind_and_task_type(self, scheduler):
+        """Test that an explicit kind routes the task and is still measured."""
+        result = scheduler.submit(
+            sum_of_squares, 10, kind="cpu", task_type="small_sum"
+        ).result()
+
+        assert result == 285
+        assert scheduler.stats()["small_sum"]["samples"] == 1
+
+    def test_submit_should_propagate_task_exception(self, scheduler):
+        """Test that a failing task fails its future without learning."""
+        with pytest.raises(ValueError, match="boom"):
+            scheduler.submit(failing_task).result()
+
+        assert scheduler.stats() == {}
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"cpu_ratio_threshold": 0}, id="threshold_zero"),
+            pytest.param({"cpu_ratio_threshold": 1}, id="threshold_one"),
+            pytest.param({"smoothing": 0}, id="smoothing_zero"),
+        ],
+    )
+    def test_init_should_reject_invalid_settings(self, kwargs):
+        """Test that out-of-range settings raise ValueError."""
+        with pytest.raises(ValueError):
+            WorkloadScheduler(**kwargs)
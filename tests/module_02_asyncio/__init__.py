@@ -0,0 +1 @@
+# Module 02 tests
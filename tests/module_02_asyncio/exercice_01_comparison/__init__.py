@@ -0,0 +1 @@
+# Exercise 01: sync vs async tests
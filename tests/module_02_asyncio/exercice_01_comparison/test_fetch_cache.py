@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+
+from src.module_02_asyncio.exercice_01_comparison.fetch_cache import (
+    CachedFetch,
+    response_ttl,
+)
+from src.module_02_asyncio.exercice_01_comparison.http_fetcher import HttpFetcher
+from src.module_02_asyncio.exercice_01_comparison.local_server import LocalHttpServer
+
+
+def make_fetch(delay=0.01, error=None):
+    """Return a fake fetch and the list of URLs it actually fetched."""
+    calls = []
+
+    async def fetch(url):
+        calls.append(url)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return {"url": url, "status": 200}
+
+    return fetch, calls
+
+
+class TestResponseTtl:
+    """Test freshness lifetime of fetch results."""
+
+    @pytest.mark.parametrize(
+        ("response", "ttl"),
+        [
+            pytest.param({"status": 200}, 60, id="no_headers"),
+            pytest.param({"status": 500}, 0, id="error_status"),
+            pytest.param(
+                {"status": 200, "headers": {"Cache-Control": "public, max-age=10"}},
+                10,
+                id="max_age",
+            ),
+            pytest.param(
+                {"status": 200, "headers": {"cache-control": "max-age=10", "age": "4"}},
+                6,
+                id="max_age_minus_age",
+            ),
+            pytest.param(
+                {"status": 200, "headers": {"cache-control": "no-store"}},
+                0,
+                id="no_store",
+            ),
+            pytest.param(
+                {"status": 200, "headers": {"cache-control": "no-cache"}},
+                0,
+                id="no_cache",
+            ),
+            pytest.param(
+                {
+                    "status": 200,
+                    "headers": {
+                        "date": "Mon, 19 Oct 2026 10:00:00 GMT",
+                        "expires": "Mon, 19 Oct 2026 10:00:30 GMT",
+                    },
+                },
+                30,
+                id="expires",
+            ),
+            pytest.param(
+                {"status": 200, "headers": {"expires": "0"}}, 0, id="invalid_expires"
+            ),
+        ],
+    )
+    def test_response_ttl_should_honor_cache_headers(self, response, ttl):
+        """Test Cache-Control, Age and Expires handling."""
+        assert response_ttl(response, default=60) == ttl
+
+
+class TestCachedFetch:
+    """Test coalescing response cache."""
+
+    async def test_call_should_coalesce_concurrent_fetches(self):
+        """Test that concurrent fetches of a URL trigger one fetch."""
+        fetch, calls = make_fetch()
+        cached = CachedFetch(fetch)
+
+        results = await asyncio.gather(*(cached("a") for _ in range(5)))
+
+        assert calls == ["a"]
+        assert all(result["url"] == "a" for result in results)
+        info = cached.cache_info()
+        assert (info.misses, info.coalesced, info.hits) == (1, 4, 0)
+
+    async def test_call_should_serve_cached_result_until_ttl(self):
+        """Test hits within the TTL and a new fetch after it."""
+        fetch, calls = make_fetch(delay=0)
+        cached = CachedFetch(fetch, ttl=0.05)
+
+        await cached("a")
+        await cached("a")
+        await asyncio.sleep(0.06)
+        await cached("a")
+
+        assert calls == ["a", "a"]
+        assert cached.cache_info().hits == 1
+
+    async def test_call_should_evict_least_recently_used(self):
+        """Test LRU eviction beyond max_size."""
+        fetch, calls = make_fetch(delay=0)
+        cached = CachedFetch(fetch, max_size=2)
+
+        for url in ["a", "b", "a", "c", "a", "b"]:
+            await cached(url)
+
+        assert calls == ["a", "b", "c", "b"]
+        assert cached.cache_info().evictions == 2
+
+    async def test_call_should_propagate_errors_without_caching(self):
+        """Test that every waiter gets the error and it is not cached."""
+        fetch, calls = make_fetch(error=ConnectionError("down"))
+        cached = CachedFetch(fetch)
+
+        results = await asyncio.gather(
+            cached("a"), cached("a"), return_exceptions=True
+        )
+        with pytest.raises(ConnectionError):
+            await cached("a")
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert calls == ["a", "a"]
+
+    @pytest.mark.parametrize(
+        ("cache_control", "requests"),
+        [
+            pytest.param("max-age=60", 1, id="cacheable"),
+            pytest.param("no-store", 3, id="no_store"),
+        ],
+    )
+    async def test_call_should_honor_cache_control_over_http(
+            self, cache_control, requests
+    ):
+        """Test that real HTTP responses are cached as their headers allow."""
+        with LocalHttpServer(headers={"Cache-Control": cache_control}) as server:
+            async with HttpFetcher() as fetcher:
+                cached = CachedFetch(fetcher.fetch)
+                for _ in range(3):
+                    await cached(server.url)
+
+        assert server.requests == requests
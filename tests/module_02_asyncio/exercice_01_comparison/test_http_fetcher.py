@@ -0,0 +1,75 @@
+import httpx
+import pytest
+
+from src.module_02_asyncio.exercice_01_comparison.http_fetcher import (
+    HttpFetcher,
+    PoolSettings,
+)
+from src.module_02_asyncio.exercice_01_comparison.local_server import LocalHttpServer
+from src.module_02_asyncio.exercice_01_comparison.sync_vs_async import (
+    fetch_all_async,
+)
+
+
+@pytest.fixture
+def server():
+    with LocalHttpServer(body=b"hello", headers={"X-Test": "1"}) as server:
+        yield server
+
+
+class TestHttpFetcher:
+    """Test pooled HTTP fetcher against a local server."""
+
+    async def test_fetch_should_return_status_headers_and_body(self, server):
+        """Test that a real GET returns the simulate_fetch_async shape."""
+        async with HttpFetcher() as fetcher:
+            result = await fetcher.fetch(f"{server.url}/users")
+
+        assert result["url"] == f"{server.url}/users"
+        assert result["status"] == 200
+        assert result["headers"]["x-test"] == "1"
+        assert result["body"] == "hello"
+
+    @pytest.mark.parametrize(
+        ("keepalive", "connections"),
+        [
+            pytest.param(1, 1, id="pooled"),
+            pytest.param(0, 5, id="new_connection_per_request"),
+        ],
+    )
+    async def test_fetch_should_reuse_connections_when_kept_alive(
+            self, server, keepalive, connections
+    ):
+        """Test that keep-alive reuses one connection for sequential requests."""
+        settings = PoolSettings(max_keepalive_connections=keepalive)
+        async with HttpFetcher(default=settings) as fetcher:
+            for _ in range(5):
+                await fetcher.fetch(server.url)
+
+        assert server.requests == 5
+        assert server.connections == connections
+
+    async def test_fetch_should_use_per_host_pool_settings(self, server):
+        """Test that a host listed in per_host gets its own pool settings."""
+        per_host = {"127.0.0.1": PoolSettings(max_keepalive_connections=0)}
+        async with HttpFetcher(per_host=per_host) as fetcher:
+            for _ in range(3):
+                await fetcher.fetch(server.url)
+
+        assert server.connections == 3
+
+    async def test_fetch_should_honor_per_request_timeout(self):
+        """Test that a request slower than its timeout fails."""
+        with LocalHttpServer(delay=0.5) as slow_server:
+            async with HttpFetcher(timeout=5.0) as fetcher:
+                with pytest.raises(httpx.TimeoutException):
+                    await fetcher.fetch(slow_server.url, timeout=0.05)
+
+    async def test_fetch_all_async_should_accept_http_fetch(self, server):
+        """Test that fetch_all_async runs over the real fetch backend."""
+        urls = [f"{server.url}/item/{i}" for i in range(10)]
+        async with HttpFetcher(default=PoolSettings(max_connections=2)) as fetcher:
+            results = await fetch_all_async(urls, fetch=fetcher.fetch)
+
+        assert [result["url"] for result in results] == urls
+        assert server.connections <= 2
@@ -0,0 +1 @@
+# Exercise 02: semaphore tests
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from src.module_02_asyncio.exercice_02_semaphore.adaptive_limiter import (
+    AdaptiveLimiter,
+    OverloadableUpstream,
+)
+from src.module_02_asyncio.exercice_02_semaphore.rate_limiter import (
+    fetch_with_limit,
+)
+from src.module_02_asyncio.exercice_02_semaphore.token_bucket import (
+    HostRateLimiter,
+    RateLimit,
+)
+
+
+async def limited(limiter, fetch, url):
+    """Fetch url holding a limiter slot."""
+    async with limiter:
+        return await fetch(url)
+
+
+class TestAdaptiveLimiter:
+    """Test AIMD adaptive concurrency limiter."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"initial_limit": 0, "min_limit": 0}, id="zero_limit"),
+            pytest.param({"initial_limit": 5, "max_limit": 4}, id="above_max"),
+            pytest.param({"backoff": 1}, id="no_backoff"),
+            pytest.param({"latency_tolerance": 0.5}, id="low_tolerance"),
+        ],
+    )
+    def test_init_should_reject_invalid_settings(self, kwargs):
+        """Test that inconsistent settings raise ValueError."""
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(**kwargs)
+
+    def test_release_should_increase_limit_while_latency_is_flat(self):
+        """Test additive increase of about 1 per round of requests."""
+        limiter = AdaptiveLimiter(initial_limit=2)
+        for _ in range(10):
+            limiter._in_flight = limiter.limit
+            limiter.release(latency=0.1)
+
+        assert limiter.limit > 2
+        assert limiter.metrics()["increases"] >= 1
+
+    def test_release_should_not_increase_limit_when_unused(self):
+        """Test that the limit only grows while it is reached."""
+        limiter = AdaptiveLimiter(initial_limit=10)
+        for _ in range(20):
+            limiter._in_flight = 1
+            limiter.release(latency=0.1)
+
+        assert limiter.limit == 10
+
+    @pytest.mark.parametrize(
+        ("latency", "failed"),
+        [
+            pytest.param(0.5, False, id="latency_rise"),
+            pytest.param(0.1, True, id="error"),
+        ],
+    )
+    def test_release_should_back_off_once_per_round(self, latency, failed):
+        """Test multiplicative decrease, not repeated by older requests."""
+        limiter = AdaptiveLimiter(initial_limit=10, backoff=0.5)
+        limiter._in_flight = 3
+        limiter.release(latency=0.1)
+        limiter.release(latency=latency, failed=failed)
+        limiter.release(latency=latency, failed=failed)
+
+        assert limiter.limit == 5
+        assert limiter.metrics()["decreases"] == 1
+
+    async def test_limiter_should_cap_concurrency_like_a_semaphore(self):
+        """Test drop-in use in fetch_with_limit."""
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=2)
+        upstream = OverloadableUpstream(capacity=100, latency=0.01)
+        max_in_flight = 0
+
+        async def fetch(url):
+            nonlocal max_in_flight
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            return await upstream.fetch(url)
+
+        async with asyncio.TaskGroup() as group:
+            for i in range(10):
+                group.create_task(limited(limiter, fetch, f"url-{i}"))
+
+        assert max_in_flight == 2
+        assert limiter.in_flight == 0
+
+    async def test_limiter_should_converge_near_upstream_capacity(self):
+        """Test that the limit settles around what the upstream sustains."""
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=100)
+        upstream = OverloadableUpstream(capacity=8, latency=0.01)
+
+        await asyncio.gather(
+            *(limited(limiter, upstream.fetch, f"url-{i}") for i in range(400))
+        )
+
+        assert 4 <= limiter.limit <= 24
+
+    async def test_fetch_with_limit_should_accept_limiter(self):
+        """Test that fetch_with_limit uses the given limiter."""
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1)
+
+        results = await fetch_with_limit(["a", "b"], limiter=limiter)
+
+        assert [result["url"] for result in results] == ["a", "b"]
+        assert limiter.metrics()["min_latency"] >= 0.3
+
+    async def test_limiter_should_time_nested_limiters_separately(self):
+        """Test that each limiter measures the latency of its own block."""
+        outer, inner = AdaptiveLimiter(), AdaptiveLimiter()
+
+        async with outer:
+            await asyncio.sleep(0.05)
+            async with inner:
+                await asyncio.sleep(0.01)
+
+        assert outer.metrics()["min_latency"] >= 0.06
+        assert inner.metrics()["min_latency"] < 0.05
+
+    async def test_fetch_with_limit_should_not_time_rate_limiting(self):
+        """Test that waiting for rate tokens is not taken for latency."""
+        limiter = AdaptiveLimiter(initial_limit=5, max_limit=5)
+        upstream = OverloadableUpstream(capacity=5, latency=0.01)
+
+        await fetch_with_limit(
+            [f"https://api.test/{i}" for i in range(5)],
+            rate_limiter=HostRateLimiter(RateLimit(rate=20)),
+            limiter=limiter,
+            fetch=upstream.fetch,
+        )
+
+        assert limiter.metrics()["decreases"] == 0
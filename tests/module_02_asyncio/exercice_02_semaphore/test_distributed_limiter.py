@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+import pytest
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.module_02_asyncio.exercice_02_semaphore.distributed_limiter import (
+    DistributedRateLimiter,
+    InMemoryTokenBucketStore,
+    RedisTokenBucketStore,
+)
+from src.module_02_asyncio.exercice_02_semaphore.token_bucket import RateLimit
+
+
+@pytest.fixture
+async def redis_store():
+    """Store on a local Redis (docker compose up redis), skipped if unreachable."""
+    client = aioredis.Redis.from_url("redis://localhost:6379/15")
+    try:
+        await client.ping()
+    except RedisConnectionError:
+        await client.aclose()
+        pytest.skip("Redis is not reachable on localhost:6379")
+    await client.flushdb()
+    yield RedisTokenBucketStore(client)
+    await client.flushdb()
+    await client.aclose()
+
+
+@pytest.fixture(params=["in_memory", "fakeredis"])
+async def store(request):
+    """In-process store, or the Lua script run by an in-process Redis fake."""
+    if request.param == "in_memory":
+        yield InMemoryTokenBucketStore()
+        return
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+    yield RedisTokenBucketStore(client)
+    await client.aclose()
+
+
+class TestTokenBucketStore:
+    """Test token bucket stores, in memory and through the Lua script."""
+
+    async def test_take_should_grant_burst_then_wait(self, store):
+        """Test atomic burst grants, then the wait for requested tokens."""
+        limit = RateLimit(rate=10, burst=5)
+
+        assert await store.take("k", limit, 3) == (3, 0.0)
+        assert await store.take("k", limit, 3) == (2, 0.0)
+        granted, wait = await store.take("k", limit, 3)
+
+        assert granted == 0
+        assert wait == pytest.approx(0.3, abs=0.02)
+
+    async def test_take_should_keep_buckets_per_key(self, store):
+        """Test that keys have independent buckets."""
+        limit = RateLimit(rate=1, burst=1)
+
+        assert (await store.take("a", limit, 1))[0] == 1
+        assert (await store.take("b", limit, 1))[0] == 1
+        assert (await store.take("a", limit, 1))[0] == 0
+
+
+class TestInMemoryTokenBucketStore:
+    """Test in-process token bucket store."""
+
+    async def test_take_should_grant_burst_then_refill_at_rate(self):
+        """Test burst grants, then the wait until requested tokens refill."""
+        now = [0.0]
+        store = InMemoryTokenBucketStore(clock=lambda: now[0])
+        limit = RateLimit(rate=10, burst=5)
+
+        assert await store.take("k", limit, 3) == (3, 0.0)
+        assert await store.take("k", limit, 3) == (2, 0.0)
+        granted, wait = await store.take("k", limit, 3)
+        assert granted == 0
+        assert wait == pytest.approx(0.3)
+
+        now[0] = 0.3
+        assert (await store.take("k", limit, 3))[0] == 3
+
+
+class TestDistributedRateLimiter:
+    """Test shared rate limiting with local token prefetching."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"prefetch": 0}, id="zero_prefetch"),
+            pytest.param({"max_local_age": 0}, id="zero_max_local_age"),
+        ],
+    )
+    def test_init_should_reject_invalid_settings(self, kwargs):
+        """Test that prefetch < 1 or max_local_age <= 0 raises ValueError."""
+        with pytest.raises(ValueError):
+            DistributedRateLimiter(InMemoryTokenBucketStore(), RateLimit(1), **kwargs)
+
+    async def test_acquire_should_spend_prefetched_tokens_locally(self, store):
+        """Test that prefetching divides round trips to the store."""
+        limiter = DistributedRateLimiter(
+            store, RateLimit(rate=1000, burst=10), prefetch=10
+        )
+        for _ in range(10):
+            await limiter.acquire("https://api.test/items")
+
+        assert limiter.round_trips == 1
+
+    async def test_acquire_should_share_rate_between_workers(self, store):
+        """Test that limiters on one store respect a single global rate."""
+        limit = RateLimit(rate=50, burst=5)
+        workers = [DistributedRateLimiter(store, limit, prefetch=5) for _ in range(3)]
+        count = 0
+
+        async def consume(limiter):
+            nonlocal count
+            while True:
+                await limiter.acquire("https://api.test/items")
+                count += 1
+
+        tasks = [asyncio.create_task(consume(limiter)) for limiter in workers]
+        await asyncio.sleep(0.2)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert count <= 5 + 50 * 0.2 + 1
+
+    async def test_acquire_should_drop_stale_prefetched_tokens(self, store):
+        """Test that tokens older than max_local_age go back to the store."""
+        limiter = DistributedRateLimiter(
+            store,
+            RateLimit(rate=1000, burst=10),
+            prefetch=10,
+            max_local_age=0.01,
+        )
+        await limiter.acquire("https://api.test/items")
+        await asyncio.sleep(0.02)
+        await limiter.acquire("https://api.test/items")
+
+        assert limiter.round_trips == 2
+
+    async def test_acquire_should_spend_fresh_grant_whatever_max_local_age(
+            self, store
+    ):
+        """Test that a grant is used even if older than max_local_age on arrival."""
+        limiter = DistributedRateLimiter(
+            store, RateLimit(rate=1000, burst=10), prefetch=1, max_local_age=1e-9
+        )
+
+        async with asyncio.timeout(1):
+            for _ in range(3):
+                await limiter.acquire("https://api.test/items")
+
+        assert limiter.round_trips == 3
+
+
+class TestRedisTokenBucketStore:
+    """Test the Lua token bucket against a real Redis."""
+
+    async def test_take_should_grant_burst_then_wait(self, redis_store):
+        """Test atomic burst grants, then the wait for requested tokens."""
+        limit = RateLimit(rate=10, burst=5)
+
+        assert (await redis_store.take("k", limit, 5))[0] == 5
+        granted, wait = await redis_store.take("k", limit, 2)
+
+        assert granted == 0
+        assert 0 < wait <= 0.2
+
+    async def test_limiters_should_share_rate_through_redis(self, redis_store):
+        """Test a global rate across limiters sharing Redis."""
+        limit = RateLimit(rate=50, burst=5)
+        workers = [
+            DistributedRateLimiter(redis_store, limit, prefetch=5) for _ in range(3)
+        ]
+        start = time.perf_counter()
+
+        await asyncio.gather(
+            *(workers[i % 3].acquire("https://api.test/items") for i in range(15))
+        )
+
+        assert time.perf_counter() - start >= (15 - 5) / 50 * 0.9
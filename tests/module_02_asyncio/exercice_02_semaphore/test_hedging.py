@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from src.module_02_asyncio.exercice_02_semaphore.hedging import (
+    HedgedFetch,
+    remaining_time,
+    within_deadline,
+)
+
+
+def make_fetch(*delays, error=None):
+    """Return a fake fetch whose n-th attempt sleeps delays[n], and its calls."""
+    calls = []
+
+    async def fetch(url):
+        attempt = len(calls)
+        calls.append({"url": url, "remaining": remaining_time(), "done": False})
+        if error is not None and attempt == 0:
+            raise error
+        await asyncio.sleep(delays[attempt])
+        calls[attempt]["done"] = True
+        return {"url": url, "attempt": attempt}
+
+    return fetch, calls
+
+
+class TestHedgedFetch:
+    """Test hedged requests with deadline propagation."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"percentile": 100}, id="percentile"),
+            pytest.param({"max_attempts": 0}, id="max_attempts"),
+        ],
+    )
+    def test_init_should_reject_invalid_settings(self, kwargs):
+        """Test that invalid settings raise ValueError."""
+        with pytest.raises(ValueError):
+            HedgedFetch(make_fetch()[0], **kwargs)
+
+    async def test_call_should_not_hedge_fast_requests(self):
+        """Test that an attempt faster than the hedge delay runs alone."""
+        fetch, calls = make_fetch(0.01)
+        hedged = HedgedFetch(fetch, initial_delay=0.1)
+
+        result = await hedged("a")
+
+        assert result["attempt"] == 0
+        assert len(calls) == 1
+
+    async def test_call_should_hedge_slow_request_and_cancel_loser(self):
+        """Test that a backup attempt wins over a slow one, which is cancelled."""
+        fetch, calls = make_fetch(1.0, 0.01)
+        hedged = HedgedFetch(fetch, initial_delay=0.02)
+
+        result = await asyncio.wait_for(hedged("a"), timeout=0.5)
+
+        assert result["attempt"] == 1
+        assert not calls[0]["done"]
+        assert hedged.stats()["hedge_wins"] == 1
+
+    async def test_call_should_retry_failed_attempt_immediately(self):
+        """Test that a failed attempt starts the backup without waiting."""
+        fetch, calls = make_fetch(0, 0.01, error=ConnectionError("reset"))
+        hedged = HedgedFetch(fetch, initial_delay=10)
+
+        result = await asyncio.wait_for(hedged("a"), timeout=0.5)
+
+        assert result["attempt"] == 1
+
+    async def test_call_should_raise_last_error_when_all_attempts_fail(self):
+        """Test that the error is raised once no attempt is left."""
+        fetch, _ = make_fetch(error=ConnectionError("reset"))
+        hedged = HedgedFetch(fetch, max_attempts=1)
+
+        with pytest.raises(ConnectionError):
+            await hedged("a")
+
+    async def test_call_should_propagate_deadline_to_every_attempt(self):
+        """Test that attempts see and are cancelled at the total deadline."""
+        fetch, calls = make_fetch(1.0, 1.0)
+        hedged = HedgedFetch(fetch, initial_delay=0.02, timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            await hedged("a")
+
+        assert len(calls) == 2
+        assert all(0 < call["remaining"] <= 0.1 for call in calls)
+        assert not any(call["done"] for call in calls)
+
+    async def test_call_should_keep_the_sooner_enclosing_deadline(self):
+        """Test that a nested call cannot extend its caller's deadline."""
+        inner = HedgedFetch(make_fetch(0)[0], timeout=10)
+
+        async def outer_fetch(url):
+            await inner(url)
+            return {"remaining": remaining_time()}
+
+        result = await HedgedFetch(outer_fetch, timeout=0.5)("a")
+
+        assert result["remaining"] <= 0.5
+
+    async def test_within_deadline_should_shrink_attempt_timeouts(self):
+        """Test that each attempt's HTTP timeout is the remaining budget."""
+        timeouts = []
+
+        async def fetch(url, timeout=None):
+            timeouts.append(timeout)
+            await asyncio.sleep(1.0 if len(timeouts) == 1 else 0)
+            return {"url": url}
+
+        hedged = HedgedFetch(within_deadline(fetch), initial_delay=0.05, timeout=0.5)
+
+        assert await hedged("a") == {"url": "a"}
+        first, hedge = timeouts
+        assert 0.45 < first <= 0.5
+        assert hedge == pytest.approx(first - 0.05, abs=0.03)
+
+    async def test_within_deadline_should_keep_default_timeout_without_deadline(
+            self
+    ):
+        """Test that no deadline leaves the fetch's own default timeout."""
+        timeouts = []
+
+        async def fetch(url, timeout=None):
+            timeouts.append(timeout)
+            return {"url": url}
+
+        await within_deadline(fetch)("a")
+
+        assert timeouts == [None]
+
+    async def test_hedge_delay_should_follow_latency_percentile(self):
+        """Test that the hedge delay becomes the percentile of latencies."""
+        fetch, _ = make_fetch(*[0.001] * 18 + [0.05] * 2)
+        hedged = HedgedFetch(fetch, percentile=50, min_samples=20, initial_delay=1)
+        for _ in range(20):
+            await hedged("a")
+
+        assert hedged.hedge_delay < 0.05
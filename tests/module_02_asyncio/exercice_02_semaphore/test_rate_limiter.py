@@ -0,0 +1,134 @@
+import asyncio
+import itertools
+
+import pytest
+
+from src.module_02_asyncio.exercice_02_semaphore.adaptive_limiter import (
+    AdaptiveLimiter,
+)
+from src.module_02_asyncio.exercice_02_semaphore.rate_limiter import (
+    fetch_with_limit,
+    stream_with_limit,
+)
+from src.module_02_asyncio.exercice_02_semaphore.token_bucket import (
+    HostRateLimiter,
+    RateLimit,
+)
+
+
+def make_fetch(delays=None):
+    """Return a fake fetch sleeping delays[url] and its in-flight tracker."""
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def fetch(url):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        try:
+            await asyncio.sleep((delays or {}).get(url, 0.01))
+        finally:
+            state["in_flight"] -= 1
+        return {"url": url, "status": 200}
+
+    return fetch, state
+
+
+class TestFetchWithLimit:
+    """Test fetch_with_limit combining concurrency and rate limits."""
+
+    @pytest.mark.parametrize(
+        "limiter",
+        [
+            pytest.param(None, id="semaphore"),
+            pytest.param(AdaptiveLimiter(initial_limit=1, max_limit=1), id="adaptive"),
+        ],
+    )
+    async def test_fetch_should_respect_rate_while_waiting_for_slots(self, limiter):
+        """Test that requests queued behind a slow one still start at the rate."""
+        starts = []
+        loop = asyncio.get_running_loop()
+
+        async def fetch(url):
+            starts.append(loop.time())
+            await asyncio.sleep(0.3 if url.endswith("/slow") else 0)
+            return {"url": url, "status": 200}
+
+        await fetch_with_limit(
+            [f"https://api.test/{path}" for path in ("slow", 1, 2, 3, 4, 5)],
+            max_concurrent=1,
+            rate_limiter=HostRateLimiter(RateLimit(rate=20, burst=1)),
+            limiter=limiter,
+            fetch=fetch,
+        )
+
+        gaps = [later - earlier for earlier, later in itertools.pairwise(starts)]
+        assert min(gaps[1:]) >= 1 / 20 * 0.8
+
+
+class TestStreamWithLimit:
+    """Test streaming bounded worker pool."""
+
+    async def test_stream_should_fetch_every_url_with_bounded_concurrency(self):
+        """Test that all results are yielded, max_concurrent at a time."""
+        fetch, state = make_fetch()
+        urls = [f"url-{i}" for i in range(20)]
+
+        results = [r async for r in stream_with_limit(urls, 3, fetch=fetch)]
+
+        assert sorted(r["url"] for r in results) == sorted(urls)
+        assert state["max_in_flight"] == 3
+
+    @pytest.mark.parametrize(
+        ("ordered", "expected"),
+        [
+            pytest.param(False, ["b", "c", "a"], id="completion_order"),
+            pytest.param(True, ["a", "b", "c"], id="input_order"),
+        ],
+    )
+    async def test_stream_should_yield_in_requested_order(self, ordered, expected):
+        """Test completion order by default and input order when ordered."""
+        fetch, _ = make_fetch({"a": 0.1, "b": 0.01, "c": 0.05})
+
+        results = [
+            r["url"]
+            async for r in stream_with_limit(["a", "b", "c"], 3, ordered, fetch)
+        ]
+
+        assert results == expected
+
+    async def test_stream_should_pull_urls_lazily(self):
+        """Test that an infinite iterable is consumed O(max_concurrent) ahead."""
+        fetch, _ = make_fetch()
+        pulled = 0
+
+        async def urls():
+            nonlocal pulled
+            for i in itertools.count():
+                pulled += 1
+                yield f"url-{i}"
+
+        stream = stream_with_limit(urls(), max_concurrent=2, fetch=fetch)
+        received = [await anext(stream) for _ in range(10)]
+        await stream.aclose()
+
+        assert len(received) == 10
+        assert pulled <= 10 + 2 * 2 + 1
+
+    async def test_stream_should_raise_first_error_and_cancel_workers(self):
+        """Test that a fetch error is raised and pending fetches cancelled."""
+        fetch, state = make_fetch({"slow": 10})
+
+        async def failing_fetch(url):
+            if url == "bad":
+                raise ConnectionError(url)
+            return await fetch(url)
+
+        with pytest.raises(ConnectionError, match="bad"):
+            async for _ in stream_with_limit(["slow", "bad"], 2, fetch=failing_fetch):
+                pass
+
+        assert state["in_flight"] == 0
+
+    async def test_stream_should_reject_invalid_concurrency(self):
+        """Test that max_concurrent < 1 raises ValueError."""
+        with pytest.raises(ValueError):
+            await anext(stream_with_limit(["a"], max_concurrent=0))
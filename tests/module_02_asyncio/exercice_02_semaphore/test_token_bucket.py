@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+import pytest
+
+from src.module_02_asyncio.exercice_02_semaphore.token_bucket import (
+    HostRateLimiter,
+    RateLimit,
+    TokenBucket,
+)
+
+
+class TestTokenBucket:
+    """Test async token bucket."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"rate": 0}, id="zero_rate"),
+            pytest.param({"rate": 1, "burst": 0}, id="zero_burst"),
+        ],
+    )
+    def test_rate_limit_should_reject_invalid_settings(self, kwargs):
+        """Test that non-positive rate or burst raises ValueError."""
+        with pytest.raises(ValueError):
+            RateLimit(**kwargs)
+
+    async def test_acquire_should_allow_burst_then_rate(self):
+        """Test that burst tokens are immediate and the rest paced by rate."""
+        bucket = TokenBucket(RateLimit(rate=50, burst=3))
+        start = time.perf_counter()
+        times = []
+        for _ in range(6):
+            await bucket.acquire()
+            times.append(time.perf_counter() - start)
+
+        assert times[2] < 0.01
+        assert times[5] == pytest.approx(3 / 50, abs=0.02)
+
+    async def test_acquire_should_wake_waiters_in_fifo_order(self):
+        """Test that waiters get tokens in arrival order."""
+        bucket = TokenBucket(RateLimit(rate=100, burst=1))
+        order = []
+
+        async def waiter(i):
+            await bucket.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(waiter(i) for i in range(5)))
+
+        assert order == list(range(5))
+
+    async def test_try_acquire_should_not_jump_the_queue(self):
+        """Test that try_acquire fails while callers are waiting."""
+        bucket = TokenBucket(RateLimit(rate=10, burst=1))
+        await bucket.acquire()
+        task = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+
+        assert bucket.waiting == 1
+        assert not bucket.try_acquire()
+        await task
+
+    async def test_try_acquire_should_ignore_cancelled_waiters(self):
+        """Test that waiters cancelled before their token do not block it."""
+        bucket = TokenBucket(RateLimit(rate=20, burst=1))
+        await bucket.acquire()
+        task = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(1 / 20)
+
+        assert bucket.try_acquire()
+
+    async def test_acquire_should_skip_cancelled_waiters(self):
+        """Test that a cancelled waiter does not consume a token."""
+        bucket = TokenBucket(RateLimit(rate=20, burst=1))
+        await bucket.acquire()
+        cancelled = asyncio.create_task(bucket.acquire())
+        waiting = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        start = time.perf_counter()
+        await waiting
+
+        assert time.perf_counter() - start == pytest.approx(1 / 20, abs=0.02)
+
+
+class TestHostRateLimiter:
+    """Test per-host token buckets."""
+
+    async def test_acquire_should_limit_each_host_separately(self):
+        """Test that hosts have independent buckets and per-host limits."""
+        limiter = HostRateLimiter(
+            RateLimit(rate=1, burst=1), per_host={"fast.test": RateLimit(1, burst=5)}
+        )
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                limiter.acquire("https://a.test/1"),
+                limiter.acquire("https://b.test/1"),
+                *(limiter.acquire(f"https://fast.test/{i}") for i in range(5)),
+            ),
+            timeout=0.1,
+        )
+
+        assert limiter.bucket("a.test") is not limiter.bucket("b.test")
+        assert not limiter.bucket("a.test").try_acquire()